@@ -4,25 +4,82 @@
 """
 
 import argparse
+import atexit
+import json
+import logging
+import queue
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import (
-    BOT_TOKEN,
-    CHAT_ID,
-    DEBUG,
-    DRY_RUN,
-    EDITORIAL_MODE,
-    POLL_SECONDS,
-    SCORE_THRESHOLD,
-    TOPIC_MAP,
-)
-from editorial import classify_bucket, detect_region, is_fresh, is_relevant, score_item
+from config import get_config, resolve_topic
+from editorial import evaluate
 from formatter import format_message
-from router import get_topic, get_topic_key
-from rss_collector import fetch_items
-from storage import already_seen, init_db, make_fingerprint, mark_seen
+from rate_limiter import RateLimiter
+from router import get_topic_key
+from rss_collector import fetch_items, load_feed_cache, seconds_until_next_poll
+from rss_collector import logger as feed_logger
+from storage import already_seen, init_db, make_fingerprint, mark_seen_many
+
+logger = logging.getLogger(__name__)
+
+# Настройки загружаются один раз при импорте
+CFG = get_config()
+
+# URL Telegram Bot API вычисляется один раз при импорте
+TELEGRAM_API_URL = f"https://api.telegram.org/bot{CFG.bot_token}/sendMessage"
+
+# Заголовки запроса с уже сериализованным JSON-телом
+JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+def create_session():
+    """
+    Создает HTTP-сессию с пулом соединений и повторами для Telegram Bot API.
+
+    Сессия переиспользует TCP+TLS соединение между отправками (keep-alive),
+    а при 429 повторяет запрос после Retry-After. sendMessage не идемпотентен:
+    5xx и обрыв чтения ответа не повторяются (Telegram мог уже принять
+    сообщение), а уходят в обычную обработку ошибки.
+
+    Returns:
+        requests.Session: Настроенная сессия
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429,),
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+# Общая сессия для всех отправок в Telegram
+SESSION = create_session()
+
+# Лимиты Telegram: ~30 сообщений/сек глобально, ~1 сообщение/сек в чат
+RATE_LIMITER = RateLimiter()
+
+# Пул потоков для редакционной оценки items (фильтры и score - чистые функции)
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Пул потоков для отправки (по размеру пула соединений сессии)
+SEND_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Максимум сообщений в одном окне отправки (глобальный лимит Telegram в секунду)
+SEND_WINDOW_SIZE = 30
 
 
 def send_telegram_message(chat_id, message_thread_id, text, topic_key=None):
@@ -39,188 +96,338 @@ def send_telegram_message(chat_id, message_thread_id, text, topic_key=None):
         bool: True если сообщение отправлено успешно, False иначе
     """
     # В режиме DRY_RUN печатаем информацию вместо отправки
-    if DRY_RUN:
-        print("\n" + "=" * 60)
-        print("DRY_RUN: Сообщение не отправлено")
+    if CFG.dry_run:
+        logger.info("\n%s", "=" * 60)
+        logger.info("DRY_RUN: Сообщение не отправлено")
         if topic_key:
-            print(f"Topic key: {topic_key}")
-        print(f"message_thread_id: {message_thread_id}")
-        print("Текст сообщения:")
-        print("-" * 60)
-        print(text)
-        print("=" * 60 + "\n")
+            logger.info("Topic key: %s", topic_key)
+        logger.info("message_thread_id: %s", message_thread_id)
+        logger.info("Текст сообщения:")
+        logger.info("-" * 60)
+        logger.info("%s", text)
+        logger.info("%s\n", "=" * 60)
         return True
 
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
-
-    payload = {
-        "chat_id": chat_id,
-        "text": text,
-        "disable_web_page_preview": False,
-    }
+    payload = {"chat_id": chat_id, "text": text, "disable_web_page_preview": False}
 
     # Добавляем message_thread_id только если он не равен 0
-    if message_thread_id and message_thread_id != 0:
+    if message_thread_id:
         payload["message_thread_id"] = message_thread_id
 
+    # Сериализуем сами: без \uXXXX-экранирования кириллица занимает 2 байта вместо 6
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+    # Ждем, пока отправка не станет разрешена лимитами Telegram.
+    # 429 с Retry-After повторяется на уровне адаптера сессии.
+    RATE_LIMITER.acquire(chat_id, message_thread_id)
+
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = SESSION.post(TELEGRAM_API_URL, data=body, headers=JSON_HEADERS, timeout=10)
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
-        print(f"Ошибка при отправке сообщения в Telegram: {e}")
+        logger.error("Ошибка при отправке сообщения в Telegram: %s", e)
         if hasattr(e.response, "text"):
-            print(f"Ответ API: {e.response.text}")
+            logger.error("Ответ API: %s", e.response.text)
         return False
 
 
-def process_cycle(debug_mode=None):
+def build_send_windows(outgoing, window_size=SEND_WINDOW_SIZE):
+    """
+    Разбивает сообщения на окна для одновременной отправки.
+
+    В окне не больше одного сообщения на тему (message_thread_id) и не больше
+    window_size сообщений; порядок сообщений внутри темы сохраняется.
+
+    Args:
+        outgoing: Список сообщений (dict с ключом "message_thread_id")
+        window_size: Максимальный размер окна
+
+    Returns:
+        list[list[dict]]: Окна сообщений в порядке отправки
+    """
+    by_thread = {}
+    for message in outgoing:
+        by_thread.setdefault(message["message_thread_id"], []).append(message)
+
+    queues = list(by_thread.values())
+    depth = max((len(thread_queue) for thread_queue in queues), default=0)
+
+    windows = []
+    for index in range(depth):
+        layer = [thread_queue[index] for thread_queue in queues if index < len(thread_queue)]
+        for start in range(0, len(layer), window_size):
+            windows.append(layer[start : start + window_size])
+    return windows
+
+
+def send_window(window, cfg=CFG):
+    """
+    Отправляет окно сообщений одновременно через пул потоков.
+
+    Темп отправки ограничивает RATE_LIMITER: все темы одного чата делят его
+    лимит ~1 сообщение/сек, поэтому потоки окна ждут своей очереди. В DRY_RUN
+    сообщения печатаются последовательно, чтобы вывод не перемешивался.
+
+    Args:
+        window: Список сообщений окна
+        cfg: Настройки бота
+
+    Returns:
+        list[bool]: Результаты отправки в порядке сообщений окна
+    """
+
+    def send(message):
+        return send_telegram_message(
+            cfg.chat_id, message["message_thread_id"], message["text"], message["topic_key"]
+        )
+
+    if cfg.dry_run:
+        return [send(message) for message in window]
+    return list(SEND_EXECUTOR.map(send, window))
+
+
+def evaluate_item(item, now, score_rejected):
+    """
+    Вычисляет редакционную оценку item, не пробрасывая исключение.
+
+    Оценка идет в пуле потоков до цикла обработки; ошибка одного item
+    (например, title = None из источника) не должна прерывать весь цикл,
+    поэтому возвращается как значение и обрабатывается вместе с item.
+
+    Args:
+        item: Словарь с новостью
+        now: Текущее время для проверки свежести
+        score_rejected: Считать score и для отклоненных статей
+
+    Returns:
+        tuple|Exception: Результат editorial.evaluate или возникшее исключение
+    """
+    try:
+        return evaluate(item, now=now, score_rejected=score_rejected)
+    except Exception as e:
+        return e
+
+
+def process_cycle(debug_mode=None, cfg=CFG):
     """
     Выполняет один цикл обработки: сбор → фильтр → форматирование → отправка.
 
     Args:
         debug_mode: Если True, печатать score breakdown для каждого item
+        cfg: Настройки бота (по умолчанию загруженные при импорте)
 
     Returns:
         int: Количество обработанных новых новостей
     """
     if debug_mode is None:
-        debug_mode = DEBUG
-    print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Проверка новых новостей...")
+        debug_mode = cfg.debug
+    # Время цикла форматируется один раз и помечает начало и итог цикла
+    cycle_ts = time.strftime("%Y-%m-%d %H:%M:%S")
+    logger.info("\n[%s] Проверка новых новостей...", cycle_ts)
 
     # Получаем новости из RSS-лент
     items = fetch_items()
-    print(f"Найдено новостей: {len(items)}")
+    logger.info("Найдено новостей: %d", len(items))
 
     new_count = 0
     filtered_count = 0
 
-    for item in items:
-        if DRY_RUN:
-            print("\n--- RAW ITEM --------------------------------")
-            print("TITLE:", item.get("title"))
-            print("DATE:", item.get("published_at"))
-            print("URL:", item.get("url"))
-            print("SUMMARY:", (item.get("summary") or "")[:500])
-            print("--------------------------------------------")
+    # Редакционная оценка всех items заранее, параллельно
+    if cfg.editorial_mode:
+        # Score отклоненных items нужен только для debug-вывода
+        evaluate_cycle = partial(evaluate_item, now=datetime.now(), score_rejected=debug_mode)
+        evaluations = list(EXECUTOR.map(evaluate_cycle, items))
+    else:
+        evaluations = [None] * len(items)
 
-        reasons = []  # Инициализируем для доступа в DRY_RUN
-        try:
-            # Создаем fingerprint для дедупликации
-            fingerprint = make_fingerprint(item["title"], item["url"])
-
-            # Проверяем, не обрабатывали ли мы уже эту новость
-            if already_seen(fingerprint):
-                print(f"⊘ Отфильтровано (уже обработано): {item['title'][:60]}...")
-                filtered_count += 1
-                continue
+    # Сырые items печатаем только при уровне DEBUG
+    dump_raw_items = cfg.dry_run and logger.isEnabledFor(logging.DEBUG)
 
-            # Редакционный режим: фильтрация
-            if EDITORIAL_MODE:
-                # Проверка релевантности
-                if not is_relevant(item):
-                    if DRY_RUN:
-                        print(f"⊘ EXCLUDED: {item['title'][:60]}...")
-                    # Debug: все равно показываем score для отфильтрованных items
-                    if debug_mode:
-                        score, reasons = score_item(item)
-                        print(f"\n[DEBUG] Score breakdown для: {item['title'][:60]}...")
-                        print(f"  Score: {score}")
-                        print(f"  Reasons: {', '.join(reasons) if reasons else 'none'}")
-                        print("  Status: ⊘ EXCLUDED (не релевантно)")
-                    filtered_count += 1
-                    continue
+    # Сообщения, прошедшие фильтры; отправляются после обхода всех items
+    outgoing = []
 
-                # Проверка свежести
-                if not is_fresh(item):
-                    if DRY_RUN:
-                        print(f"⊘ NOT_FRESH: {item['title'][:60]}...")
-                    # Debug: все равно показываем score для отфильтрованных items
-                    if debug_mode:
-                        score, reasons = score_item(item)
-                        print(f"\n[DEBUG] Score breakdown для: {item['title'][:60]}...")
-                        print(f"  Score: {score}")
-                        print(f"  Reasons: {', '.join(reasons) if reasons else 'none'}")
-                        print("  Status: ⊘ NOT_FRESH (не свежая)")
-                    filtered_count += 1
-                    continue
+    # Отметки seen копятся за цикл и пишутся в БД одной транзакцией
+    pending_marks = []
+    pending_fingerprints = set()
 
-                # Проверка score (на уровне цикла for item in items)
-                score, reasons = score_item(item)
-
-                # Debug: печатаем score breakdown для каждого item
-                if debug_mode:
-                    print(f"\n[DEBUG] Score breakdown для: {item['title'][:60]}...")
-                    print(f"  Score: {score}")
-                    print(f"  Reasons: {', '.join(reasons) if reasons else 'none'}")
-                    print(f"  Threshold: {SCORE_THRESHOLD}")
-                    status_msg = "✓ PASS" if score >= SCORE_THRESHOLD else "⊘ FAIL (LOW_SCORE)"
-                    print(f"  Status: {status_msg}")
-
-                if score < SCORE_THRESHOLD:
-                    print(f"⊘ LOW_SCORE ({score}): {item['title'][:60]}...")
-                    print(f"   Reasons: {', '.join(reasons) if reasons else 'none'}")
+    try:
+        for item, evaluation in zip(items, evaluations):
+            if dump_raw_items:
+                logger.debug("\n--- RAW ITEM --------------------------------")
+                logger.debug("TITLE: %s", item.get("title"))
+                logger.debug("DATE: %s", item.get("published_at"))
+                logger.debug("URL: %s", item.get("url"))
+                logger.debug("SUMMARY: %.500s", item.get("summary") or "")
+                logger.debug("--------------------------------------------")
+
+            title = item["title"]  # Заголовок нужен в каждой строке лога
+            reasons = []  # Инициализируем для доступа в DRY_RUN
+            try:
+                # Создаем fingerprint для дедупликации
+                fingerprint = make_fingerprint(title, item["url"])
+
+                # Проверяем, не обрабатывали ли мы уже эту новость
+                if fingerprint in pending_fingerprints or already_seen(fingerprint):
+                    logger.info("⊘ Отфильтровано (уже обработано): %.60s...", title)
                     filtered_count += 1
                     continue
 
-                # Классификация и определение темы
-                bucket = classify_bucket(item)
-                region = detect_region(item)
-
-                # Определяем topic_key: "asia" если region=="asia", иначе bucket
-                if region == "asia":
-                    topic_key = "asia"
+                # Редакционный режим: фильтрация
+                if cfg.editorial_mode:
+                    # Ошибка оценки попадает в общий обработчик ниже
+                    if isinstance(evaluation, Exception):
+                        raise evaluation
+                    relevant, fresh, score, reasons, bucket, region = evaluation
+
+                    # Проверка релевантности
+                    if not relevant:
+                        if cfg.dry_run:
+                            logger.info("⊘ EXCLUDED: %.60s...", title)
+                        # Debug: все равно показываем score для отфильтрованных items
+                        if debug_mode:
+                            logger.info("\n[DEBUG] Score breakdown для: %.60s...", title)
+                            logger.info("  Score: %s", score)
+                            logger.info("  Reasons: %s", ", ".join(reasons) if reasons else "none")
+                            logger.info("  Status: ⊘ EXCLUDED (не релевантно)")
+                        filtered_count += 1
+                        continue
+
+                    # Проверка свежести
+                    if not fresh:
+                        if cfg.dry_run:
+                            logger.info("⊘ NOT_FRESH: %.60s...", title)
+                        # Debug: все равно показываем score для отфильтрованных items
+                        if debug_mode:
+                            logger.info("\n[DEBUG] Score breakdown для: %.60s...", title)
+                            logger.info("  Score: %s", score)
+                            logger.info("  Reasons: %s", ", ".join(reasons) if reasons else "none")
+                            logger.info("  Status: ⊘ NOT_FRESH (не свежая)")
+                        filtered_count += 1
+                        continue
+
+                    # Debug: печатаем score breakdown для каждого item
+                    if debug_mode:
+                        logger.info("\n[DEBUG] Score breakdown для: %.60s...", title)
+                        logger.info("  Score: %s", score)
+                        logger.info("  Reasons: %s", ", ".join(reasons) if reasons else "none")
+                        logger.info("  Threshold: %s", cfg.score_threshold)
+                        status_msg = (
+                            "✓ PASS" if score >= cfg.score_threshold else "⊘ FAIL (LOW_SCORE)"
+                        )
+                        logger.info("  Status: %s", status_msg)
+
+                    if score < cfg.score_threshold:
+                        logger.info("⊘ LOW_SCORE (%s): %.60s...", score, title)
+                        logger.info("   Reasons: %s", ", ".join(reasons) if reasons else "none")
+                        filtered_count += 1
+                        continue
+
+                    # Классификация (bucket, region) уже посчитана в evaluate
+                    # Определяем topic_key: "asia" если region=="asia", иначе bucket
+                    if region == "asia":
+                        topic_key = "asia"
+                    else:
+                        topic_key = bucket
+
+                    # Получаем message_thread_id из предвычисленной таблицы тем
+                    message_thread_id = resolve_topic(topic_key, cfg.topic_table)
+
+                    # Добавляем bucket и score в item для форматтера
+                    item["bucket"] = bucket
+                    item["score"] = score
                 else:
-                    topic_key = bucket
-
-                # Получаем message_thread_id из TOPIC_MAP
-                message_thread_id = TOPIC_MAP.get(topic_key, TOPIC_MAP.get("general", 0))
-
-                # Добавляем bucket и score в item для форматтера
-                item["bucket"] = bucket
-                item["score"] = score
-            else:
-                # Старый режим: используем router
-                message_thread_id = get_topic(item["title"])
-                topic_key = get_topic_key(item["title"])
-
-            # Форматируем сообщение
-            message_text = format_message(item)
-
-            # Отправляем сообщение в Telegram (или печатаем в DRY_RUN)
-            if send_telegram_message(CHAT_ID, message_thread_id, message_text, topic_key):
-                if DRY_RUN:
-                    print(f"✓ [DRY_RUN] Обработано: {item['title'][:50]}...")
-                    if EDITORIAL_MODE and reasons:
-                        print(f"   Reasons: {', '.join(reasons)}")
+                    # Старый режим: используем router
+                    topic_key = get_topic_key(title)
+                    message_thread_id = resolve_topic(topic_key, cfg.topic_table)
+
+                # Форматируем сообщение
+                message_text = format_message(item)
+
+                # Ставим сообщение в очередь отправки
+                outgoing.append(
+                    {
+                        "item": item,
+                        "fingerprint": fingerprint,
+                        "message_thread_id": message_thread_id,
+                        "topic_key": topic_key,
+                        "text": message_text,
+                        "score": score if cfg.editorial_mode else None,
+                        "reasons": reasons,
+                    }
+                )
+                pending_fingerprints.add(fingerprint)
+
+            except Exception as e:
+                logger.error("Ошибка при обработке новости: %s", e)
+                continue
+
+        # Отправляем сообщения в Telegram (или печатаем в DRY_RUN) окнами
+        for window in build_send_windows(outgoing):
+            results = send_window(window, cfg)
+            for message, sent in zip(window, results):
+                item = message["item"]
+                reasons = message["reasons"]
+                if sent:
+                    if cfg.dry_run:
+                        logger.info("✓ [DRY_RUN] Обработано: %.50s...", item["title"])
+                        if cfg.editorial_mode and reasons:
+                            logger.info("   Reasons: %s", ", ".join(reasons))
+                    else:
+                        logger.info("✓ Отправлено: %.50s...", item["title"])
+                    # Debug: показываем score для успешно обработанных items
+                    if debug_mode and cfg.editorial_mode:
+                        reasons_str = ", ".join(reasons) if reasons else "none"
+                        logger.info(
+                            "  [DEBUG] Score: %s, Reasons: %s", message["score"], reasons_str
+                        )
+                    new_count += 1
                 else:
-                    print(f"✓ Отправлено: {item['title'][:50]}...")
-                # Debug: показываем score для успешно обработанных items
-                if debug_mode and EDITORIAL_MODE:
-                    reasons_str = ", ".join(reasons) if reasons else "none"
-                    print(f"  [DEBUG] Score: {score}, Reasons: {reasons_str}")
-                new_count += 1
-            else:
-                print(f"✗ Ошибка отправки: {item['title'][:50]}...")
-
-            # Помечаем новость как обработанную
-            mark_seen(fingerprint, item["url"], item["published_at"])
-
-            # Небольшая задержка между сообщениями, чтобы не спамить
-            if not DRY_RUN:
-                time.sleep(1)
+                    logger.error("✗ Ошибка отправки: %.50s...", item["title"])
 
-        except Exception as e:
-            print(f"Ошибка при обработке новости: {e}")
-            continue
+                # Помечаем новость как обработанную (запись в БД - в конце цикла)
+                pending_marks.append((message["fingerprint"], item["url"], item["published_at"]))
+    finally:
+        mark_seen_many(pending_marks)
 
-    print(f"Обработано новых новостей: {new_count}")
+    logger.info("[%s] Обработано новых новостей: %d", cycle_ts, new_count)
     if filtered_count > 0:
-        print(f"Отфильтровано новостей: {filtered_count}")
+        logger.info("Отфильтровано новостей: %d", filtered_count)
 
     return new_count
 
 
+def setup_logging(debug_mode=False):
+    """
+    Настраивает логирование бота.
+
+    Записи кладутся в очередь (QueueHandler), а запись в stdout выполняет
+    фоновый поток (QueueListener), чтобы вывод не блокировал цикл обработки.
+    Отчеты о лентах (rss_collector) идут через ту же очередь, поэтому
+    выводятся по порядку с логами бота.
+
+    Args:
+        debug_mode: Если True, включается уровень DEBUG
+
+    Returns:
+        QueueListener: Запущенный listener (остановить через stop() при выходе)
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    queue_handler = QueueHandler(log_queue)
+    for target in (logger, feed_logger):
+        target.addHandler(queue_handler)
+        target.setLevel(logging.DEBUG if debug_mode else logging.INFO)
+        target.propagate = False
+
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 def main():
     """
     Основной цикл работы бота.
@@ -240,52 +447,58 @@ def main():
     args = parser.parse_args()
 
     # DEBUG может быть установлен через переменную окружения или CLI аргумент
-    debug_mode = DEBUG or args.debug
+    debug_mode = CFG.debug or args.debug
+
+    # Фоновый вывод логов; при выходе listener дописывает оставшиеся записи
+    listener = setup_logging(debug_mode)
+    atexit.register(listener.stop)
 
     # Проверяем наличие обязательных параметров (только если не DRY_RUN)
-    if not DRY_RUN:
-        if not BOT_TOKEN:
-            print("ОШИБКА: BOT_TOKEN не установлен в .env файле")
+    if not CFG.dry_run:
+        if not CFG.bot_token:
+            logger.error("ОШИБКА: BOT_TOKEN не установлен в .env файле")
             return
 
-        if not CHAT_ID:
-            print("ОШИБКА: CHAT_ID не установлен в .env файле")
+        if not CFG.chat_id:
+            logger.error("ОШИБКА: CHAT_ID не установлен в .env файле")
             return
 
     # Инициализируем базу данных
-    print("Инициализация базы данных...")
+    logger.info("Инициализация базы данных...")
     init_db()
+    load_feed_cache()
 
-    if DRY_RUN:
-        print("⚠️  Режим DRY_RUN: сообщения не будут отправляться в Telegram")
+    if CFG.dry_run:
+        logger.info("⚠️  Режим DRY_RUN: сообщения не будут отправляться в Telegram")
 
     if debug_mode:
-        print("🔍 Режим DEBUG: будет печататься score breakdown для каждого item")
+        logger.info("🔍 Режим DEBUG: будет печататься score breakdown для каждого item")
 
     if args.once:
-        print("Режим --once: выполнение одного цикла...")
+        logger.info("Режим --once: выполнение одного цикла...")
         process_cycle(debug_mode=debug_mode)
-        print("\nЦикл завершен. Выход.")
+        logger.info("\nЦикл завершен. Выход.")
         return
 
-    print(f"Бот запущен. Интервал опроса: {POLL_SECONDS} секунд")
-    print("Нажмите Ctrl+C для остановки")
+    logger.info("Бот запущен. Базовый интервал опроса: %s секунд", CFG.poll_seconds)
+    logger.info("Нажмите Ctrl+C для остановки")
 
     # Бесконечный цикл опроса
     while True:
         try:
             process_cycle(debug_mode=debug_mode)
         except KeyboardInterrupt:
-            print("\n\nОстановка бота...")
+            logger.info("\n\nОстановка бота...")
             break
         except Exception as e:
-            print(f"Критическая ошибка в основном цикле: {e}")
-            print("Продолжаем работу через 60 секунд...")
+            logger.error("Критическая ошибка в основном цикле: %s", e)
+            logger.info("Продолжаем работу через 60 секунд...")
             time.sleep(60)
 
-        # Ждем перед следующим опросом
-        print(f"Ожидание {POLL_SECONDS} секунд до следующей проверки...")
-        time.sleep(POLL_SECONDS)
+        # Ждем до ближайшей ленты, у которой подошло время опроса
+        delay = seconds_until_next_poll()
+        logger.info("Ожидание %.0f секунд до следующей проверки...", delay)
+        time.sleep(delay)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,11 @@
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Mapping
 
 from dotenv import load_dotenv
 
@@ -72,17 +77,98 @@ EXCLUDE_TERMS = [
     "comment",
 ]
 
+
+# Термины в нижнем регистре (готовятся один раз при импорте)
+INCLUDE_TERMS_LOWER = tuple(term.lower() for term in INCLUDE_TERMS)
+EXCLUDE_TERMS_LOWER = tuple(term.lower() for term in EXCLUDE_TERMS)
+
+
+def has_include(text):
+    """
+    Проверяет, содержит ли текст хотя бы один include термин.
+
+    Поиск подстроки (`in`) выполняется в C и на текстах статей заметно
+    быстрее одной regex-альтернации по тем же терминам.
+
+    Args:
+        text: Текст в нижнем регистре
+
+    Returns:
+        bool: True если найден include термин
+    """
+    for term in INCLUDE_TERMS_LOWER:
+        if term in text:
+            return True
+    return False
+
+
+def has_exclude(text):
+    """
+    Проверяет, содержит ли текст хотя бы один exclude термин.
+
+    Args:
+        text: Текст в нижнем регистре
+
+    Returns:
+        bool: True если найден exclude термин
+    """
+    for term in EXCLUDE_TERMS_LOWER:
+        if term in text:
+            return True
+    return False
+
+
 # Минимальный score для публикации
 SCORE_THRESHOLD = int(os.getenv("SCORE_THRESHOLD", "3"))
 
-# Маппинг тем на message_thread_id (по bucket)
-TOPIC_MAP = {
-    "review": int(os.getenv("TOPIC_REVIEW", "0")),
-    "trial": int(os.getenv("TOPIC_TRIAL", "0")),
-    "study": int(os.getenv("TOPIC_STUDY", "0")),
-    "asia": int(os.getenv("TOPIC_ASIA", "0")),
-    "general": int(os.getenv("TOPIC_GENERAL", "0")),
-}
+# Маппинг тем на message_thread_id (по bucket), только для чтения
+TOPIC_MAP = MappingProxyType(
+    {
+        "review": int(os.getenv("TOPIC_REVIEW", "0")),
+        "trial": int(os.getenv("TOPIC_TRIAL", "0")),
+        "study": int(os.getenv("TOPIC_STUDY", "0")),
+        "asia": int(os.getenv("TOPIC_ASIA", "0")),
+        "general": int(os.getenv("TOPIC_GENERAL", "0")),
+    }
+)
+
+# Коды тем: индекс темы в TOPIC_TABLE
+TOPIC_CODES = MappingProxyType({"review": 0, "trial": 1, "study": 2, "asia": 3, "general": 4})
+GENERAL_TOPIC_CODE = TOPIC_CODES["general"]
+
+
+def build_topic_table(topic_map):
+    """
+    Строит таблицу message_thread_id по кодам тем с уже подставленным fallback.
+
+    Args:
+        topic_map: Маппинг topic_key -> message_thread_id
+
+    Returns:
+        tuple[int, ...]: message_thread_id, индексированные кодами из TOPIC_CODES
+    """
+    general = topic_map.get("general", 0)
+    return tuple(topic_map.get(topic_key, general) for topic_key in TOPIC_CODES)
+
+
+TOPIC_TABLE = build_topic_table(TOPIC_MAP)
+
+
+def resolve_topic(topic_key, topic_table=TOPIC_TABLE):
+    """
+    Возвращает message_thread_id для ключа темы.
+
+    Неизвестные ключи (например, "iceland") попадают в тему "general".
+
+    Args:
+        topic_key: Ключ темы ("review", "trial", "study", "asia", "general", ...)
+        topic_table: Таблица, построенная build_topic_table
+
+    Returns:
+        int: message_thread_id
+    """
+    return topic_table[TOPIC_CODES.get(topic_key, GENERAL_TOPIC_CODE)]
+
 
 # Список RSS-лент для мониторинга
 # Медицинские RSS-каналы для сбора новостей и исследований
@@ -115,4 +201,53 @@ SCIENCE_FEEDS = [
 TRIALS_FEEDS = []
 NEWS_FEEDS = []
 
-ALL_FEEDS = SCIENCE_FEEDS + TRIALS_FEEDS + NEWS_FEEDS
+
+def all_feeds():
+    """
+    Возвращает все ленты (наука, испытания, новости) без создания общего списка.
+
+    Списки читаются при каждом вызове, поэтому изменения SCIENCE_FEEDS,
+    TRIALS_FEEDS и NEWS_FEEDS видны без пересборки.
+
+    Returns:
+        Iterator[str]: URL лент в порядке SCIENCE_FEEDS, TRIALS_FEEDS, NEWS_FEEDS
+    """
+    return chain(SCIENCE_FEEDS, TRIALS_FEEDS, NEWS_FEEDS)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Неизменяемый снимок настроек бота, загруженных из окружения."""
+
+    bot_token: str
+    chat_id: str
+    poll_seconds: int
+    dry_run: bool
+    editorial_mode: bool
+    debug: bool
+    max_age_days: int
+    score_threshold: int
+    topic_map: Mapping[str, int]
+    topic_table: tuple[int, ...]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Возвращает настройки бота (создаются один раз на процесс).
+
+    Returns:
+        Config: Настройки бота
+    """
+    return Config(
+        bot_token=BOT_TOKEN,
+        chat_id=CHAT_ID,
+        poll_seconds=POLL_SECONDS,
+        dry_run=DRY_RUN,
+        editorial_mode=EDITORIAL_MODE,
+        debug=DEBUG,
+        max_age_days=MAX_AGE_DAYS,
+        score_threshold=SCORE_THRESHOLD,
+        topic_map=TOPIC_MAP,
+        topic_table=TOPIC_TABLE,
+    )
@@ -28,29 +28,29 @@ def format_message(item):
     summary = item.get("summary", "")
     bucket = item.get("bucket", "")
 
-    # Формируем сообщение
-    message = f"📰 {title}\n\n"
+    # Собираем части сообщения и склеиваем один раз
+    parts = [f"📰 {title}\n\n"]
 
     # Добавляем тип статьи (Review/Trial/Study)
     if bucket:
-        bucket_display = bucket.capitalize()
-        message += f"Тип: {bucket_display}\n"
+        parts.append(f"Тип: {bucket.capitalize()}\n")
 
-    message += f"🔗 Источник: {source}\n"
+    parts.append(f"🔗 Источник: {source}\n")
 
     if published_at:
-        message += f"📅 Дата: {published_at}\n"
+        parts.append(f"📅 Дата: {published_at}\n")
 
     # Добавляем аннотацию (1-2 строки, обрезать до 300-500 символов)
     if summary:
         # Очищаем от лишних пробелов и переносов
+        # (split/join быстрее, чем re.sub(r"\s+", " ", ...))
         summary_clean = " ".join(summary.split())
         # Обрезаем до 400 символов (компромисс между 300-500)
         if len(summary_clean) > 400:
             summary_clean = summary_clean[:400].rsplit(" ", 1)[0] + "..."
-        message += f"\n{summary_clean}\n"
+        parts.append(f"\n{summary_clean}\n")
 
     if url:
-        message += f"\n🔗 {url}"
+        parts.append(f"\n🔗 {url}")
 
-    return message
+    return "".join(parts)
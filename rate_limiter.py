@@ -0,0 +1,79 @@
+"""
+Ограничение частоты отправки сообщений в Telegram (token bucket).
+"""
+
+import bisect
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Двойной token bucket: глобальный лимит и лимит на отдельный чат.
+
+    Telegram допускает ~30 сообщений в секунду глобально и ~1 сообщение
+    в секунду в один чат. Лимит чата общий для всех его тем (forum topics),
+    поэтому темп считается по chat_id, а не по теме. Вместо фиксированной
+    паузы после каждой отправки limiter ждет ровно столько, сколько нужно
+    для соблюдения лимитов.
+    """
+
+    def __init__(
+        self,
+        global_per_second=30,
+        per_chat_interval=1.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        """
+        Инициализирует limiter.
+
+        Args:
+            global_per_second: Максимум отправок за секунду глобально
+            per_chat_interval: Минимальный интервал (сек) между отправками в один чат
+            clock: Источник монотонного времени (для тестов)
+            sleep: Функция ожидания (для тестов)
+        """
+        self.global_per_second = global_per_second
+        self.per_chat_interval = per_chat_interval
+        # Зарезервированные моменты отправки (отсортированы по времени)
+        self.global_bucket = []
+        self.per_chat = {}
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def acquire(self, chat_id, message_thread_id=None):
+        """
+        Блокирует до момента, когда отправка в чат разрешена лимитами.
+
+        Потокобезопасен: под блокировкой резервируется момент отправки,
+        ожидание выполняется вне блокировки, поэтому потоки, пишущие
+        в разные чаты, не ждут друг друга.
+
+        Args:
+            chat_id: ID чата/группы/канала
+            message_thread_id: ID темы (topic) в группе; на темп не влияет,
+                темы одного чата делят его лимит
+        """
+        with self._lock:
+            now = self._clock()
+
+            # Глобальный bucket: выбрасываем отметки старше 1 секунды
+            while self.global_bucket and now - self.global_bucket[0] >= 1.0:
+                self.global_bucket.pop(0)
+
+            send_at = now
+            if len(self.global_bucket) >= self.global_per_second:
+                send_at = max(send_at, self.global_bucket[-self.global_per_second] + 1.0)
+
+            # Bucket на чат (общий для всех тем чата)
+            last_sent = self.per_chat.get(chat_id)
+            if last_sent is not None:
+                send_at = max(send_at, last_sent + self.per_chat_interval)
+
+            bisect.insort(self.global_bucket, send_at)
+            self.per_chat[chat_id] = send_at
+
+        if send_at > now:
+            self._sleep(send_at - now)
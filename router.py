@@ -2,7 +2,13 @@
 Маршрутизация новостей по темам на основе ключевых слов.
 """
 
-from config import TOPIC_MAP
+from config import resolve_topic
+
+# Ключевые слова заголовка -> ключ темы (проверяются по порядку, побеждает первое)
+TOPIC_KEYWORDS = (
+    ("iceland", "iceland"),
+    ("japan", "japan"),
+)
 
 
 def get_topic(title):
@@ -15,17 +21,7 @@ def get_topic(title):
     Returns:
         int: message_thread_id для соответствующей темы, или "general" если не найдено
     """
-    title_lower = title.lower()
-
-    # Проверяем ключевые слова для каждой темы
-    if "iceland" in title_lower:
-        return TOPIC_MAP.get("iceland", TOPIC_MAP.get("general", 0))
-
-    if "japan" in title_lower:
-        return TOPIC_MAP.get("japan", TOPIC_MAP.get("general", 0))
-
-    # По умолчанию отправляем в общую тему
-    return TOPIC_MAP.get("general", 0)
+    return resolve_topic(get_topic_key(title))
 
 
 def get_topic_key(title):
@@ -40,10 +36,8 @@ def get_topic_key(title):
     """
     title_lower = title.lower()
 
-    if "iceland" in title_lower:
-        return "iceland"
-
-    if "japan" in title_lower:
-        return "japan"
+    for keyword, topic_key in TOPIC_KEYWORDS:
+        if keyword in title_lower:
+            return topic_key
 
     return "general"
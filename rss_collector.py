@@ -2,18 +2,485 @@
 Сбор RSS-новостей из различных источников.
 """
 
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from config import ALL_FEEDS
+from config import POLL_SECONDS, all_feeds
+from storage import DB_DIR
+
+# Ленты опрашиваются из нескольких потоков: отчет о ленте пишется одной записью
+logger = logging.getLogger(__name__)
+
+# Максимум одновременно загружаемых лент
+MAX_CONCURRENT_FEEDS = 10
+
+
+def create_session():
+    """
+    Создает HTTP-сессию для опроса лент.
+
+    Пул соединений на хост рассчитан на MAX_CONCURRENT_FEEDS потоков, поэтому
+    параллельные запросы Europe PMC переиспользуют keep-alive соединения, а не
+    открывают новые TCP+TLS. Кратковременные 429/5xx повторяются с задержкой.
+
+    Returns:
+        requests.Session: Настроенная сессия
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=MAX_CONCURRENT_FEEDS,
+        pool_maxsize=MAX_CONCURRENT_FEEDS,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Общая сессия: keep-alive соединения переиспользуются между лентами и циклами
+SESSION = create_session()
+
+# Границы адаптивного интервала опроса ленты (сек): не чаще POLL_SECONDS, не реже 30 минут
+MIN_FEED_INTERVAL = POLL_SECONDS
+MAX_FEED_INTERVAL = max(30 * 60, POLL_SECONDS)
+
+# Множитель интервала, если лента не изменилась
+FEED_BACKOFF_FACTOR = 1.5
+
+# Состояние опроса лент: feed_url -> etag, last_modified, хэш ответа, последние
+# разобранные новости, интервал, next_run
+FEED_STATE = {}
+
+# Кэш лент на диске: валидаторы и последние новости переживают перезапуск бота
+FEED_CACHE_PATH = os.path.join(DB_DIR, "feed_cache.json")
+
+# Префиксы DOI-ссылок: после них в URL остается сам DOI
+DOI_URL_PREFIXES = (
+    "https://doi.org/",
+    "http://doi.org/",
+    "https://dx.doi.org/",
+    "http://dx.doi.org/",
+)
+
+
+def get_feed_state(feed_url):
+    """
+    Возвращает состояние опроса ленты (создает при первом обращении).
+
+    Args:
+        feed_url: URL ленты
+
+    Returns:
+        dict: Состояние ленты (next_run - по time.monotonic())
+    """
+    state = FEED_STATE.get(feed_url)
+    if state is None:
+        state = {
+            "etag": None,
+            "last_modified": None,
+            "content_hash": None,
+            "items": [],
+            "restored": False,
+            "interval": MIN_FEED_INTERVAL,
+            "next_run": 0.0,
+        }
+        FEED_STATE[feed_url] = state
+    return state
+
+
+def conditional_headers(state):
+    """
+    Формирует заголовки условного запроса (If-None-Match / If-Modified-Since).
+
+    Args:
+        state: Состояние ленты
+
+    Returns:
+        dict: HTTP-заголовки
+    """
+    headers = {}
+    if state["etag"]:
+        headers["If-None-Match"] = state["etag"]
+    if state["last_modified"]:
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+def remember_response(state, response):
+    """
+    Запоминает валидаторы ответа и проверяет, изменилось ли содержимое ленты.
+
+    Хэш тела нужен для серверов, которые не поддерживают ETag/Last-Modified:
+    при совпадении хэша лента не разбирается повторно (feedparser - самая
+    дорогая часть опроса). SHA-1 используется не для безопасности: через
+    OpenSSL он примерно вдвое быстрее blake2b на телах лент.
+
+    Args:
+        state: Состояние ленты
+        response: Успешный HTTP-ответ
+
+    Returns:
+        bool: True если содержимое отличается от предыдущего ответа
+    """
+    state["etag"] = response.headers.get("ETag")
+    state["last_modified"] = response.headers.get("Last-Modified")
+
+    content_hash = hashlib.sha1(response.content, usedforsecurity=False).digest()
+    changed = content_hash != state["content_hash"]
+    state["content_hash"] = content_hash
+    return changed
+
+
+def schedule_feed(state, changed, now=None):
+    """
+    Пересчитывает интервал опроса ленты и время следующего запроса.
+
+    Интервал растет в FEED_BACKOFF_FACTOR раз, пока лента не меняется,
+    и сокращается вдвое, когда появляются изменения.
+
+    Args:
+        state: Состояние ленты
+        changed: True - лента изменилась, False - нет, None - ошибка (интервал не меняется)
+        now: Текущее время по time.monotonic() (для тестов)
+    """
+    if changed is True:
+        state["interval"] = max(MIN_FEED_INTERVAL, state["interval"] / 2)
+    elif changed is False:
+        state["interval"] = min(MAX_FEED_INTERVAL, state["interval"] * FEED_BACKOFF_FACTOR)
+
+    if now is None:
+        now = time.monotonic()
+    state["next_run"] = now + state["interval"]
+
+
+def intern_item_strings(item):
+    """
+    Интернирует повторяющиеся строки новости (source, pub_types).
+
+    json.load создает отдельную строку на каждое вхождение, а источник и типы
+    публикаций одинаковы у сотен новостей из кэша.
+
+    Args:
+        item: Словарь с новостью
+
+    Returns:
+        dict: Тот же словарь
+    """
+    item["source"] = sys.intern(item.get("source", ""))
+    item["pub_types"] = [sys.intern(pt) for pt in item.get("pub_types", [])]
+    return item
+
+
+def load_feed_cache(path=FEED_CACHE_PATH):
+    """
+    Загружает сохраненные валидаторы и новости лент (вызывается при старте).
+
+    Новости из кэша отдаются один раз, если при первом опросе лента
+    не изменилась: в новом процессе они еще не проходили фильтры.
+
+    Args:
+        path: Путь к файлу кэша
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    for feed_url, entry in cached.items():
+        state = get_feed_state(feed_url)
+        content_hash = entry.get("content_hash")
+        state["etag"] = entry.get("etag")
+        state["last_modified"] = entry.get("last_modified")
+        state["content_hash"] = bytes.fromhex(content_hash) if content_hash else None
+        state["items"] = [intern_item_strings(item) for item in entry.get("items", [])]
+        state["restored"] = True
+
+
+def save_feed_cache(path=FEED_CACHE_PATH):
+    """
+    Сохраняет валидаторы и последние новости лент на диск.
+
+    Файл записывается во временный и атомарно заменяется.
+
+    Args:
+        path: Путь к файлу кэша
+    """
+    cached = {
+        feed_url: {
+            "etag": state["etag"],
+            "last_modified": state["last_modified"],
+            "content_hash": state["content_hash"].hex() if state["content_hash"] else None,
+            "items": state["items"],
+        }
+        for feed_url, state in FEED_STATE.items()
+        if state["content_hash"] is not None
+    }
+
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cached, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.error("Ошибка при сохранении кэша лент: %s", e)
+
+
+def seconds_until_next_poll():
+    """
+    Возвращает время до ближайшего запланированного опроса ленты.
+
+    Returns:
+        float: Секунды ожидания (0, если какая-то лента уже ждет опроса)
+    """
+    next_run = min((get_feed_state(feed_url)["next_run"] for feed_url in all_feeds()), default=None)
+    if next_run is None:
+        return POLL_SECONDS
+    return max(0.0, next_run - time.monotonic())
+
+
+def fetch_feed(feed_url):
+    """
+    Читает одну RSS-ленту (или запрос Europe PMC) и возвращает список новостей.
+
+    Запрос условный (ETag / Last-Modified): если лента не изменилась с прошлого
+    опроса, она не парсится и возвращается пустой список (или, сразу после
+    перезапуска, новости из кэша на диске). Ошибки загрузки и парсинга
+    логируются, в этом случае тоже возвращается пустой список.
+
+    Args:
+        feed_url: URL ленты
+
+    Returns:
+        list: Список словарей с новостями (формат см. fetch_items)
+    """
+    items = []
+    state = get_feed_state(feed_url)
+    changed = None
+
+    try:
+        response = SESSION.get(feed_url, headers=conditional_headers(state), timeout=20)
+        if response.status_code == 304:
+            changed = False
+        else:
+            response.raise_for_status()
+            changed = remember_response(state, response)
+
+        if not changed:
+            logger.info("[Без изменений] %s", feed_url)
+            if state["restored"]:
+                # Первый опрос после перезапуска: отдаем новости из кэша
+                state["restored"] = False
+                items.extend(state["items"])
+            return items
+
+        # Обработка Europe PMC REST API (JSON)
+        if feed_url.startswith("https://www.ebi.ac.uk/europepmc/webservices/rest/search"):
+            data = response.json()
+
+            # Извлекаем список результатов
+            results = data.get("resultList", {}).get("result", [])
+            result_count = len(results)
+
+            report = [f"[Europe PMC] {feed_url}", f"  Результатов: {result_count}"]
+            if result_count == 0:
+                report.append(f"  Query: {feed_url}")
+            logger.info("%s", "\n".join(report))
+
+            # Обрабатываем каждый результат
+            for result in results:
+                title = result.get("title", "Без заголовка")
+
+                # Формируем URL: приоритет DOI, иначе journalUrl/pmid/pmcid
+                url = ""
+                if result.get("doi"):
+                    url = f"https://doi.org/{result['doi']}"
+                elif result.get("journalUrl"):
+                    url = result["journalUrl"]
+                elif result.get("pmid"):
+                    url = f"https://europepmc.org/article/MED/{result['pmid']}"
+                elif result.get("pmcid"):
+                    url = f"https://europepmc.org/article/PMC/{result['pmcid']}"
+
+                # Извлекаем дату публикации
+                published_at = result.get("firstPublicationDate", "")
+                if not published_at:
+                    pub_year = result.get("pubYear", "")
+                    if pub_year:
+                        published_at = pub_year
+
+                # Извлекаем аннотацию
+                abstract = result.get("abstractText") or ""
+                journal = result.get("journalTitle") or ""
+                authors = result.get("authorString") or ""
+
+                # Извлекаем pub_types: сначала пробуем pubTypeList.pubType,
+                # затем pubType (строка)
+                pub_types = []
+                pub_type_list = result.get("pubTypeList")
+                if pub_type_list and isinstance(pub_type_list, dict):
+                    # Пробуем извлечь pubType из pubTypeList
+                    pub_type_value = pub_type_list.get("pubType")
+                    if pub_type_value:
+                        if isinstance(pub_type_value, list):
+                            pub_types = pub_type_value
+                        else:
+                            pub_types = [pub_type_value]
+
+                # Если pubTypeList отсутствует или пуст, пробуем pubType (строка) напрямую
+                if not pub_types:
+                    pub_type = result.get("pubType")
+                    if pub_type:
+                        if isinstance(pub_type, list):
+                            pub_types = pub_type
+                        else:
+                            pub_types = [pub_type]
+
+                # Приводим к list[str]; одинаковые типы ("Journal Article", "Review")
+                # повторяются у тысяч статей, поэтому интернируются в один объект
+                pub_types = [sys.intern(str(pt)) for pt in pub_types] if pub_types else []
+
+                # Типы публикаций остаются отдельным полем (см. editorial.item_texts)
+                summary = f"{abstract}\n{journal}\n{authors}"
+
+                item = {
+                    "title": title,
+                    "url": url,
+                    "published_at": published_at,
+                    "source": "Europe PMC",
+                    "summary": summary,
+                    "pub_types": pub_types,
+                }
+
+                items.append(item)
+
+        else:
+            # Обычный RSS через feedparser
+            feed = feedparser.parse(response.content)
+            bozo_val = getattr(feed, "bozo", None)
+            entries_count = len(getattr(feed, "entries", []))
+            report = [f"[RSS] {feed_url}", f"  bozo={bozo_val} entries={entries_count}"]
+            if getattr(feed, "bozo", 0):
+                report.append(f"  bozo_exception={getattr(feed, 'bozo_exception', None)}")
+            logger.info("%s", "\n".join(report))
+
+            # Источник (заголовок ленты) общий для всех новостей ленты
+            source = sys.intern(feed.feed.get("title", feed_url))
+
+            # Обрабатываем каждую новость из ленты
+            for entry in feed.entries:
+                # Извлекаем заголовок
+                title = entry.get("title", "Без заголовка")
+
+                # Извлекаем URL (может быть в разных полях)
+                url = entry.get("link", "")
+                if not url and hasattr(entry, "links") and entry.links:
+                    url = entry.links[0].get("href", "")
+
+                # Извлекаем дату публикации
+                published_at = ""
+                if hasattr(entry, "published"):
+                    published_at = entry.published
+                elif hasattr(entry, "updated"):
+                    published_at = entry.updated
+                elif hasattr(entry, "published_parsed"):
+                    # Парсим структурированную дату
+                    pub_date = entry.published_parsed
+                    published_at = datetime(*pub_date[:6]).strftime("%Y-%m-%d %H:%M:%S")
+
+                # Извлекаем summary (если есть)
+                summary = entry.get("summary", "")
+
+                # Для обычных RSS-лент pub_types отсутствует
+                pub_types = []
+
+                item = {
+                    "title": title,
+                    "url": url,
+                    "published_at": published_at,
+                    "source": source,
+                    "summary": summary,
+                    "pub_types": pub_types,
+                }
+
+                items.append(item)
+
+        state["items"] = items
+        state["restored"] = False
+
+    except Exception as e:
+        logger.error("Ошибка при обработке %s: %s", feed_url, e)
+        # Валидаторы сбрасываются, чтобы следующий запрос снова получил ленту целиком
+        state["etag"] = state["last_modified"] = state["content_hash"] = None
+        changed = None
+    finally:
+        schedule_feed(state, changed)
+
+    return items
+
+
+def dedup_key(item):
+    """
+    Возвращает ключ статьи для дедупликации между лентами.
+
+    Одна и та же статья приходит из Europe PMC (ссылка https://doi.org/...),
+    журнального RSS (http://dx.doi.org/...) и агрегаторов, часто с немного
+    разным заголовком, поэтому ключом служит нормализованный URL/DOI,
+    а заголовок - только если URL нет.
+
+    К нижнему регистру приводятся только схема, хост и DOI (DOI не зависит
+    от регистра); путь и query обычного URL сохраняются как есть, иначе
+    разные статьи, отличающиеся регистром в пути, склеились бы.
+
+    Args:
+        item: Словарь с новостью
+
+    Returns:
+        str: Ключ дедупликации
+    """
+    url = (item.get("url") or "").strip().rstrip("/")
+    if not url:
+        return (item.get("title") or "").strip().lower()[:100]
+
+    url_lower = url.lower()
+    for prefix in DOI_URL_PREFIXES:
+        if url_lower.startswith(prefix):
+            return url_lower[len(prefix) :]
+
+    parts = urlsplit(url)
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment)
+    )
 
 
 def fetch_items():
     """
     Читает все RSS-ленты из конфигурации и возвращает список новостей.
 
+    Опрашиваются только ленты, у которых подошло время следующего запроса
+    (см. schedule_feed). Ленты загружаются параллельно, порядок новостей
+    соответствует порядку all_feeds(). Статья, пришедшая из нескольких лент
+    (запросы Europe PMC сильно пересекаются), возвращается один раз
+    (см. dedup_key).
+
     Returns:
         list: Список словарей с новостями:
             {
@@ -25,149 +492,28 @@ def fetch_items():
                 "pub_types": list[str]  # Типы публикаций (для Europe PMC)
             }
     """
-    all_items = []
+    now = time.monotonic()
+    due_feeds = [
+        feed_url for feed_url in all_feeds() if get_feed_state(feed_url)["next_run"] <= now
+    ]
+    if not due_feeds:
+        return []
 
-    for feed_url in ALL_FEEDS:
-        try:
-            # Обработка Europe PMC REST API (JSON)
-            if feed_url.startswith("https://www.ebi.ac.uk/europepmc/webservices/rest/search"):
-                response = requests.get(feed_url, timeout=20)
-                response.raise_for_status()
-                data = response.json()
-
-                # Извлекаем список результатов
-                results = data.get("resultList", {}).get("result", [])
-                result_count = len(results)
-
-                print(f"[Europe PMC] {feed_url}")
-                print(f"  Результатов: {result_count}")
-
-                if result_count == 0:
-                    print(f"  Query: {feed_url}")
-
-                # Обрабатываем каждый результат
-                for result in results:
-                    title = result.get("title", "Без заголовка")
-
-                    # Формируем URL: приоритет DOI, иначе journalUrl/pmid/pmcid
-                    url = ""
-                    if result.get("doi"):
-                        url = f"https://doi.org/{result['doi']}"
-                    elif result.get("journalUrl"):
-                        url = result["journalUrl"]
-                    elif result.get("pmid"):
-                        url = f"https://europepmc.org/article/MED/{result['pmid']}"
-                    elif result.get("pmcid"):
-                        url = f"https://europepmc.org/article/PMC/{result['pmcid']}"
-
-                    # Извлекаем дату публикации
-                    published_at = result.get("firstPublicationDate", "")
-                    if not published_at:
-                        pub_year = result.get("pubYear", "")
-                        if pub_year:
-                            published_at = pub_year
-
-                    # Извлекаем аннотацию
-                    abstract = result.get("abstractText") or ""
-                    journal = result.get("journalTitle") or ""
-                    authors = result.get("authorString") or ""
-
-                    # Извлекаем pub_types: сначала пробуем pubTypeList.pubType,
-                    # затем pubType (строка)
-                    pub_types = []
-                    pub_type_list = result.get("pubTypeList")
-                    if pub_type_list and isinstance(pub_type_list, dict):
-                        # Пробуем извлечь pubType из pubTypeList
-                        pub_type_value = pub_type_list.get("pubType")
-                        if pub_type_value:
-                            if isinstance(pub_type_value, list):
-                                pub_types = pub_type_value
-                            else:
-                                pub_types = [pub_type_value]
-
-                    # Если pubTypeList отсутствует или пуст, пробуем pubType (строка) напрямую
-                    if not pub_types:
-                        pub_type = result.get("pubType")
-                        if pub_type:
-                            if isinstance(pub_type, list):
-                                pub_types = pub_type
-                            else:
-                                pub_types = [pub_type]
-
-                    # Приводим к list[str]
-                    pub_types = [str(pt) for pt in pub_types] if pub_types else []
-
-                    # Формируем текстовое представление типов публикаций
-                    pub_types_text = " ".join(pub_types).lower() if pub_types else ""
-
-                    summary = f"{abstract}\n{journal}\n{authors}"
-                    if pub_types_text:
-                        summary = summary + " " + pub_types_text
-
-                    item = {
-                        "title": title,
-                        "url": url,
-                        "published_at": published_at,
-                        "source": "Europe PMC",
-                        "summary": summary,
-                        "pub_types": pub_types,
-                    }
-
-                    all_items.append(item)
-
-            else:
-                # Обычный RSS через feedparser
-                feed = feedparser.parse(feed_url)
-                print(f"[RSS] {feed_url}")
-                bozo_val = getattr(feed, "bozo", None)
-                entries_count = len(getattr(feed, "entries", []))
-                print(f"  bozo={bozo_val} entries={entries_count}")
-                if getattr(feed, "bozo", 0):
-                    print(f"  bozo_exception={getattr(feed, 'bozo_exception', None)}")
-
-                # Обрабатываем каждую новость из ленты
-                for entry in feed.entries:
-                    # Извлекаем заголовок
-                    title = entry.get("title", "Без заголовка")
-
-                    # Извлекаем URL (может быть в разных полях)
-                    url = entry.get("link", "")
-                    if not url and hasattr(entry, "links") and entry.links:
-                        url = entry.links[0].get("href", "")
-
-                    # Извлекаем дату публикации
-                    published_at = ""
-                    if hasattr(entry, "published"):
-                        published_at = entry.published
-                    elif hasattr(entry, "updated"):
-                        published_at = entry.updated
-                    elif hasattr(entry, "published_parsed"):
-                        # Парсим структурированную дату
-                        pub_date = entry.published_parsed
-                        published_at = datetime(*pub_date[:6]).strftime("%Y-%m-%d %H:%M:%S")
-
-                    # Определяем источник (из URL или заголовка ленты)
-                    source = feed.feed.get("title", feed_url)
-
-                    # Извлекаем summary (если есть)
-                    summary = entry.get("summary", "")
-
-                    # Для обычных RSS-лент pub_types отсутствует
-                    pub_types = []
-
-                    item = {
-                        "title": title,
-                        "url": url,
-                        "published_at": published_at,
-                        "source": source,
-                        "summary": summary,
-                        "pub_types": pub_types,
-                    }
-
-                    all_items.append(item)
-
-        except Exception as e:
-            print(f"Ошибка при обработке {feed_url}: {e}")
-            continue
+    all_items = []
+    # Ключи (DOI/URL) уже собранных статей
+    seen_this_cycle = set()
+
+    max_workers = min(MAX_CONCURRENT_FEEDS, len(due_feeds))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for items in executor.map(fetch_feed, due_feeds):
+            for item in items:
+                key = dedup_key(item)
+                if key in seen_this_cycle:
+                    continue
+                seen_this_cycle.add(key)
+                all_items.append(item)
+
+    if all_items:
+        save_feed_cache()
 
     return all_items
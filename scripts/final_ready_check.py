@@ -2,15 +2,21 @@
 """
 Final ready check - release gate перед включением scheduler/publish/telegram.
 
-Выполняет последовательность проверок:
+Выполняет проверки (параллельно, результаты - по порядку):
 - Ruff check
 - Pytest
 - Scoring report
 - Pipeline dry-run report
 - Gate conditions validation
+
+Ruff и pytest пропускаются, если их входы не менялись с последнего успешного
+запуска; --no-cache принудительно запускает все проверки.
 """
 
-import re
+import argparse
+import hashlib
+import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -20,135 +26,180 @@ script_dir = Path(__file__).parent
 project_root = script_dir.parent
 sys.path.insert(0, str(project_root))
 
+from scripts.pipeline_dry_run_report import METRICS_JSON_MARKER  # noqa: E402
+
+# Отпечатки входов последних успешных ruff/pytest: при совпадении этап пропускается
+CACHE_PATH = project_root / ".final_ready_check_cache.json"
+
+# Каталоги, файлы которых не влияют на результат проверок
+SKIP_DIRS = {"__pycache__", "venv", "db"}
+
+# Файлы, от которых зависит результат этапа (кроме *.py)
+RUFF_INPUTS = ("ruff.toml", "pyproject.toml", "dev-requirements.txt")
+PYTEST_INPUTS = ("pytest.ini", "pyproject.toml", "requirements.txt", "dev-requirements.txt")
+
 
-def run_command(cmd: list[str], description: str) -> tuple[int, str]:
+def collect_inputs(extra_files: tuple[str, ...], extra_dirs: tuple[str, ...] = ()) -> list[Path]:
     """
-    Запускает команду и возвращает exit code и stdout.
+    Собирает файлы, от которых зависит этап проверки.
 
     Args:
-        cmd: Команда для запуска (список аргументов)
-        description: Описание команды для вывода
+        extra_files: Конфигурационные файлы в корне проекта
+        extra_dirs: Каталоги, все файлы которых тоже входят в отпечаток
+
+    Returns:
+        Список путей: все *.py проекта, extra_files и содержимое extra_dirs
+    """
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS]
+        paths.extend(Path(dirpath) / name for name in filenames if name.endswith(".py"))
+
+    paths.extend(project_root / name for name in extra_files if (project_root / name).exists())
+    for name in extra_dirs:
+        paths.extend(path for path in (project_root / name).rglob("*") if path.is_file())
+
+    return paths
+
+
+def fingerprint(paths: list[Path], extra: tuple[str, ...] = ()) -> str:
+    """
+    Вычисляет отпечаток набора файлов по пути, mtime и размеру.
+
+    Args:
+        paths: Файлы
+        extra: Дополнительные строки, от которых зависит результат
+            (например, версия и путь интерпретатора)
 
     Returns:
-        Tuple[exit_code, stdout]: код выхода и вывод команды
+        Hex-строка отпечатка
     """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in extra:
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    for path in sorted(paths):
+        stat = path.stat()
+        digest.update(str(path.relative_to(project_root)).encode("utf-8"))
+        digest.update(stat.st_mtime_ns.to_bytes(8, "little"))
+        digest.update(stat.st_size.to_bytes(8, "little"))
+    return digest.hexdigest()
+
+
+def load_cache() -> dict:
+    """Загружает отпечатки последних успешных этапов (пустой dict, если кэша нет)."""
+    try:
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict):
+    """Сохраняет отпечатки успешных этапов."""
+    try:
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: could not write {CACHE_PATH.name}: {e}", file=sys.stderr)
+
+
+def print_command_header(cmd: list[str], description: str):
+    """Выводит заголовок этапа проверки."""
     print(f"\n{'=' * 100}")
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}")
-    print("=" * 100)
+    print("=" * 100, flush=True)
 
+
+def start_command(cmd: list[str]) -> subprocess.Popen | None:
+    """
+    Запускает команду в фоне, не дожидаясь завершения.
+
+    stderr объединяется со stdout, чтобы вывод читался одним потоком
+    и не было взаимной блокировки на двух каналах.
+
+    Args:
+        cmd: Команда для запуска (список аргументов)
+
+    Returns:
+        Запущенный процесс или None, если запустить не удалось
+    """
     try:
-        result = subprocess.run(
+        return subprocess.Popen(
             cmd,
             cwd=project_root,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=False,
+            bufsize=1,
         )
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
-        return result.returncode, result.stdout
     except Exception as e:
         print(f"Error running command: {e}", file=sys.stderr)
+        return None
+
+
+def stream_command(
+    process: subprocess.Popen | None, cmd: list[str], description: str, keep_output: bool
+) -> tuple[int, str]:
+    """
+    Печатает вывод запущенной команды по мере поступления и ждет её завершения.
+
+    Args:
+        process: Процесс из start_command (None - запуск не удался)
+        cmd: Команда (список аргументов)
+        description: Описание команды для вывода
+        keep_output: Накапливать вывод для вызывающего кода
+
+    Returns:
+        Tuple[exit_code, stdout]: код выхода и вывод команды ("" если не накапливался)
+    """
+    print_command_header(cmd, description)
+
+    if process is None:
         return 1, ""
 
+    lines = []
+    for line in process.stdout:
+        sys.stdout.write(line)
+        if keep_output:
+            lines.append(line)
+    process.stdout.close()
+    sys.stdout.flush()
+
+    return process.wait(), "".join(lines)
+
 
 def parse_pipeline_metrics(stdout: str) -> dict:
     """
-    Парсит метрики из вывода pipeline_dry_run_report.py.
+    Читает метрики из вывода pipeline_dry_run_report.py.
+
+    Отчет печатает метрики JSON-строкой после METRICS_JSON_MARKER; здесь они
+    разворачиваются в плоские ключи (total_loaded, accept_loaded, ...),
+    которые ожидают gate conditions.
 
     Returns:
         Dict с метриками или пустой dict если не удалось распарсить
     """
-    metrics = {}
-    lines = stdout.split("\n")
-
-    # Парсим TOTALS
-    i = 0
-    while i < len(lines):
-        if "TOTALS:" in lines[i]:
-            i += 1
-            # Следующие строки должны быть метриками
-            while i < len(lines) and (
-                "Loaded" in lines[i] or "Filtered" in lines[i] or "Passed" in lines[i]
-            ):
-                line = lines[i]
-                if "Loaded" in line:
-                    match = re.search(r"Loaded\s+:\s*(\d+)", line)
-                    if match:
-                        metrics["total_loaded"] = int(match.group(1))
-                elif "Filtered out" in line:
-                    match = re.search(r"Filtered out\s+:\s*(\d+)", line)
-                    if match:
-                        metrics["filtered_out"] = int(match.group(1))
-                elif "Passed filter" in line:
-                    match = re.search(r"Passed filter\s+:\s*(\d+)", line)
-                    if match:
-                        metrics["passed_filter"] = int(match.group(1))
-                elif "Passed threshold" in line:
-                    match = re.search(r"Passed threshold:\s*(\d+)", line)
-                    if match:
-                        metrics["passed_threshold"] = int(match.group(1))
-                i += 1
-            break
-        i += 1
-
-    # Парсим PER-LABEL BREAKDOWN
-    # Ищем секцию PER-LABEL BREAKDOWN
-    per_label_start = stdout.find("PER-LABEL BREAKDOWN:")
-    if per_label_start != -1:
-        # Находим конец секции (следующая секция с ===)
-        per_label_end = stdout.find("\n" + "=" * 100, per_label_start)
-        if per_label_end == -1:
-            per_label_end = len(stdout)
-        per_label_section = stdout[per_label_start:per_label_end]
-        per_label_lines = per_label_section.split("\n")
-
-        # Для каждого label ищем его блок
-        for label in ["accept", "reject", "borderline"]:
-            # Ищем строку с label в секции PER-LABEL
-            label_line_idx = None
-            for i, line in enumerate(per_label_lines):
-                # Ищем строку вида "  accept    :" или "  borderline:" и т.д.
-                # Используем более гибкий паттерн
-                if re.search(rf"^\s+{label}\s*:\s*$", line):
-                    label_line_idx = i
-                    break
-
-            if label_line_idx is not None:
-                # Парсим следующие строки с отступом (метрики)
-                # Берём строки до следующего label или до конца секции
-                for i in range(label_line_idx + 1, min(label_line_idx + 10, len(per_label_lines))):
-                    line = per_label_lines[i]
-                    # Если встретили следующий label - останавливаемся
-                    if line.strip():
-                        # Проверяем, не начало ли это следующего label
-                        if any(
-                            re.search(rf"^\s+{other_label}\s*:\s*$", line)
-                            for other_label in ["accept", "reject", "borderline"]
-                            if other_label != label
-                        ):
-                            break
-                    # Парсим метрики (только строки с отступом)
-                    if line.startswith(" ") and line.strip():
-                        if "Loaded" in line and ":" in line:
-                            match = re.search(r"Loaded\s+:\s*(\d+)", line)
-                            if match:
-                                metrics[f"{label}_loaded"] = int(match.group(1))
-                        elif "Filtered" in line and ":" in line:
-                            match = re.search(r"Filtered\s+:\s*(\d+)", line)
-                            if match:
-                                metrics[f"{label}_filtered"] = int(match.group(1))
-                        elif "Passed filter" in line:
-                            match = re.search(r"Passed filter\s+:\s*(\d+)", line)
-                            if match:
-                                metrics[f"{label}_passed_filter"] = int(match.group(1))
-                        elif "Passed threshold" in line:
-                            match = re.search(r"Passed threshold:\s*(\d+)", line)
-                            if match:
-                                metrics[f"{label}_passed_threshold"] = int(match.group(1))
+    marker_pos = stdout.rfind(METRICS_JSON_MARKER)
+    if marker_pos == -1:
+        return {}
+
+    json_line = stdout[marker_pos + len(METRICS_JSON_MARKER) :].lstrip().split("\n", 1)[0]
+    try:
+        stats = json.loads(json_line)
+    except ValueError:
+        return {}
+
+    metrics = {
+        "total_loaded": stats["loaded"],
+        "filtered_out": stats["filtered_out"],
+        "passed_filter": stats["passed_filter"],
+        "passed_threshold": stats["passed_threshold"],
+    }
+    for label, label_stats in stats["per_label"].items():
+        for key, value in label_stats.items():
+            metrics[f"{label}_{key}"] = value
 
     return metrics
 
@@ -204,96 +255,135 @@ def check_gate_conditions(metrics: dict) -> tuple[list[str], list[str]]:
 
 
 def print_readiness_report(metrics: dict, hard_failures: list[str], warnings: list[str]):
-    """Выводит отчёт о готовности."""
-    print("\n" + "=" * 100)
-    print("READINESS METRICS")
-    print("=" * 100)
-
-    print("\nPipeline Metrics:")
-    print(f"  Total Loaded      : {metrics.get('total_loaded', 'N/A')}")
-    print(f"  Filtered out      : {metrics.get('filtered_out', 'N/A')}")
-    print(f"  Passed filter     : {metrics.get('passed_filter', 'N/A')}")
-    print(f"  Passed threshold  : {metrics.get('passed_threshold', 'N/A')}")
-
-    print("\nPer-Label Metrics:")
+    """Выводит отчёт о готовности (одной записью в stdout)."""
+    out = []
+    out.append("\n" + "=" * 100)
+    out.append("READINESS METRICS")
+    out.append("=" * 100)
+
+    out.append("\nPipeline Metrics:")
+    out.append(f"  Total Loaded      : {metrics.get('total_loaded', 'N/A')}")
+    out.append(f"  Filtered out      : {metrics.get('filtered_out', 'N/A')}")
+    out.append(f"  Passed filter     : {metrics.get('passed_filter', 'N/A')}")
+    out.append(f"  Passed threshold  : {metrics.get('passed_threshold', 'N/A')}")
+
+    out.append("\nPer-Label Metrics:")
     for label in ["accept", "reject", "borderline"]:
         loaded = metrics.get(f"{label}_loaded", 0)
         filtered = metrics.get(f"{label}_filtered", 0)
         passed_filter = metrics.get(f"{label}_passed_filter", 0)
         passed_threshold = metrics.get(f"{label}_passed_threshold", 0)
-        print(f"  {label:10}:")
-        print(f"    Loaded          : {loaded}")
-        print(f"    Filtered        : {filtered}")
-        print(f"    Passed filter   : {passed_filter}")
-        print(f"    Passed threshold: {passed_threshold}")
-
-    print("\n" + "=" * 100)
-    print("GATE CONDITIONS")
-    print("=" * 100)
+        out.append(f"  {label:10}:")
+        out.append(f"    Loaded          : {loaded}")
+        out.append(f"    Filtered        : {filtered}")
+        out.append(f"    Passed filter   : {passed_filter}")
+        out.append(f"    Passed threshold: {passed_threshold}")
+
+    out.append("\n" + "=" * 100)
+    out.append("GATE CONDITIONS")
+    out.append("=" * 100)
 
     if hard_failures:
-        print("\n[FAIL] HARD FAILURES (must fix):")
+        out.append("\n[FAIL] HARD FAILURES (must fix):")
         for failure in hard_failures:
-            print(f"  - {failure}")
+            out.append(f"  - {failure}")
     else:
-        print("\n[PASS] All hard conditions passed")
+        out.append("\n[PASS] All hard conditions passed")
 
     if warnings:
-        print("\n[WARN] WARNINGS (soft conditions):")
+        out.append("\n[WARN] WARNINGS (soft conditions):")
         for warning in warnings:
-            print(f"  - {warning}")
+            out.append(f"  - {warning}")
     else:
-        print("\n[PASS] No warnings")
+        out.append("\n[PASS] No warnings")
 
-    print("\n" + "=" * 100)
-    print("FINAL STATUS")
-    print("=" * 100)
+    out.append("\n" + "=" * 100)
+    out.append("FINAL STATUS")
+    out.append("=" * 100)
 
     if hard_failures:
-        print("\n[FAIL] READY TO ENABLE SCHEDULER/PUBLISH: NO")
-        print("\nReasons:")
+        out.append("\n[FAIL] READY TO ENABLE SCHEDULER/PUBLISH: NO")
+        out.append("\nReasons:")
         for failure in hard_failures:
-            print(f"  - {failure}")
+            out.append(f"  - {failure}")
     else:
-        print("\n[PASS] READY TO ENABLE SCHEDULER/PUBLISH: YES")
+        out.append("\n[PASS] READY TO ENABLE SCHEDULER/PUBLISH: YES")
         if warnings:
-            print("\nNote: There are warnings, but they don't block release.")
+            out.append("\nNote: There are warnings, but they don't block release.")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
     """Главная функция скрипта."""
+    parser = argparse.ArgumentParser(description="Final ready check - release gate")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run all checks, ignoring fingerprints of previous successful runs",
+    )
+    args = parser.parse_args()
+
     print("=" * 100)
     print("FINAL READY CHECK - RELEASE GATE")
     print("=" * 100)
 
-    # A) Ruff check
-    exit_code, _ = run_command(["ruff", "check", "."], "Ruff check")
-    if exit_code != 0:
-        print("\n[FAIL] Ruff check failed. Aborting.")
-        return 1
-
-    # B) Pytest
-    exit_code, _ = run_command(["pytest", "-q"], "Pytest")
-    if exit_code != 0:
-        print("\n[FAIL] Pytest failed. Aborting.")
-        return 1
-
-    # C) Scoring report
-    exit_code, scoring_stdout = run_command(
-        [sys.executable, "scripts/scoring_report.py"], "Scoring report"
-    )
-    if exit_code != 0:
-        print("\n[FAIL] Scoring report failed. Aborting.")
-        return 1
-
-    # D) Pipeline dry-run report
-    exit_code, pipeline_stdout = run_command(
-        [sys.executable, "scripts/pipeline_dry_run_report.py"],
-        "Pipeline dry-run report",
-    )
-    if exit_code != 0:
-        print("\n[FAIL] Pipeline dry-run report failed. Aborting.")
-        return 1
+    # Ruff и pytest пропускаются, если их входы не менялись с последнего
+    # успешного запуска
+    cache = {} if args.no_cache else load_cache()
+    # Результат pytest зависит и от интерпретатора: другой venv или версия
+    # Python - другие установленные пакеты
+    fingerprints = {
+        "ruff": fingerprint(collect_inputs(RUFF_INPUTS)),
+        "pytest": fingerprint(
+            collect_inputs(PYTEST_INPUTS, ("tests/fixtures",)),
+            (sys.version, sys.executable),
+        ),
+    }
+
+    # Проверки не зависят друг от друга, поэтому запускаются одновременно.
+    # Вывод печатается по мере поступления, по порядку проверок; накапливается
+    # только вывод pipeline report, из которого читаются метрики
+    checks = [
+        ("Ruff check", ["ruff", "check", "."], False, "ruff"),
+        ("Pytest", ["pytest", "-q"], False, "pytest"),
+        ("Scoring report", [sys.executable, "scripts/scoring_report.py"], False, None),
+        (
+            "Pipeline dry-run report",
+            [sys.executable, "scripts/pipeline_dry_run_report.py"],
+            True,
+            None,
+        ),
+    ]
+    skipped = {
+        cache_key
+        for _, _, _, cache_key in checks
+        if cache_key and cache.get(cache_key) == fingerprints[cache_key]
+    }
+    processes = [
+        None if cache_key in skipped else start_command(cmd) for _, cmd, _, cache_key in checks
+    ]
+
+    pipeline_stdout = ""
+    for (description, cmd, keep_output, cache_key), process in zip(checks, processes):
+        if cache_key in skipped:
+            print_command_header(cmd, description)
+            print("[SKIP cached] Inputs unchanged since the last successful run")
+            continue
+
+        exit_code, stdout = stream_command(process, cmd, description, keep_output)
+        if exit_code != 0:
+            print(f"\n[FAIL] {description} failed. Aborting.")
+            for pending in processes:
+                if pending is not None and pending.poll() is None:
+                    pending.kill()
+                    pending.wait()
+            return 1
+        if cache_key:
+            cache[cache_key] = fingerprints[cache_key]
+            save_cache(cache)
+        if keep_output:
+            pipeline_stdout = stdout
 
     # Парсим метрики из pipeline report
     metrics = parse_pipeline_metrics(pipeline_stdout)
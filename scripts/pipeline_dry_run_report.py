@@ -5,8 +5,12 @@ Offline pipeline dry-run report для проверки связки filtering +
 Проверяет полный пайплайн без подключения scheduler/telegram.
 """
 
+import heapq
 import json
+import os
 import sys
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -23,8 +27,9 @@ THRESHOLD = 5
 # Используем большой max_age_days для dry-run, чтобы не фильтровать по свежести
 MAX_AGE_DAYS = 2000
 
-# Детерминированные термины для filtering
-INCLUDE_TERMS = [
+# Детерминированные термины для filtering. Кортежи: is_relevant кэширует их
+# версии в нижнем регистре по самому кортежу, без копирования на каждый вызов
+INCLUDE_TERMS = (
     "geothermal",
     "thermal",
     "spring",
@@ -35,8 +40,17 @@ INCLUDE_TERMS = [
     "resort",
     "geochemical",
     "chemistry",
-]
-EXCLUDE_TERMS = ["сточные", "wastewater"]
+)
+EXCLUDE_TERMS = ("сточные", "wastewater")
+
+# Метки фикстур по префиксу имени файла (accept_*.json и т.д.)
+FIXTURE_LABELS = frozenset({"accept", "reject", "borderline"})
+
+# Ключ сортировки кандидатов очереди
+CANDIDATE_SCORE = itemgetter("score")
+
+# Маркер строки с метриками в JSON (читает scripts/final_ready_check.py)
+METRICS_JSON_MARKER = "=== METRICS_JSON ==="
 
 
 def load_fixture_file(filepath: Path) -> Tuple[str, dict, str]:
@@ -53,14 +67,8 @@ def load_fixture_file(filepath: Path) -> Tuple[str, dict, str]:
         data = json.load(f)
 
     filename = filepath.name
-    if filename.startswith("accept_"):
-        label = "accept"
-    elif filename.startswith("reject_"):
-        label = "reject"
-    elif filename.startswith("borderline_"):
-        label = "borderline"
-    else:
-        label = "unknown"
+    prefix = filename.partition("_")[0]
+    label = prefix if prefix in FIXTURE_LABELS else "unknown"
 
     return filename, data, label
 
@@ -84,21 +92,25 @@ def publication_from_dict(data: dict) -> Publication:
     )
 
 
-def apply_filtering(publication: Publication) -> Tuple[bool, str]:
+def apply_filtering(publication: Publication, now: datetime) -> Tuple[bool, str]:
     """
     Применяет filtering к публикации.
 
+    Args:
+        publication: Публикация
+        now: Текущее время (одно на весь прогон)
+
     Returns:
         Tuple[passed, reason]: прошла ли фильтрацию и причина
     """
-    # Проверка релевантности
+    # Порядок проверок тот же, что в run_scheduler: сначала дешевая проверка
+    # свежести, затем поиск терминов по тексту
+    if not is_fresh(publication, MAX_AGE_DAYS, now):
+        return False, "not_fresh"
+
     if not is_relevant(publication, INCLUDE_TERMS, EXCLUDE_TERMS):
         return False, "not_relevant"
 
-    # Проверка свежести
-    if not is_fresh(publication, MAX_AGE_DAYS):
-        return False, "not_fresh"
-
     return True, "passed"
 
 
@@ -128,23 +140,28 @@ def process_pipeline(results: List[Dict]) -> Dict:
         "candidates": [],
     }
 
+    # Даты разбирает кэширующий parse_date; "сейчас" берется один раз на прогон
+    now = datetime.now()
+
     for item in results:
         filename = item["filename"]
         label = item["label"]
         publication = item["publication"]
 
-        stats["per_label"][label]["loaded"] += 1
+        # Счетчики метки: один поиск во вложенном dict на публикацию
+        label_stats = stats["per_label"][label]
+        label_stats["loaded"] += 1
 
         # Filtering
-        passed_filter, filter_reason = apply_filtering(publication)
+        passed_filter, filter_reason = apply_filtering(publication, now)
         if not passed_filter:
             stats["filtered_out"] += 1
             stats["filter_reasons"][filter_reason] += 1
-            stats["per_label"][label]["filtered"] += 1
+            label_stats["filtered"] += 1
             continue
 
         stats["passed_filter"] += 1
-        stats["per_label"][label]["passed_filter"] += 1
+        label_stats["passed_filter"] += 1
 
         # Scoring
         score_result = score_publication(publication)
@@ -152,7 +169,7 @@ def process_pipeline(results: List[Dict]) -> Dict:
         # Threshold check
         if score_result.score >= THRESHOLD:
             stats["passed_threshold"] += 1
-            stats["per_label"][label]["passed_threshold"] += 1
+            label_stats["passed_threshold"] += 1
             stats["candidates"].append(
                 {
                     "filename": filename,
@@ -163,50 +180,50 @@ def process_pipeline(results: List[Dict]) -> Dict:
                 }
             )
 
-    # Сортируем кандидатов по score desc
-    stats["candidates"].sort(key=lambda x: x["score"], reverse=True)
-
     return stats
 
 
 def print_report(stats: Dict):
-    """Выводит отчет."""
-    print("\n" + "=" * 100)
-    print("PIPELINE DRY-RUN REPORT")
-    print("=" * 100)
+    """Выводит отчет (строки собираются в список и пишутся в stdout одним вызовом)."""
+    out = []
+    out.append("\n" + "=" * 100)
+    out.append("PIPELINE DRY-RUN REPORT")
+    out.append("=" * 100)
 
     # Totals
-    print("\nTOTALS:")
-    print(f"  Loaded          : {stats['loaded']:3}")
-    print(f"  Filtered out    : {stats['filtered_out']:3}")
-    print(f"  Passed filter   : {stats['passed_filter']:3}")
-    print(f"  Passed threshold: {stats['passed_threshold']:3}")
+    out.append("\nTOTALS:")
+    out.append(f"  Loaded          : {stats['loaded']:3}")
+    out.append(f"  Filtered out    : {stats['filtered_out']:3}")
+    out.append(f"  Passed filter   : {stats['passed_filter']:3}")
+    out.append(f"  Passed threshold: {stats['passed_threshold']:3}")
 
     # Filter reasons
-    print("\nFILTER REASONS:")
+    out.append("\nFILTER REASONS:")
     for reason, count in stats["filter_reasons"].items():
-        print(f"  {reason:15}: {count:3}")
+        out.append(f"  {reason:15}: {count:3}")
 
     # Per-label breakdown
-    print("\nPER-LABEL BREAKDOWN:")
+    out.append("\nPER-LABEL BREAKDOWN:")
     for label in ["accept", "reject", "borderline"]:
         label_stats = stats["per_label"][label]
-        print(f"  {label:10}:")
-        print(f"    Loaded          : {label_stats['loaded']:3}")
-        print(f"    Filtered        : {label_stats['filtered']:3}")
-        print(f"    Passed filter   : {label_stats['passed_filter']:3}")
-        print(f"    Passed threshold: {label_stats['passed_threshold']:3}")
+        out.append(f"  {label:10}:")
+        out.append(f"    Loaded          : {label_stats['loaded']:3}")
+        out.append(f"    Filtered        : {label_stats['filtered']:3}")
+        out.append(f"    Passed filter   : {label_stats['passed_filter']:3}")
+        out.append(f"    Passed threshold: {label_stats['passed_threshold']:3}")
 
     # Top candidates
-    print("\n" + "=" * 100)
-    print("TOP-10 QUEUE CANDIDATES (sorted by score desc)")
-    print("=" * 100)
-    print(f"{'Rank':<5} | {'Filename':<40} | {'Label':<10} | {'Score':>5}")
-    print("-" * 100)
-
-    top_candidates = stats["candidates"][:10]
+    out.append("\n" + "=" * 100)
+    out.append("TOP-10 QUEUE CANDIDATES (sorted by score desc)")
+    out.append("=" * 100)
+    out.append(f"{'Rank':<5} | {'Filename':<40} | {'Label':<10} | {'Score':>5}")
+    out.append("-" * 100)
+
+    # Нужны только 10 лучших: частичная выборка вместо полной сортировки
+    # (порядок при равном score тот же, что у sorted(..., reverse=True))
+    top_candidates = heapq.nlargest(10, stats["candidates"], key=CANDIDATE_SCORE)
     if not top_candidates:
-        print("  (no candidates)")
+        out.append("  (no candidates)")
     else:
         for rank, candidate in enumerate(top_candidates, 1):
             filename_short = (
@@ -214,12 +231,35 @@ def print_report(stats: Dict):
                 if len(candidate["filename"]) > 40
                 else candidate["filename"]
             )
-            print(
+            out.append(
                 f"{rank:<5} | {filename_short:<40} | "
                 f"{candidate['label']:<10} | {candidate['score']:>5}"
             )
 
-    print("=" * 100)
+    out.append("=" * 100)
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def print_metrics_json(stats: Dict):
+    """
+    Выводит метрики одной JSON-строкой после маркера METRICS_JSON_MARKER.
+
+    final_ready_check.py читает эту строку вместо разбора текстового отчета.
+    """
+    metrics = {
+        key: stats[key]
+        for key in (
+            "loaded",
+            "filtered_out",
+            "passed_filter",
+            "passed_threshold",
+            "filter_reasons",
+            "per_label",
+        )
+    }
+    print(METRICS_JSON_MARKER)
+    print(json.dumps(metrics, ensure_ascii=False))
 
 
 def main():
@@ -233,16 +273,19 @@ def main():
 
     # Загружаем все фикстуры
     results = []
-    for json_file in sorted(fixtures_dir.glob("*.json")):
-        filename, data, label = load_fixture_file(json_file)
+    with os.scandir(fixtures_dir) as entries:
+        fixture_paths = sorted(entry.path for entry in entries if entry.name.endswith(".json"))
+    for fixture_path in fixture_paths:
+        filename, data, label = load_fixture_file(Path(fixture_path))
         publication = publication_from_dict(data)
         results.append({"filename": filename, "label": label, "publication": publication})
 
     # Обрабатываем через пайплайн
     stats = process_pipeline(results)
 
-    # Выводим отчет
+    # Выводим отчет и машиночитаемые метрики
     print_report(stats)
+    print_metrics_json(stats)
 
     return 0
 
@@ -5,12 +5,16 @@ Production-safe scheduler для запуска RefreshService.
 Запускает refresh job каждые N часов с логированием и graceful shutdown.
 """
 
+import gc
 import logging
 import os
 import signal
 import sys
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial, wraps
 from pathlib import Path
 from typing import Callable
 
@@ -29,6 +33,9 @@ from apscheduler.triggers.interval import IntervalTrigger  # noqa: E402
 from src.geotherm_bot.adapters.eurasia_discovery.provider import (  # noqa: E402
     EurasiaDiscoveryProvider,
 )
+from src.geotherm_bot.adapters.storage.sqlite_pool import (  # noqa: E402
+    ConnectionPool,
+)
 from src.geotherm_bot.adapters.storage.sqlite_queue import (  # noqa: E402
     SQLiteContentQueue,
 )
@@ -54,8 +61,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Конфигурация из env
-REFRESH_EVERY_HOURS = int(os.getenv("REFRESH_EVERY_HOURS", "6"))
+# Значения env, которые parse_bool считает истинными
+TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
 
 
 def parse_bool(value: str | None) -> bool:
@@ -67,8 +74,7 @@ def parse_bool(value: str | None) -> bool:
     """
     if not value:
         return False
-    normalized = value.strip().lower()
-    return normalized in ("1", "true", "yes", "y", "on")
+    return value.strip().lower() in TRUE_VALUES
 
 
 # Для обратной совместимости
@@ -77,21 +83,54 @@ def parse_run_once(value: str | None) -> bool:
     return parse_bool(value)
 
 
-RUN_ONCE_RAW = os.getenv("RUN_ONCE")
-RUN_ONCE = parse_bool(RUN_ONCE_RAW)
-DB_PATH = os.getenv("DB_PATH", "db/geotherm.db")
-CHAT_ID = int(os.getenv("CHAT_ID", "1"))
-MAX_AGE_DAYS = int(os.getenv("MAX_AGE_DAYS", "120"))
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Конфигурация scheduler из env (читается один раз при импорте)."""
+
+    refresh_every_hours: int
+    run_once_raw: str | None
+    run_once: bool
+    db_path: str
+    # Соединений только для чтения в пуле SQLite (плюс одно на запись)
+    sqlite_pool_readers: int
+    chat_id: int
+    max_age_days: int
+    # Publish configuration
+    publish_every_hours: int
+    enable_publish: bool
+    publish_dry_run: bool
+    publish_max_items: int
+    enable_publish_apply: bool
+    publish_assert_invariants: bool
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Собирает конфигурацию из переменных окружения."""
+        run_once_raw = os.getenv("RUN_ONCE")
+        return cls(
+            refresh_every_hours=int(os.getenv("REFRESH_EVERY_HOURS", "6")),
+            run_once_raw=run_once_raw,
+            run_once=parse_bool(run_once_raw),
+            db_path=os.getenv("DB_PATH", "db/geotherm.db"),
+            sqlite_pool_readers=int(os.getenv("SQLITE_POOL_READERS", "2")),
+            chat_id=int(os.getenv("CHAT_ID", "1")),
+            max_age_days=int(os.getenv("MAX_AGE_DAYS", "120")),
+            publish_every_hours=int(os.getenv("PUBLISH_EVERY_HOURS", "3")),
+            enable_publish=parse_bool(os.getenv("ENABLE_PUBLISH")),
+            publish_dry_run=parse_bool(os.getenv("PUBLISH_DRY_RUN", "1")),  # default True
+            publish_max_items=int(os.getenv("PUBLISH_MAX_ITEMS", "1")),
+            enable_publish_apply=parse_bool(os.getenv("ENABLE_PUBLISH_APPLY", "0")),
+            publish_assert_invariants=parse_bool(os.getenv("PUBLISH_ASSERT_INVARIANTS", "0")),
+        )
 
-# Publish configuration
-PUBLISH_EVERY_HOURS = int(os.getenv("PUBLISH_EVERY_HOURS", "3"))
-ENABLE_PUBLISH = parse_bool(os.getenv("ENABLE_PUBLISH"))
-PUBLISH_DRY_RUN = parse_bool(os.getenv("PUBLISH_DRY_RUN", "1"))  # default True
-PUBLISH_MAX_ITEMS = int(os.getenv("PUBLISH_MAX_ITEMS", "1"))
-ENABLE_PUBLISH_APPLY = parse_bool(os.getenv("ENABLE_PUBLISH_APPLY", "0"))
 
-# Термины для фильтрации (из config.py или env)
-INCLUDE_TERMS = [
+# Конфигурация из env
+CONFIG = Config.from_env()
+
+# Термины для фильтрации (из config.py или env). Кортежи, как в
+# pipeline_dry_run_report: is_relevant кэширует их версии в нижнем регистре
+# по самому кортежу, без копирования списка на каждый вызов
+INCLUDE_TERMS = (
     "geothermal",
     "thermal",
     "spring",
@@ -102,26 +141,52 @@ INCLUDE_TERMS = [
     "resort",
     "geochemical",
     "chemistry",
-]
-EXCLUDE_TERMS = ["сточные", "wastewater"]
+)
+EXCLUDE_TERMS = ("сточные", "wastewater")
+
+
+@dataclass(slots=True)
+class SchedulerState:
+    """Общее состояние процесса scheduler для graceful shutdown."""
+
+    scheduler: BlockingScheduler | None = None
+    # Установлено после получения сигнала: новые запуски job пропускаются
+    shutdown: threading.Event = field(default_factory=threading.Event)
+    # Счетчик выполняющихся job; jobs_idle установлено, пока ни одна job не идет
+    # (signal_handler ждет его одним wait вместо опроса раз в секунду)
+    running_jobs: int = 0
+    jobs_lock: threading.Lock = field(default_factory=threading.Lock)
+    jobs_idle: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self):
+        """Изначально ни одна job не выполняется."""
+        self.jobs_idle.set()
 
-# Глобальные переменные для graceful shutdown
-scheduler = None
-shutdown_requested = False
-current_job_running = False
 
+STATE = SchedulerState()
 
-def create_filtering_function() -> Callable[[Publication], FilterDecision]:
+# Хранилища и RefreshService создаются один раз на процесс и переиспользуются
+# всеми тиками (init() схемы не повторяется на каждом запуске job)
+connection_pool: ConnectionPool | None = None
+topic_registry: SQLiteTopicRegistry | None = None
+content_queue: SQLiteContentQueue | None = None
+_refresh_service: RefreshService | None = None
+_storage_lock = threading.Lock()
+_refresh_service_lock = threading.Lock()
+
+
+def create_filtering_function(max_age_days: int) -> Callable[[Publication], FilterDecision]:
     """Создает функцию фильтрации на основе domain логики."""
 
     def filtering(pub: Publication) -> FilterDecision:
         """Функция фильтрации для RefreshService."""
+        # Сначала дешевая проверка даты (parse_date кэшируется), затем поиск терминов
+        if not is_fresh(pub, max_age_days):
+            return FilterDecision(passed=False, reasons=["not_fresh"])
+
         if not is_relevant(pub, INCLUDE_TERMS, EXCLUDE_TERMS):
             return FilterDecision(passed=False, reasons=["not_relevant"])
 
-        if not is_fresh(pub, MAX_AGE_DAYS):
-            return FilterDecision(passed=False, reasons=["not_fresh"])
-
         return FilterDecision(passed=True, reasons=[])
 
     return filtering
@@ -129,22 +194,53 @@ def create_filtering_function() -> Callable[[Publication], FilterDecision]:
 
 def create_scoring_function() -> Callable[[Publication], ScoreResult]:
     """Создает функцию скоринга на основе domain логики."""
+    # score_publication уже имеет нужную сигнатуру: обертка-замыкание была бы
+    # лишним Python-вызовом на каждую публикацию
+    return score_publication
+
 
-    def scoring(pub: Publication) -> ScoreResult:
-        """Функция скоринга для RefreshService."""
-        return score_publication(pub)
+def init_storage(cfg: Config = CONFIG) -> tuple[SQLiteTopicRegistry, SQLiteContentQueue]:
+    """
+    Возвращает общие хранилища топиков и очереди, инициализируя их при первом вызове.
 
-    return scoring
+    Args:
+        cfg: Конфигурация scheduler (используется при первом вызове)
 
+    Returns:
+        tuple[SQLiteTopicRegistry, SQLiteContentQueue]: (topic_registry, content_queue)
+    """
+    global connection_pool, topic_registry, content_queue
 
-def create_refresh_service() -> RefreshService:
-    """Создает и инициализирует RefreshService с зависимостями."""
-    # Инициализация БД
-    topic_registry = SQLiteTopicRegistry(db_path=DB_PATH)
-    topic_registry.init()
+    with _storage_lock:
+        if topic_registry is None or content_queue is None:
+            # Общий пул: соединения не открываются заново на каждый вызов и тик
+            pool = ConnectionPool(cfg.db_path, readers=cfg.sqlite_pool_readers)
 
-    content_queue = SQLiteContentQueue(db_path=DB_PATH)
-    content_queue.init()
+            registry = SQLiteTopicRegistry(db_path=cfg.db_path, pool=pool)
+            registry.init()
+
+            queue = SQLiteContentQueue(db_path=cfg.db_path, pool=pool)
+            queue.init()
+
+            # WAL + PRAGMA производительности (DB_PATH должен быть на локальной ФС)
+            journal_mode = registry.tune()
+            queue.tune()
+            logger.info(f"SQLite journal_mode: {journal_mode}")
+
+            connection_pool, topic_registry, content_queue = pool, registry, queue
+
+    return topic_registry, content_queue
+
+
+def close_storage() -> None:
+    """Закрывает соединения пула SQLite (при остановке процесса)."""
+    if connection_pool is not None:
+        connection_pool.close()
+
+
+def create_refresh_service(cfg: Config = CONFIG) -> RefreshService:
+    """Создает RefreshService с зависимостями (хранилища берутся из init_storage)."""
+    topic_registry, content_queue = init_storage(cfg)
 
     # Инициализация компонентов
     region_resolver = RegionResolver()
@@ -156,7 +252,7 @@ def create_refresh_service() -> RefreshService:
     logger.info("Using EurasiaDiscoveryProvider")
 
     # Функции фильтрации и скоринга
-    filtering = create_filtering_function()
+    filtering = create_filtering_function(cfg.max_age_days)
     scoring = create_scoring_function()
 
     return RefreshService(
@@ -170,30 +266,66 @@ def create_refresh_service() -> RefreshService:
     )
 
 
-def run_refresh_job():
-    """Запускает refresh job с логированием."""
-    global current_job_running, shutdown_requested
+def get_refresh_service(cfg: Config = CONFIG) -> RefreshService:
+    """Возвращает общий RefreshService, создавая его при первом вызове."""
+    global _refresh_service
+
+    with _refresh_service_lock:
+        if _refresh_service is None:
+            _refresh_service = create_refresh_service(cfg)
+
+    return _refresh_service
+
+
+def tracks_running_job(job: Callable) -> Callable:
+    """
+    Декоратор: отмечает job как выполняющуюся на время вызова.
+
+    Args:
+        job: Функция job (run_refresh_job, run_publish_tick)
+
+    Returns:
+        Callable: Обернутая функция
+    """
+
+    @wraps(job)
+    def wrapper(*args, **kwargs):
+        with STATE.jobs_lock:
+            STATE.running_jobs += 1
+            STATE.jobs_idle.clear()
+        try:
+            return job(*args, **kwargs)
+        finally:
+            with STATE.jobs_lock:
+                STATE.running_jobs -= 1
+                if STATE.running_jobs == 0:
+                    STATE.jobs_idle.set()
+
+    return wrapper
+
 
-    if shutdown_requested:
+@tracks_running_job
+def run_refresh_job(cfg: Config = CONFIG):
+    """Запускает refresh job с логированием."""
+    if STATE.shutdown.is_set():
         logger.info("Shutdown requested, skipping refresh job")
         return
 
-    current_job_running = True
     start_time = time.time()
 
     try:
         logger.info(
-            f"Starting refresh job (interval={REFRESH_EVERY_HOURS}h, "
-            f"run_once={RUN_ONCE}, max_age_days={MAX_AGE_DAYS})"
+            f"Starting refresh job (interval={cfg.refresh_every_hours}h, "
+            f"run_once={cfg.run_once}, max_age_days={cfg.max_age_days})"
         )
 
-        refresh_service = create_refresh_service()
+        refresh_service = get_refresh_service(cfg)
         now = datetime.now(timezone.utc)
 
         # Запускаем refresh
         # Оборачиваем в try-except для обработки возможных ошибок провайдера
         try:
-            stats = refresh_service.refresh_queue_for_chat(chat_id=CHAT_ID, now=now)
+            stats = refresh_service.refresh_queue_for_chat(chat_id=cfg.chat_id, now=now)
         except NotImplementedError as e:
             # EuropePMC может бросать NotImplementedError
             logger.warning(
@@ -221,46 +353,58 @@ def run_refresh_job():
     except Exception as e:
         duration = time.time() - start_time
         logger.error(f"Refresh job failed after {duration:.2f}s: {e}", exc_info=True)
-    finally:
-        current_job_running = False
 
 
-def run_publish_tick():
-    """Запускает publish tick: dry-run (Phase 1) или apply (Phase 2)."""
-    global shutdown_requested
+def log_publish_item(header: str, topic, item) -> None:
+    """
+    Логирует элемент публикации одной многострочной записью.
+
+    Одна запись вместо отдельного logger.info на каждое поле: один LogRecord,
+    одна блокировка обработчика и одна запись в поток.
+
+    Args:
+        header: Первая строка записи (например, "DRY RUN: would publish item")
+        topic: Топик, в который публикуется элемент
+        item: Элемент очереди
+    """
+    fmt = "%s\n  chat_id: %s\n  thread_id: %s\n  external_id: %s\n  score: %s"
+    args = [header, topic.chat_id, topic.message_thread_id, item.external_id, item.score]
+    if item.title:
+        fmt += "\n  title: %s"
+        args.append(item.title)
+    logger.info(fmt, *args)
+
 
-    if shutdown_requested:
+@tracks_running_job
+def run_publish_tick(cfg: Config = CONFIG):
+    """Запускает publish tick: dry-run (Phase 1) или apply (Phase 2)."""
+    if STATE.shutdown.is_set():
         logger.info("Shutdown requested, skipping publish tick")
         return
 
     start_time = time.time()
-    timestamp = datetime.now(timezone.utc).isoformat()
+    # Одно "сейчас" на весь тик: и для лога, и для posted_at/last_post_at
     now_utc = datetime.now(timezone.utc)
 
     try:
         logger.info(
-            f"Starting publish tick (dry_run={PUBLISH_DRY_RUN}, "
-            f"max_items={PUBLISH_MAX_ITEMS}) at {timestamp}"
+            f"Starting publish tick (dry_run={cfg.publish_dry_run}, "
+            f"max_items={cfg.publish_max_items}) at {now_utc.isoformat()}"
         )
 
-        # Инициализация БД
-        topic_registry = SQLiteTopicRegistry(db_path=DB_PATH)
-        topic_registry.init()
-
-        content_queue = SQLiteContentQueue(db_path=DB_PATH)
-        content_queue.init()
-
-        # Получаем список enabled топиков
-        topics = topic_registry.list_topics(chat_id=CHAT_ID, enabled_only=True)
+        # Общие хранилища (инициализированы один раз в main)
+        topic_registry, content_queue = init_storage(cfg)
 
-        # Фильтруем топики с новыми элементами и сохраняем count_new ДО
+        # Кандидаты: enabled топики с новыми элементами в порядке fairness
+        # (NULL last_post_at первыми, затем по last_post_at ASC, затем по created_at ASC).
+        # Сортировка и LIMIT выполняются в SQLite, count_new ДО приходит тем же запросом
         candidates = []
         counts_before = {}
-        for topic in topics:
-            count = content_queue.count_new(topic.id)
-            if count > 0:
-                candidates.append(topic)
-                counts_before[topic.id] = count
+        for topic, count in topic_registry.list_topics_with_new_ordered(
+            chat_id=cfg.chat_id, limit=cfg.publish_max_items
+        ):
+            candidates.append(topic)
+            counts_before[topic.id] = count
 
         if not candidates:
             logger.info("No eligible items: no topics with new items")
@@ -268,79 +412,51 @@ def run_publish_tick():
             logger.info(f"Publish tick completed in {duration:.2f}s")
             return
 
-        # Сортируем по fairness: NULL last_post_at первыми,
-        # затем по last_post_at ASC, затем по created_at ASC
-        epoch_utc = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        candidates.sort(
-            key=lambda t: (
-                t.last_post_at is not None,  # False (None) первыми
-                t.last_post_at or epoch_utc,  # Затем по времени
-                t.created_at,  # Затем по created_at
-            )
-        )
-
-        if PUBLISH_DRY_RUN:
-            # Phase 1: Dry-run mode (read-only, invariants, smoke check)
+        if cfg.publish_dry_run:
+            # Phase 1: Dry-run mode (read-only; smoke check по PUBLISH_ASSERT_INVARIANTS)
             items_logged = 0
             for topic in candidates:
-                if items_logged >= PUBLISH_MAX_ITEMS:
+                if items_logged >= cfg.publish_max_items:
                     break
 
-                # Проверяем count_new ДО peek_best_new
-                before_count = content_queue.count_new(topic.id)
-                # Получаем лучший элемент (read-only, не меняет БД)
+                # Получаем лучший элемент: peek_best_new читает через соединение
+                # mode=ro, поэтому изменить БД он не может
                 item = content_queue.peek_best_new(topic.id)
-                # Проверяем count_new ПОСЛЕ peek_best_new
-                after_count = content_queue.count_new(topic.id)
 
                 if item is None:
                     continue
 
-                # Верификация: count_new не должен измениться
-                if before_count != after_count:
-                    logger.error(
-                        f"Dry-run invariant violated: count_new changed! "
-                        f"topic_id={topic.id} before={before_count} "
-                        f"after={after_count}"
-                    )
-                else:
-                    logger.info(
-                        f"Dry-run verified: no DB mutation (topic_id={topic.id}, "
-                        f"count={before_count})"
-                    )
-
                 items_logged += 1
-                logger.info("DRY RUN: would publish item")
-                logger.info(f"  chat_id: {topic.chat_id}")
-                logger.info(f"  thread_id: {topic.message_thread_id}")
-                logger.info(f"  external_id: {item.external_id}")
-                logger.info(f"  score: {item.score}")
-                if item.title:
-                    logger.info(f"  title: {item.title}")
+                log_publish_item("DRY RUN: would publish item", topic, item)
 
             if items_logged == 0:
                 logger.info("No eligible items: no items found in candidates")
 
-            # Smoke-проверка: count_new не должен измениться
-            smoke_passed = True
-            for topic_id, count_before in counts_before.items():
-                count_after = content_queue.count_new(topic_id)
-                if count_before != count_after:
-                    smoke_passed = False
-                    logger.warning(
-                        f"SMOKE CHECK FAILED: topic_id={topic_id} "
-                        f"count changed from {count_before} to {count_after}"
-                    )
-            if smoke_passed:
-                logger.info("SMOKE CHECK PASSED: all topic counts unchanged")
+            # Smoke-проверка: count_new не должен измениться. Неизменность уже
+            # гарантирует read-only соединение, поэтому повторное чтение счетчиков
+            # выполняется только по явному запросу
+            if cfg.publish_assert_invariants:
+                counts_after = content_queue.count_new_bulk(list(counts_before))
+                smoke_passed = True
+                for topic_id, count_before in counts_before.items():
+                    count_after = counts_after[topic_id]
+                    if count_before != count_after:
+                        smoke_passed = False
+                        logger.warning(
+                            f"SMOKE CHECK FAILED: topic_id={topic_id} "
+                            f"count changed from {count_before} to {count_after}"
+                        )
+                if smoke_passed:
+                    logger.info("SMOKE CHECK PASSED: all topic counts unchanged")
         else:
             # Phase 2: Apply mode (DB mutations)
             items_posted = 0
             for topic in candidates:
-                if items_posted >= PUBLISH_MAX_ITEMS:
+                if items_posted >= cfg.publish_max_items:
                     break
 
-                # Получаем count_new ДО claim
+                # count_new ДО claim перечитывается прямо перед захватом: снимок из
+                # начала тика устаревает, если refresh успел добавить элементы в топик
                 before_count = content_queue.count_new(topic.id)
                 # Атомарно захватываем лучший элемент
                 item = content_queue.claim_best_new(topic.id)
@@ -360,18 +476,13 @@ def run_publish_tick():
                 logger.info("CLAIMED item for publish (status=new->posting)")
 
                 # Логируем публикацию (без Telegram)
-                logger.info("PUBLISHED (no-telegram):")
-                logger.info(f"  chat_id: {topic.chat_id}")
-                logger.info(f"  thread_id: {topic.message_thread_id}")
-                logger.info(f"  external_id: {item.external_id}")
-                logger.info(f"  score: {item.score}")
-                if item.title:
-                    logger.info(f"  title: {item.title}")
-
-                # Применяем DB мутации
+                log_publish_item("PUBLISHED (no-telegram):", topic, item)
+
+                # Применяем DB мутации (status=posted и last_post_at одной транзакцией)
                 try:
-                    content_queue.mark_posted(item.id, posted_at=now_utc)
-                    topic_registry.touch_last_post(topic.id, now_utc)
+                    last_post_at = content_queue.mark_posted_and_touch_topic(
+                        item.id, topic.id, posted_at=now_utc
+                    )
                 except Exception as e:
                     logger.exception(f"Failed to mark_posted or touch_last_post: {e}")
                     # Автоматически освобождаем захват
@@ -394,35 +505,32 @@ def run_publish_tick():
                         f"after={after_count} (expected {before_count - 1})"
                     )
                 else:
-                    logger.info(
-                        f"Verified: count_new decreased correctly "
-                        f"(topic_id={topic.id} {before_count} -> {after_count})"
+                    logger.debug(
+                        "Verified: count_new decreased correctly (topic_id=%s %s -> %s)",
+                        topic.id,
+                        before_count,
+                        after_count,
                     )
 
-                # Проверяем обновление last_post_at
-                updated_topic = topic_registry.get_topic(
-                    chat_id=topic.chat_id,
-                    message_thread_id=topic.message_thread_id,
-                )
-                if updated_topic is None:
+                # Проверяем обновление last_post_at по значению, которое вернул
+                # mark_posted_and_touch_topic (без повторного чтения топика из БД)
+                if last_post_at is None:
                     logger.error(
-                        f"Failed to retrieve topic after touch_last_post "
+                        f"last_post_at not updated for topic_id={topic.id} "
                         f"(chat_id={topic.chat_id}, "
                         f"thread_id={topic.message_thread_id})"
                     )
-                elif updated_topic.last_post_at is None:
-                    logger.error(f"last_post_at not updated for topic_id={topic.id}")
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     # Проверяем, что время обновлено (с точностью до секунды)
-                    time_diff = abs((updated_topic.last_post_at - now_utc).total_seconds())
+                    time_diff = abs((last_post_at - now_utc).total_seconds())
                     if time_diff > 1:
                         logger.warning(
                             f"last_post_at time mismatch: expected ~{now_utc}, "
-                            f"got {updated_topic.last_post_at} "
+                            f"got {last_post_at} "
                             f"(diff={time_diff}s)"
                         )
                     else:
-                        logger.info(f"Verified: last_post_at updated " f"(topic_id={topic.id})")
+                        logger.debug("Verified: last_post_at updated (topic_id=%s)", topic.id)
 
                 items_posted += 1
 
@@ -442,52 +550,52 @@ def run_publish_tick():
 
 def signal_handler(signum, frame):
     """Обработчик сигналов для graceful shutdown."""
-    global shutdown_requested, scheduler
-
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_requested = True
+    STATE.shutdown.set()
 
-    if scheduler:
+    if STATE.scheduler:
         # Останавливаем scheduler (не запускает новые job)
-        scheduler.shutdown(wait=False)
+        STATE.scheduler.shutdown(wait=False)
 
         # Ждём завершения текущей job (grace period: 60 секунд)
-        if current_job_running:
+        if not STATE.jobs_idle.is_set():
             logger.info("Waiting for current job to finish (max 60s)...")
-            for _ in range(60):
-                if not current_job_running:
-                    break
-                time.sleep(1)
-            else:
+            if not STATE.jobs_idle.wait(timeout=60):
                 logger.warning("Grace period expired, job may still be running")
 
+    # Соединения закрываются, только когда ни одна job их уже не использует
+    if STATE.jobs_idle.is_set():
+        close_storage()
+
     logger.info("Shutdown complete")
     sys.exit(0)
 
 
 def main():
     """Главная функция scheduler."""
-    global scheduler
+    cfg = CONFIG
 
     logger.info("=" * 80)
     logger.info("Geotherm Bot Scheduler")
     logger.info("=" * 80)
     logger.info("Configuration:")
-    logger.info(f"  Refresh interval: {REFRESH_EVERY_HOURS} hours")
-    logger.info(f"  Run once (raw='{RUN_ONCE_RAW}'): {RUN_ONCE}")
-    logger.info(f"  DB path: {DB_PATH}")
-    logger.info(f"  Chat ID: {CHAT_ID}")
-    logger.info(f"  Max age days: {MAX_AGE_DAYS}")
+    logger.info(f"  Refresh interval: {cfg.refresh_every_hours} hours")
+    logger.info(f"  Run once (raw='{cfg.run_once_raw}'): {cfg.run_once}")
+    logger.info(f"  DB path: {cfg.db_path}")
+    logger.info(f"  SQLite pool readers: {cfg.sqlite_pool_readers}")
+    logger.info(f"  Chat ID: {cfg.chat_id}")
+    logger.info(f"  Max age days: {cfg.max_age_days}")
     logger.info("Publish configuration:")
-    logger.info(f"  ENABLE_PUBLISH: {ENABLE_PUBLISH}")
-    logger.info(f"  PUBLISH_DRY_RUN: {PUBLISH_DRY_RUN}")
-    logger.info(f"  ENABLE_PUBLISH_APPLY: {ENABLE_PUBLISH_APPLY}")
-    logger.info(f"  PUBLISH_EVERY_HOURS: {PUBLISH_EVERY_HOURS}")
-    logger.info(f"  PUBLISH_MAX_ITEMS: {PUBLISH_MAX_ITEMS}")
+    logger.info(f"  ENABLE_PUBLISH: {cfg.enable_publish}")
+    logger.info(f"  PUBLISH_DRY_RUN: {cfg.publish_dry_run}")
+    logger.info(f"  ENABLE_PUBLISH_APPLY: {cfg.enable_publish_apply}")
+    logger.info(f"  PUBLISH_EVERY_HOURS: {cfg.publish_every_hours}")
+    logger.info(f"  PUBLISH_MAX_ITEMS: {cfg.publish_max_items}")
+    logger.info(f"  PUBLISH_ASSERT_INVARIANTS: {cfg.publish_assert_invariants}")
     logger.info("=" * 80)
 
     # Валидация: если PUBLISH_DRY_RUN=False, требуется ENABLE_PUBLISH_APPLY=True
-    if not PUBLISH_DRY_RUN and not ENABLE_PUBLISH_APPLY:
+    if not cfg.publish_dry_run and not cfg.enable_publish_apply:
         logger.error("Refusing to run with PUBLISH_DRY_RUN=0 without " "ENABLE_PUBLISH_APPLY=1")
         sys.exit(2)
 
@@ -495,22 +603,29 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # Инициализируем БД один раз до запуска job
+    init_storage(cfg)
+
     # Создаём scheduler
     scheduler = BlockingScheduler()
+    STATE.scheduler = scheduler
 
-    # Запускаем первый job сразу
-    logger.info("Running initial refresh job...")
-    run_refresh_job()
-
-    if RUN_ONCE:
+    if cfg.run_once:
+        # Запускаем единственный job сразу, синхронно
+        logger.info("Running initial refresh job...")
+        run_refresh_job(cfg)
+        close_storage()
         logger.info("Run once mode: exiting after initial refresh")
         return 0
 
-    # Настраиваем периодический запуск с безопасной конфигурацией
-    trigger = IntervalTrigger(hours=REFRESH_EVERY_HOURS)
+    # Настраиваем периодический запуск с безопасной конфигурацией.
+    # Первый запуск - сразу после старта scheduler, в его пуле потоков:
+    # сеть провайдера не задерживает настройку остальных job, а max_instances=1
+    # не дает следующему запуску пересечься с первым
+    trigger = IntervalTrigger(hours=cfg.refresh_every_hours)
     misfire_grace_seconds = 3600  # 1 час - разумно для интервала в часы
     scheduler.add_job(
-        run_refresh_job,
+        partial(run_refresh_job, cfg),
         trigger=trigger,
         id="refresh_job",
         name="Refresh queue for chat",
@@ -518,7 +633,9 @@ def main():
         coalesce=True,  # Склеивать пропущенные запуски
         misfire_grace_time=misfire_grace_seconds,  # Пропускать запуски > 1 час
         replace_existing=True,  # Заменять job при рестарте
+        next_run_time=datetime.now(timezone.utc),  # Initial refresh
     )
+    logger.info("Initial refresh job scheduled to run immediately")
 
     # Общий event listener для логирования событий job
     def job_event_listener(event):
@@ -537,11 +654,11 @@ def main():
     scheduler.add_listener(job_event_listener, EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
 
     # Регистрируем publish job если включен
-    if ENABLE_PUBLISH:
-        publish_trigger = IntervalTrigger(hours=PUBLISH_EVERY_HOURS)
+    if cfg.enable_publish:
+        publish_trigger = IntervalTrigger(hours=cfg.publish_every_hours)
         publish_misfire_grace_seconds = 3600  # 1 час
         scheduler.add_job(
-            run_publish_tick,
+            partial(run_publish_tick, cfg),
             trigger=publish_trigger,
             id="publish_job",
             name="Publish tick",
@@ -550,17 +667,23 @@ def main():
             misfire_grace_time=publish_misfire_grace_seconds,
             replace_existing=True,
         )
-        logger.info(f"Publish job registered. Will run every {PUBLISH_EVERY_HOURS} hours.")
+        logger.info(f"Publish job registered. Will run every {cfg.publish_every_hours} hours.")
     else:
         logger.info("Publish disabled")
 
-    logger.info(f"Scheduler started. Refresh will run every {REFRESH_EVERY_HOURS} hours.")
+    logger.info(f"Scheduler started. Refresh will run every {cfg.refresh_every_hours} hours.")
     logger.info(
         "Job safety settings: max_instances=1, coalesce=True, "
         f"misfire_grace_time={misfire_grace_seconds}s, replace_existing=True"
     )
     logger.info("Press Ctrl+C to stop")
 
+    # Объекты, созданные при старте (модули, классы, job и триггеры), живут до
+    # конца процесса: убираем мусор старта и переносим остальное в постоянное
+    # поколение, чтобы сборщик мусора не обходил их при каждом запуске job
+    gc.collect()
+    gc.freeze()
+
     try:
         scheduler.start()
     except (KeyboardInterrupt, SystemExit):
@@ -8,6 +8,7 @@ Offline report для scoring по golden set fixtures.
 import json
 import statistics
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -32,8 +33,8 @@ def load_fixture_file(filepath: Path) -> Tuple[str, dict, str]:
     Returns:
         Tuple[filename, data, label]: имя файла, данные, метка (accept/reject/borderline)
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # json.loads сам декодирует UTF-8 из bytes: без текстового слоя файла
+    data = json.loads(filepath.read_bytes())
 
     filename = filepath.name
     if filename.startswith("accept_"):
@@ -82,17 +83,30 @@ def print_table(results: List[Tuple[str, str, int]]):
 
 def calculate_statistics(results: List[Tuple[str, str, int]]) -> Dict:
     """Вычисляет статистику по результатам."""
-    all_scores = [score for _, _, score in results]
-    accept_scores = [score for _, label, score in results if label == "accept"]
-    reject_scores = [score for _, label, score in results if label == "reject"]
-    borderline_scores = [score for _, label, score in results if label == "borderline"]
+    # Один проход по результатам: score раскладываются по меткам,
+    # нарушения порога считаются на ходу
+    all_scores = []
+    by_label: Dict[str, List[int]] = defaultdict(list)
+    accept_below = reject_above = borderline_above = borderline_below = 0
+    for _, label, score in results:
+        all_scores.append(score)
+        by_label[label].append(score)
+        if label == "accept":
+            if score < THRESHOLD:
+                accept_below += 1
+        elif label == "reject":
+            if score >= THRESHOLD:
+                reject_above += 1
+        elif label == "borderline":
+            if score >= THRESHOLD:
+                borderline_above += 1
+            else:
+                borderline_below += 1
 
     stats = {
         "total_count": len(results),
         "count_per_label": {
-            "accept": len(accept_scores),
-            "reject": len(reject_scores),
-            "borderline": len(borderline_scores),
+            label: len(by_label[label]) for label in ("accept", "reject", "borderline")
         },
         "overall": {
             "min": min(all_scores) if all_scores else 0,
@@ -101,29 +115,18 @@ def calculate_statistics(results: List[Tuple[str, str, int]]) -> Dict:
         },
         "per_label": {},
         "threshold_violations": {
-            "accept_below": sum(
-                1 for _, label, score in results if label == "accept" and score < THRESHOLD
-            ),
-            "reject_above": sum(
-                1 for _, label, score in results if label == "reject" and score >= THRESHOLD
-            ),
+            "accept_below": accept_below,
+            "reject_above": reject_above,
         },
         "borderline_threshold": {
-            "above": sum(
-                1 for _, label, score in results if label == "borderline" and score >= THRESHOLD
-            ),
-            "below": sum(
-                1 for _, label, score in results if label == "borderline" and score < THRESHOLD
-            ),
+            "above": borderline_above,
+            "below": borderline_below,
         },
     }
 
     # Статистика по меткам
-    for label, scores in [
-        ("accept", accept_scores),
-        ("reject", reject_scores),
-        ("borderline", borderline_scores),
-    ]:
+    for label in ("accept", "reject", "borderline"):
+        scores = by_label[label]
         if scores:
             stats["per_label"][label] = {
                 "min": min(scores),
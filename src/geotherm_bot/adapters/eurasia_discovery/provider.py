@@ -3,11 +3,12 @@
 Генерирует QuerySpec, создает ссылки для проверки, сохраняет результаты как Publication.
 """
 
-from typing import List
+import urllib.parse
+from typing import Dict, List
 
 from ...domain.models import Publication, QuerySpec
 from ...ports.publications_api import PublicationsAPI
-from .queries import generate_queries
+from .queries import QUERIES
 
 
 class EurasiaDiscoveryProvider(PublicationsAPI):
@@ -22,7 +23,10 @@ class EurasiaDiscoveryProvider(PublicationsAPI):
 
     def __init__(self):
         """Инициализирует провайдер."""
-        self.queries = generate_queries()
+        # Общий кортеж запросов модуля queries, без пересоздания QuerySpec
+        self.queries = QUERIES
+        # Запросы статичны: ссылки для них URL-кодируются один раз
+        self._links_by_query = {q.query: self._build_links(q.query) for q in self.queries}
 
     def fetch(self, query_spec: QuerySpec) -> List[Publication]:
         """
@@ -71,15 +75,32 @@ class EurasiaDiscoveryProvider(PublicationsAPI):
         """
         Генерирует ссылки для проверки на различных сайтах.
 
+        Для запросов провайдера возвращает заранее построенные ссылки (общий
+        dict, не изменяйте его), для остальных строит их заново.
+
         Args:
             query_spec: Спецификация запроса
 
         Returns:
             dict: Словарь с ссылками для каждого сайта
         """
-        import urllib.parse
+        links = self._links_by_query.get(query_spec.query)
+        if links is None:
+            links = self._build_links(query_spec.query)
+        return links
+
+    @staticmethod
+    def _build_links(query: str) -> Dict[str, str]:
+        """
+        Строит ссылки поиска по запросу на различных сайтах.
 
-        encoded_query = urllib.parse.quote(query_spec.query)
+        Args:
+            query: Текст запроса
+
+        Returns:
+            Dict[str, str]: Словарь с ссылками для каждого сайта
+        """
+        encoded_query = urllib.parse.quote(query)
 
         links = {
             "eastview": f"https://eastview.com/search?q={encoded_query}",
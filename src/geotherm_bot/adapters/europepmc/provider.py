@@ -4,27 +4,60 @@
 
 import logging
 import os
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...domain.models import Publication, QuerySpec
 from ...ports.publications_api import PublicationsAPI
 
 logger = logging.getLogger(__name__)
 
+# Префикс URL поиска Europe PMC REST API
+SEARCH_URL_PREFIX = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+
+# Максимум одновременных запросов к Europe PMC
+MAX_CONCURRENT_REQUESTS = 8
+
+
+def create_session(pool_size: int = MAX_CONCURRENT_REQUESTS) -> requests.Session:
+    """
+    Создает HTTP-сессию с пулом keep-alive соединений к Europe PMC.
+
+    Args:
+        pool_size: Размер пула (не меньше числа одновременных запросов)
+
+    Returns:
+        requests.Session: Сессия, переиспользующая TCP+TLS соединения
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
 
 class EuropePMCProvider(PublicationsAPI):
     """Провайдер публикаций из Europe PMC."""
 
-    def __init__(self, feed_urls: List[str]):
+    def __init__(
+        self,
+        feed_urls: List[str],
+        session: Optional[requests.Session] = None,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ):
         """
         Инициализирует провайдер.
 
         Args:
             feed_urls: Список URL для запросов к Europe PMC API
+            session: HTTP-сессия (по умолчанию создается своя, keep-alive между запросами)
+            max_workers: Максимум одновременных запросов
         """
         self.feed_urls = feed_urls
+        self.session = session or create_session(max_workers)
+        self.max_workers = max_workers
 
     def fetch(self, query_spec: QuerySpec) -> List[Publication]:
         """
@@ -64,37 +97,60 @@ class EuropePMCProvider(PublicationsAPI):
         """
         Получает публикации из Europe PMC API.
 
+        Запросы по feed_urls выполняются параллельно (ожидание сети не
+        суммируется), порядок публикаций соответствует порядку feed_urls.
+
         Returns:
             List[Publication]: Список публикаций
         """
+        feed_urls = [url for url in self.feed_urls if url.startswith(SEARCH_URL_PREFIX)]
+        if not feed_urls:
+            return []
+
         all_publications = []
 
-        for feed_url in self.feed_urls:
-            try:
-                expected_prefix = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
-                if not feed_url.startswith(expected_prefix):
-                    continue
+        max_workers = min(self.max_workers, len(feed_urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for publications in executor.map(self._fetch_feed, feed_urls):
+                all_publications.extend(publications)
 
-                response = requests.get(feed_url, timeout=20)
-                response.raise_for_status()
-                data = response.json()
+        return all_publications
 
-                results = data.get("resultList", {}).get("result", [])
-                result_count = len(results)
+    def _fetch_feed(self, feed_url: str) -> List[Publication]:
+        """
+        Получает публикации по одному URL Europe PMC API.
 
-                print(f"[Europe PMC] {feed_url}")
-                print(f"  Результатов: {result_count}")
+        Отчет о запросе пишется одной записью лога (запросы идут из пула потоков,
+        и строки разных запросов не должны перемешиваться). Ошибки загрузки и
+        парсинга логируются как warning, в этом случае возвращается пустой список.
 
-                for result in results:
-                    publication = self._parse_result(result)
-                    if publication:
-                        all_publications.append(publication)
+        Args:
+            feed_url: URL запроса к Europe PMC API
 
-            except Exception as e:
-                print(f"Ошибка при обработке {feed_url}: {e}")
-                continue
+        Returns:
+            List[Publication]: Список публикаций
+        """
+        publications = []
 
-        return all_publications
+        try:
+            response = self.session.get(feed_url, timeout=20)
+            response.raise_for_status()
+            data = response.json()
+
+            results = data.get("resultList", {}).get("result", [])
+            result_count = len(results)
+
+            logger.info("[Europe PMC] %s\n  Результатов: %d", feed_url, result_count)
+
+            for result in results:
+                publication = self._parse_result(result)
+                if publication:
+                    publications.append(publication)
+
+        except Exception as e:
+            logger.warning("Ошибка при обработке %s: %s", feed_url, e)
+
+        return publications
 
     def _parse_result(self, result: dict) -> Publication:
         """
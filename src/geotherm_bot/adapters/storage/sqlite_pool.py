@@ -0,0 +1,187 @@
+"""
+Пул соединений SQLite для долгоживущего scheduler.
+
+Адаптеры topics и content_queue без пула открывают и закрывают соединение на
+каждый вызов: каждый раз заново открываются файлы .db, -wal и -shm и
+применяются PRAGMA. Пул держит соединения открытыми между вызовами и тиками:
+одно соединение на запись (SQLite все равно допускает одного писателя) и
+несколько соединений только для чтения (mode=ro), которые в WAL не ждут писателя.
+"""
+
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+from .sqlite_tuning import TUNED_CONNECTION_PRAGMAS, connect
+
+
+class ConnectionPool:
+    """Пул соединений SQLite: 1 на запись + readers только для чтения."""
+
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: Tuple[str, ...] = TUNED_CONNECTION_PRAGMAS,
+        readers: int = 2,
+        timeout: float = 60.0,
+    ):
+        """
+        Инициализирует пул. Соединения открываются лениво, при первой выдаче,
+        поэтому пул можно создать до init() адаптеров (до создания файла БД).
+
+        Args:
+            db_path: Путь к файлу базы данных SQLite
+            pragmas: PRAGMA, применяемые один раз при открытии соединения
+            readers: Количество соединений только для чтения (0 - чтение
+                идет через соединение на запись)
+            timeout: Сколько секунд ждать свободное соединение
+        """
+        self.db_path = db_path
+        self.pragmas = pragmas
+        self.readers = readers
+        self.timeout = timeout
+
+        # None в очереди - слот, соединение для которого еще не открыто
+        self._writer: queue.Queue = queue.Queue()
+        self._writer.put(None)
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(readers):
+            self._readers.put(None)
+
+        self._opened: list[sqlite3.Connection] = []
+        self._opened_lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, read_only: bool = False) -> Iterator[sqlite3.Connection]:
+        """
+        Выдает соединение из пула на время блока with и возвращает его обратно.
+
+        Незавершенная транзакция при возврате откатывается, row_factory
+        сбрасывается: следующий пользователь получает соединение в исходном виде.
+
+        Args:
+            read_only: Нужно соединение только для чтения
+
+        Yields:
+            sqlite3.Connection: Соединение, принадлежащее вызывающему до конца блока
+
+        Raises:
+            sqlite3.OperationalError: Свободное соединение не появилось за timeout
+        """
+        read_only = read_only and self.readers > 0
+        slots = self._readers if read_only else self._writer
+
+        try:
+            conn = slots.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"No free SQLite connection in pool after {self.timeout}s"
+            ) from None
+
+        try:
+            if conn is None:
+                conn = self._open(read_only)
+            yield conn
+        finally:
+            if conn is not None and not self._is_open(conn):
+                # Пул закрыли, пока соединение было выдано: слот снова ленивый
+                conn = None
+            if conn is not None:
+                if conn.in_transaction:
+                    conn.rollback()
+                conn.row_factory = None
+            slots.put(conn)
+
+    @property
+    def opened_count(self) -> int:
+        """Количество соединений, открытых пулом и еще не закрытых."""
+        with self._opened_lock:
+            return len(self._opened)
+
+    def close(self) -> None:
+        """
+        Закрывает все открытые соединения пула (вызывается при остановке процесса).
+
+        Слоты снова становятся ленивыми (None): пул остается рабочим, и
+        следующий connection() откроет новое соединение, а не выдаст закрытое.
+        """
+        with self._opened_lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
+
+        for slots in (self._writer, self._readers):
+            drained = 0
+            while True:
+                try:
+                    slots.get_nowait()
+                except queue.Empty:
+                    break
+                drained += 1
+            for _ in range(drained):
+                slots.put(None)
+
+    def _is_open(self, conn: sqlite3.Connection) -> bool:
+        """
+        Проверяет, что соединение открыто пулом и еще не закрыто через close().
+
+        Args:
+            conn: Соединение из слота пула
+
+        Returns:
+            bool: True, если соединение можно вернуть в слот
+        """
+        with self._opened_lock:
+            return any(opened is conn for opened in self._opened)
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """
+        Открывает соединение для слота пула.
+
+        Args:
+            read_only: Соединение только для чтения
+
+        Returns:
+            sqlite3.Connection: Открытое соединение
+        """
+        # Соединение переходит между потоками scheduler, но пул выдает его
+        # только одному потоку за раз
+        conn = connect(self.db_path, self.pragmas, read_only=read_only, check_same_thread=False)
+        with self._opened_lock:
+            self._opened.append(conn)
+        return conn
+
+
+@contextmanager
+def open_connection(
+    db_path: str,
+    pragmas: Tuple[str, ...],
+    pool: ConnectionPool | None,
+    read_only: bool = False,
+) -> Iterator[sqlite3.Connection]:
+    """
+    Выдает соединение адаптеру: из пула, если он задан, иначе новое.
+
+    Новое соединение закрывается на выходе из блока with.
+
+    Args:
+        db_path: Путь к файлу базы данных SQLite
+        pragmas: PRAGMA для нового соединения (без пула)
+        pool: Общий пул соединений или None
+        read_only: Соединение только для чтения
+
+    Yields:
+        sqlite3.Connection: Соединение
+    """
+    if pool is not None:
+        with pool.connection(read_only) as conn:
+            yield conn
+        return
+
+    conn = connect(db_path, pragmas, read_only=read_only)
+    try:
+        yield conn
+    finally:
+        conn.close()
@@ -6,14 +6,45 @@ import json
 import os
 import sqlite3
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import ContextManager
 
 from ...ports.queue import ContentQueue, QueueItem
+from .sqlite_pool import ConnectionPool, open_connection
+from .sqlite_tuning import TUNED_CONNECTION_PRAGMAS, enable_wal
+
+
+@lru_cache(maxsize=64)
+def _count_new_bulk_sql(arity: int) -> str:
+    """
+    Строит SQL для count_new_bulk с заданным числом параметров в IN (...).
+
+    Текст запроса для одной и той же арности всегда один и тот же объект строки,
+    поэтому кэш подготовленных выражений sqlite3 находит его без повторного разбора.
+
+    Args:
+        arity: Количество topic_id в запросе
+
+    Returns:
+        str: SQL с плейсхолдерами
+    """
+    placeholders = ", ".join("?" * arity)
+    return (
+        "SELECT topic_id, COUNT(*) FROM content_queue "
+        f"WHERE status = 'new' AND topic_id IN ({placeholders}) "
+        "GROUP BY topic_id"
+    )
 
 
 class SQLiteContentQueue(ContentQueue):
     """Реализация ContentQueue для SQLite."""
 
-    def __init__(self, db_path: str, seen_ttl_days_discovery: int | None = None):
+    def __init__(
+        self,
+        db_path: str,
+        seen_ttl_days_discovery: int | None = None,
+        pool: ConnectionPool | None = None,
+    ):
         """
         Инициализирует очередь контента.
 
@@ -21,9 +52,13 @@ class SQLiteContentQueue(ContentQueue):
             db_path: Путь к файлу базы данных SQLite (та же БД, что и для topics)
             seen_ttl_days_discovery: TTL в днях для discovery элементов
                 (если None, читается из SEEN_TTL_DAYS_DISCOVERY env, по умолчанию 30)
+            pool: Общий пул соединений (None - новое соединение на каждый вызов)
         """
         self.db_path = db_path
         self.db_dir = os.path.dirname(db_path)
+        self.pool = pool
+        # PRAGMA для каждого соединения; заполняются в tune()
+        self.connection_pragmas: tuple[str, ...] = ()
 
         if seen_ttl_days_discovery is None:
             # Читаем из переменной окружения
@@ -40,58 +75,87 @@ class SQLiteContentQueue(ContentQueue):
         if self.db_dir and not os.path.exists(self.db_dir):
             os.makedirs(self.db_dir)
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        # Включаем foreign keys
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
-
-        # Создаем таблицу content_queue
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS content_queue (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                topic_id INTEGER NOT NULL,
-                item_type TEXT NOT NULL,
-                source TEXT NOT NULL,
-                external_id TEXT NOT NULL,
-                title TEXT NOT NULL,
-                snippet TEXT NULL,
-                url TEXT NULL,
-                score INTEGER NOT NULL,
-                reasons_json TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'new',
-                created_at TEXT NOT NULL,
-                posted_at TEXT NULL,
-                UNIQUE(topic_id, external_id),
-                FOREIGN KEY(topic_id) REFERENCES topics(id) ON DELETE CASCADE
-            )
-        """)
-
-        # Создаем таблицу seen
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS seen (
-                external_id TEXT PRIMARY KEY,
-                first_seen_at TEXT NOT NULL,
-                source_kind TEXT NOT NULL DEFAULT '',
-                expires_at TEXT NULL
-            )
-        """)
+        with self._connection() as conn:
+            conn.row_factory = sqlite3.Row
+            # Включаем foreign keys
+            conn.execute("PRAGMA foreign_keys = ON")
+            cursor = conn.cursor()
 
-        # Миграция: добавляем колонки если таблица уже существует
-        try:
-            cursor.execute("SELECT source_kind FROM seen LIMIT 1")
-        except sqlite3.OperationalError:
-            # Колонка source_kind не существует, добавляем
-            cursor.execute("ALTER TABLE seen ADD COLUMN source_kind TEXT NOT NULL DEFAULT ''")
+            # Создаем таблицу content_queue
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS content_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    topic_id INTEGER NOT NULL,
+                    item_type TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    external_id TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    snippet TEXT NULL,
+                    url TEXT NULL,
+                    score INTEGER NOT NULL,
+                    reasons_json TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'new',
+                    created_at TEXT NOT NULL,
+                    posted_at TEXT NULL,
+                    UNIQUE(topic_id, external_id),
+                    FOREIGN KEY(topic_id) REFERENCES topics(id) ON DELETE CASCADE
+                )
+            """)
+
+            # Индекс для подсчета новых элементов по топику
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_content_queue_topic_status
+                ON content_queue(topic_id, status)
+            """)
+
+            # Создаем таблицу seen
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    external_id TEXT PRIMARY KEY,
+                    first_seen_at TEXT NOT NULL,
+                    source_kind TEXT NOT NULL DEFAULT '',
+                    expires_at TEXT NULL
+                )
+            """)
+
+            # Миграция: добавляем колонки если таблица уже существует
+            try:
+                cursor.execute("SELECT source_kind FROM seen LIMIT 1")
+            except sqlite3.OperationalError:
+                # Колонка source_kind не существует, добавляем
+                cursor.execute("ALTER TABLE seen ADD COLUMN source_kind TEXT NOT NULL DEFAULT ''")
 
-        try:
-            cursor.execute("SELECT expires_at FROM seen LIMIT 1")
-        except sqlite3.OperationalError:
-            # Колонка expires_at не существует, добавляем
-            cursor.execute("ALTER TABLE seen ADD COLUMN expires_at TEXT NULL")
+            try:
+                cursor.execute("SELECT expires_at FROM seen LIMIT 1")
+            except sqlite3.OperationalError:
+                # Колонка expires_at не существует, добавляем
+                cursor.execute("ALTER TABLE seen ADD COLUMN expires_at TEXT NULL")
 
-        conn.commit()
-        conn.close()
+            conn.commit()
+
+    def tune(self) -> str:
+        """
+        Включает WAL для БД и PRAGMA производительности для соединений адаптера.
+
+        Вызывается один раз после init() в долгоживущем процессе (scheduler).
+
+        Returns:
+            str: Итоговый journal_mode БД
+        """
+        self.connection_pragmas = TUNED_CONNECTION_PRAGMAS
+        return enable_wal(self.db_path)
+
+    def _connection(self, read_only: bool = False) -> ContextManager[sqlite3.Connection]:
+        """
+        Выдает соединение на время блока with (из пула или новое).
+
+        Args:
+            read_only: Соединение только для чтения
+
+        Returns:
+            ContextManager[sqlite3.Connection]: Соединение для блока with
+        """
+        return open_connection(self.db_path, self.connection_pragmas, self.pool, read_only)
 
     def enqueue(self, item: QueueItem) -> bool:
         """
@@ -112,97 +176,114 @@ class SQLiteContentQueue(ContentQueue):
         if self.seen_exists(item.external_id, source_kind):
             return False
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            cursor = conn.cursor()
 
-        try:
-            # Пробуем вставить в content_queue
-            reasons_json = json.dumps(item.reasons)
-            created_at_str = self._dt_to_str(item.created_at)
+            try:
+                # Пробуем вставить в content_queue
+                reasons_json = json.dumps(item.reasons)
+                created_at_str = self._dt_to_str(item.created_at)
+
+                cursor.execute(
+                    """
+                    INSERT INTO content_queue (
+                        topic_id, item_type, source, external_id, title, snippet, url,
+                        score, reasons_json, status, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        item.topic_id,
+                        item.item_type,
+                        item.source,
+                        item.external_id,
+                        item.title,
+                        item.snippet,
+                        item.url,
+                        item.score,
+                        reasons_json,
+                        item.status,
+                        created_at_str,
+                    ),
+                )
+
+                # Добавляем в seen с TTL
+                now = datetime.now(timezone.utc)
+                now_str = self._dt_to_str(now)
+
+                # Вычисляем expires_at для discovery элементов
+                expires_at_str = None
+                if source_kind == "discovery":
+                    expires_at = now + timedelta(days=self.seen_ttl_days_discovery)
+                    expires_at_str = self._dt_to_str(expires_at)
+
+                cursor.execute(
+                    """
+                    INSERT INTO seen (external_id, first_seen_at, source_kind, expires_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(external_id) DO UPDATE SET
+                        first_seen_at = excluded.first_seen_at,
+                        source_kind = excluded.source_kind,
+                        expires_at = excluded.expires_at
+                """,
+                    (item.external_id, now_str, source_kind, expires_at_str),
+                )
+
+                conn.commit()
+                return True
+
+            except sqlite3.IntegrityError:
+                # Конфликт UNIQUE(topic_id, external_id)
+                conn.rollback()
+                return False
 
-            cursor.execute(
-                """
-                INSERT INTO content_queue (
-                    topic_id, item_type, source, external_id, title, snippet, url,
-                    score, reasons_json, status, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    item.topic_id,
-                    item.item_type,
-                    item.source,
-                    item.external_id,
-                    item.title,
-                    item.snippet,
-                    item.url,
-                    item.score,
-                    reasons_json,
-                    item.status,
-                    created_at_str,
-                ),
-            )
+    def count_new(self, topic_id: int) -> int:
+        """
+        Подсчитывает количество новых элементов для топика.
 
-            # Добавляем в seen с TTL
-            now = datetime.now(timezone.utc)
-            now_str = self._dt_to_str(now)
+        Args:
+            topic_id: ID топика
 
-            # Вычисляем expires_at для discovery элементов
-            expires_at_str = None
-            if source_kind == "discovery":
-                expires_at = now + timedelta(days=self.seen_ttl_days_discovery)
-                expires_at_str = self._dt_to_str(expires_at)
+        Returns:
+            int: Количество элементов со статусом 'new'
+        """
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
 
             cursor.execute(
                 """
-                INSERT INTO seen (external_id, first_seen_at, source_kind, expires_at)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(external_id) DO UPDATE SET
-                    first_seen_at = excluded.first_seen_at,
-                    source_kind = excluded.source_kind,
-                    expires_at = excluded.expires_at
+                SELECT COUNT(*) as count FROM content_queue
+                WHERE topic_id = ? AND status = 'new'
             """,
-                (item.external_id, now_str, source_kind, expires_at_str),
+                (topic_id,),
             )
 
-            conn.commit()
-            return True
-
-        except sqlite3.IntegrityError:
-            # Конфликт UNIQUE(topic_id, external_id)
-            conn.rollback()
-            return False
+            row = cursor.fetchone()
 
-        finally:
-            conn.close()
+        return row["count"] if row else 0
 
-    def count_new(self, topic_id: int) -> int:
+    def count_new_bulk(self, topic_ids: list[int]) -> dict[int, int]:
         """
-        Подсчитывает количество новых элементов для топика.
+        Подсчитывает количество новых элементов для нескольких топиков одним запросом.
 
         Args:
-            topic_id: ID топика
+            topic_ids: ID топиков
 
         Returns:
-            int: Количество элементов со статусом 'new'
+            dict[int, int]: topic_id -> количество элементов со статусом 'new'
+                (0 для топиков без новых элементов)
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT COUNT(*) as count FROM content_queue
-            WHERE topic_id = ? AND status = 'new'
-        """,
-            (topic_id,),
-        )
+        counts = dict.fromkeys(topic_ids, 0)
+        if not counts:
+            return counts
 
-        row = cursor.fetchone()
-        conn.close()
+        with self._connection(read_only=True) as conn:
+            rows = conn.execute(_count_new_bulk_sql(len(counts)), tuple(counts)).fetchall()
 
-        return row["count"] if row else 0
+        counts.update(rows)
+        return counts
 
     def pop_best_new(self, topic_id: int) -> QueueItem | None:
         """
@@ -214,22 +295,21 @@ class SQLiteContentQueue(ContentQueue):
         Returns:
             QueueItem | None: Лучший элемент или None если нет новых
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT * FROM content_queue
-            WHERE topic_id = ? AND status = 'new'
-            ORDER BY score DESC, created_at ASC
-            LIMIT 1
-        """,
-            (topic_id,),
-        )
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
 
-        row = cursor.fetchone()
-        conn.close()
+            cursor.execute(
+                """
+                SELECT * FROM content_queue
+                WHERE topic_id = ? AND status = 'new'
+                ORDER BY score DESC, created_at ASC
+                LIMIT 1
+            """,
+                (topic_id,),
+            )
+
+            row = cursor.fetchone()
 
         if row is None:
             return None
@@ -240,7 +320,9 @@ class SQLiteContentQueue(ContentQueue):
         """
         Читает лучший новый элемент из очереди без изменения БД (read-only).
 
-        Аналогично pop_best_new, но явно read-only для dry-run режима.
+        Аналогично pop_best_new, но явно read-only для dry-run режима:
+        соединение открывается в mode=ro, так что SQLite сам гарантирует,
+        что чтение не меняет БД.
 
         Args:
             topic_id: ID топика
@@ -248,7 +330,7 @@ class SQLiteContentQueue(ContentQueue):
         Returns:
             QueueItem | None: Лучший элемент или None если нет новых
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection(read_only=True) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -282,7 +364,8 @@ class SQLiteContentQueue(ContentQueue):
         Returns:
             QueueItem | None: Захваченный элемент или None если нет доступных
         """
-        with sqlite3.connect(self.db_path) as conn:
+        # Второй with conn: commit при успехе, rollback при исключении
+        with self._connection() as conn, conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
@@ -344,7 +427,7 @@ class SQLiteContentQueue(ContentQueue):
             bool: True если элемент был освобожден, False если не найден
                 или уже не в статусе 'posting'
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn, conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -366,21 +449,58 @@ class SQLiteContentQueue(ContentQueue):
             item_id: ID элемента
             posted_at: Время публикации
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            posted_at_str = self._dt_to_str(posted_at)
+            cursor.execute(
+                """
+                UPDATE content_queue
+                SET status = 'posted', posted_at = ?
+                WHERE id = ?
+            """,
+                (posted_at_str, item_id),
+            )
+
+            conn.commit()
+
+    def mark_posted_and_touch_topic(
+        self, item_id: int, topic_id: int, posted_at: datetime
+    ) -> datetime | None:
+        """
+        Помечает элемент опубликованным и обновляет last_post_at топика атомарно.
+
+        Оба UPDATE выполняются в одной транзакции: один commit (и один fsync)
+        вместо двух, а при ошибке не остается элемента 'posted' без обновленного
+        топика.
+
+        Args:
+            item_id: ID элемента
+            topic_id: ID топика элемента (таблица topics в той же БД)
+            posted_at: Время публикации
 
+        Returns:
+            datetime | None: Записанное значение last_post_at или None, если топик не найден
+        """
         posted_at_str = self._dt_to_str(posted_at)
-        cursor.execute(
-            """
-            UPDATE content_queue
-            SET status = 'posted', posted_at = ?
-            WHERE id = ?
-        """,
-            (posted_at_str, item_id),
-        )
 
-        conn.commit()
-        conn.close()
+        # Второй with conn: commit при успехе, rollback при исключении
+        with self._connection() as conn, conn:
+            conn.execute(
+                """
+                UPDATE content_queue
+                SET status = 'posted', posted_at = ?
+                WHERE id = ?
+            """,
+                (posted_at_str, item_id),
+            )
+            cursor = conn.execute(
+                "UPDATE topics SET last_post_at = ? WHERE id = ?",
+                (posted_at_str, topic_id),
+            )
+            topic_updated = cursor.rowcount == 1
+
+        return self._str_to_dt(posted_at_str) if topic_updated else None
 
     def mark_rejected(self, item_id: int) -> None:
         """
@@ -389,20 +509,19 @@ class SQLiteContentQueue(ContentQueue):
         Args:
             item_id: ID элемента
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            UPDATE content_queue
-            SET status = 'rejected'
-            WHERE id = ?
-        """,
-            (item_id,),
-        )
+            cursor.execute(
+                """
+                UPDATE content_queue
+                SET status = 'rejected'
+                WHERE id = ?
+            """,
+                (item_id,),
+            )
 
-        conn.commit()
-        conn.close()
+            conn.commit()
 
     def seen_exists(self, external_id: str, source_kind: str = "") -> bool:
         """
@@ -415,19 +534,18 @@ class SQLiteContentQueue(ContentQueue):
         Returns:
             bool: True если external_id уже был виден и не истек TTL
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT first_seen_at, expires_at, source_kind FROM seen WHERE external_id = ?
-        """,
-            (external_id,),
-        )
+            cursor.execute(
+                """
+                SELECT first_seen_at, expires_at, source_kind FROM seen WHERE external_id = ?
+            """,
+                (external_id,),
+            )
 
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
 
         if row is None:
             return False
@@ -5,49 +5,84 @@
 import os
 import sqlite3
 from datetime import datetime, timezone
+from typing import ContextManager
 
 from ...ports.topic_registry import Topic, TopicRegistry
+from .sqlite_pool import ConnectionPool, open_connection
+from .sqlite_tuning import TUNED_CONNECTION_PRAGMAS, enable_wal
 
 
 class SQLiteTopicRegistry(TopicRegistry):
     """Реализация TopicRegistry для SQLite."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool: ConnectionPool | None = None):
         """
         Инициализирует реестр топиков.
 
         Args:
             db_path: Путь к файлу базы данных SQLite
+            pool: Общий пул соединений (None - новое соединение на каждый вызов)
         """
         self.db_path = db_path
         self.db_dir = os.path.dirname(db_path)
+        self.pool = pool
+        # PRAGMA для каждого соединения; заполняются в tune()
+        self.connection_pragmas: tuple[str, ...] = ()
 
     def init(self) -> None:
         """Инициализирует базу данных и создает таблицу, если её нет."""
         if self.db_dir and not os.path.exists(self.db_dir):
             os.makedirs(self.db_dir)
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS topics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chat_id INTEGER NOT NULL,
-                message_thread_id INTEGER NOT NULL,
-                name TEXT NOT NULL,
-                region_key TEXT NOT NULL DEFAULT '',
-                mode TEXT NOT NULL DEFAULT 'backfill_ru',
-                enabled INTEGER NOT NULL DEFAULT 1,
-                created_at TEXT NOT NULL,
-                last_post_at TEXT NULL,
-                UNIQUE(chat_id, message_thread_id)
-            )
-        """)
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS topics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    chat_id INTEGER NOT NULL,
+                    message_thread_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    region_key TEXT NOT NULL DEFAULT '',
+                    mode TEXT NOT NULL DEFAULT 'backfill_ru',
+                    enabled INTEGER NOT NULL DEFAULT 1,
+                    created_at TEXT NOT NULL,
+                    last_post_at TEXT NULL,
+                    UNIQUE(chat_id, message_thread_id)
+                )
+            """)
+
+            # Индекс под выборку кандидатов на публикацию в порядке fairness
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_topics_fairness
+                ON topics(chat_id, enabled, last_post_at, created_at)
+            """)
+
+            conn.commit()
+
+    def tune(self) -> str:
+        """
+        Включает WAL для БД и PRAGMA производительности для соединений адаптера.
+
+        Вызывается один раз после init() в долгоживущем процессе (scheduler).
+
+        Returns:
+            str: Итоговый journal_mode БД
+        """
+        self.connection_pragmas = TUNED_CONNECTION_PRAGMAS
+        return enable_wal(self.db_path)
 
-        conn.commit()
-        conn.close()
+    def _connection(self, read_only: bool = False) -> ContextManager[sqlite3.Connection]:
+        """
+        Выдает соединение на время блока with (из пула или новое).
+
+        Args:
+            read_only: Соединение только для чтения
+
+        Returns:
+            ContextManager[sqlite3.Connection]: Соединение для блока with
+        """
+        return open_connection(self.db_path, self.connection_pragmas, self.pool, read_only)
 
     def upsert_topic(self, chat_id: int, message_thread_id: int, name: str | None) -> Topic:
         """
@@ -61,53 +96,51 @@ class SQLiteTopicRegistry(TopicRegistry):
         Returns:
             Topic: Созданный или обновленный топик
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        # Проверяем, существует ли топик
-        cursor.execute(
-            """
-            SELECT id, name FROM topics
-            WHERE chat_id = ? AND message_thread_id = ?
-        """,
-            (chat_id, message_thread_id),
-        )
-
-        existing = cursor.fetchone()
-        now_str = self._dt_to_str(datetime.now(timezone.utc))
+        with self._connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
 
-        if existing is None:
-            # Вставляем новую запись
-            final_name = name if name and name.strip() else "unknown"
+            # Проверяем, существует ли топик
             cursor.execute(
                 """
-                INSERT INTO topics (chat_id, message_thread_id, name, created_at)
-                VALUES (?, ?, ?, ?)
+                SELECT id, name FROM topics
+                WHERE chat_id = ? AND message_thread_id = ?
             """,
-                (chat_id, message_thread_id, final_name, now_str),
+                (chat_id, message_thread_id),
             )
-            topic_id = cursor.lastrowid
-        else:
-            # Обновляем существующую запись
-            topic_id = existing["id"]
 
-            # Обновляем name только если передан непустой name и он не 'unknown'
-            if name and name.strip() and name.strip() != "unknown":
+            existing = cursor.fetchone()
+            now_str = self._dt_to_str(datetime.now(timezone.utc))
+
+            if existing is None:
+                # Вставляем новую запись
+                final_name = name if name and name.strip() else "unknown"
                 cursor.execute(
                     """
-                    UPDATE topics SET name = ? WHERE id = ?
+                    INSERT INTO topics (chat_id, message_thread_id, name, created_at)
+                    VALUES (?, ?, ?, ?)
                 """,
-                    (name.strip(), topic_id),
+                    (chat_id, message_thread_id, final_name, now_str),
                 )
+                topic_id = cursor.lastrowid
+            else:
+                # Обновляем существующую запись
+                topic_id = existing["id"]
 
-        conn.commit()
+                # Обновляем name только если передан непустой name и он не 'unknown'
+                if name and name.strip() and name.strip() != "unknown":
+                    cursor.execute(
+                        """
+                        UPDATE topics SET name = ? WHERE id = ?
+                    """,
+                        (name.strip(), topic_id),
+                    )
 
-        # Получаем обновленную запись
-        cursor.execute("SELECT * FROM topics WHERE id = ?", (topic_id,))
-        row = cursor.fetchone()
+            conn.commit()
 
-        conn.close()
+            # Получаем обновленную запись
+            cursor.execute("SELECT * FROM topics WHERE id = ?", (topic_id,))
+            row = cursor.fetchone()
 
         return self._row_to_topic(row)
 
@@ -122,20 +155,19 @@ class SQLiteTopicRegistry(TopicRegistry):
         Returns:
             Topic | None: Топик или None если не найден
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT * FROM topics
-            WHERE chat_id = ? AND message_thread_id = ?
-        """,
-            (chat_id, message_thread_id),
-        )
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT * FROM topics
+                WHERE chat_id = ? AND message_thread_id = ?
+            """,
+                (chat_id, message_thread_id),
+            )
 
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
 
         if row is None:
             return None
@@ -153,55 +185,100 @@ class SQLiteTopicRegistry(TopicRegistry):
         Returns:
             list[Topic]: Список топиков
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            if enabled_only:
+                cursor.execute(
+                    """
+                    SELECT * FROM topics
+                    WHERE chat_id = ? AND enabled = 1
+                    ORDER BY id
+                """,
+                    (chat_id,),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT * FROM topics
+                    WHERE chat_id = ?
+                    ORDER BY id
+                """,
+                    (chat_id,),
+                )
+
+            rows = cursor.fetchall()
+
+        return [self._row_to_topic(row) for row in rows]
+
+    def list_topics_with_new_ordered(self, chat_id: int, limit: int) -> list[tuple[Topic, int]]:
+        """
+        Получает включенные топики чата с новыми элементами в порядке fairness.
+
+        Сортировка и LIMIT выполняются в SQLite: возвращаются только limit строк.
+        Даты хранятся в ISO UTC, поэтому строковый порядок совпадает с временным.
+        Требует таблицу content_queue (SQLiteContentQueue.init) в той же БД.
+
+        Args:
+            chat_id: ID чата
+            limit: Максимальное количество топиков
+
+        Returns:
+            list[tuple[Topic, int]]: Пары (топик, количество элементов со статусом 'new')
+        """
+        with self._connection(read_only=True) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
 
-        if enabled_only:
-            cursor.execute(
-                """
-                SELECT * FROM topics
-                WHERE chat_id = ? AND enabled = 1
-                ORDER BY id
-            """,
-                (chat_id,),
-            )
-        else:
             cursor.execute(
                 """
-                SELECT * FROM topics
-                WHERE chat_id = ?
-                ORDER BY id
+                SELECT t.*, q.count_new FROM topics t
+                JOIN (
+                    SELECT topic_id, COUNT(*) AS count_new FROM content_queue
+                    WHERE status = 'new'
+                    GROUP BY topic_id
+                ) q ON q.topic_id = t.id
+                WHERE t.chat_id = ? AND t.enabled = 1
+                ORDER BY t.last_post_at IS NOT NULL, t.last_post_at, t.created_at, t.id
+                LIMIT ?
             """,
-                (chat_id,),
+                (chat_id, limit),
             )
 
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
 
-        return [self._row_to_topic(row) for row in rows]
+        return [(self._row_to_topic(row), row["count_new"]) for row in rows]
 
-    def touch_last_post(self, topic_id: int, dt: datetime) -> None:
+    def touch_last_post(self, topic_id: int, dt: datetime) -> datetime | None:
         """
         Обновляет время последнего поста в топике.
 
+        Записанное значение возвращается по rowcount самого UPDATE, без
+        повторного SELECT топика.
+
         Args:
             topic_id: ID топика
             dt: Время последнего поста
+
+        Returns:
+            datetime | None: Записанное значение last_post_at или None, если топик не найден
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        dt_str = self._dt_to_str(dt)
-        cursor.execute(
-            """
-            UPDATE topics SET last_post_at = ? WHERE id = ?
-        """,
-            (dt_str, topic_id),
-        )
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            dt_str = self._dt_to_str(dt)
+            cursor.execute(
+                """
+                UPDATE topics SET last_post_at = ? WHERE id = ?
+            """,
+                (dt_str, topic_id),
+            )
+            updated = cursor.rowcount == 1
+
+            conn.commit()
 
-        conn.commit()
-        conn.close()
+        return self._str_to_dt(dt_str) if updated else None
 
     def set_region_key(self, topic_id: int, region_key: str) -> None:
         """
@@ -211,18 +288,17 @@ class SQLiteTopicRegistry(TopicRegistry):
             topic_id: ID топика
             region_key: Ключ региона
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE topics SET region_key = ? WHERE id = ?
-        """,
-            (region_key, topic_id),
-        )
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                UPDATE topics SET region_key = ? WHERE id = ?
+            """,
+                (region_key, topic_id),
+            )
 
-        conn.commit()
-        conn.close()
+            conn.commit()
 
     def set_enabled(self, topic_id: int, enabled: bool) -> None:
         """
@@ -232,18 +308,17 @@ class SQLiteTopicRegistry(TopicRegistry):
             topic_id: ID топика
             enabled: Включен ли топик
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE topics SET enabled = ? WHERE id = ?
-        """,
-            (1 if enabled else 0, topic_id),
-        )
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                UPDATE topics SET enabled = ? WHERE id = ?
+            """,
+                (1 if enabled else 0, topic_id),
+            )
 
-        conn.commit()
-        conn.close()
+            conn.commit()
 
     def _dt_to_str(self, dt: datetime) -> str:
         """
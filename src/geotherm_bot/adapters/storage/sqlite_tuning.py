@@ -0,0 +1,71 @@
+"""
+Настройки производительности SQLite для долгоживущего scheduler.
+
+WAL позволяет читателям (count_new, list_topics, get_topic) работать параллельно
+с писателем (claim_best_new, mark_posted) и убирает полный fsync на каждом commit.
+WAL не работает на сетевых ФС: файл БД (DB_PATH) должен лежать на локальном диске.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Tuple
+
+# PRAGMA уровня соединения: адаптеры открывают соединение на каждый вызов,
+# поэтому они применяются при каждом подключении (journal_mode хранится в файле БД)
+TUNED_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA busy_timeout = 60000",
+)
+
+
+def enable_wal(db_path: str) -> str:
+    """
+    Переводит БД в режим журнала WAL (настройка сохраняется в файле БД).
+
+    Args:
+        db_path: Путь к файлу базы данных SQLite
+
+    Returns:
+        str: Итоговый journal_mode ("wal" или прежний режим, если WAL недоступен)
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def connect(
+    db_path: str,
+    pragmas: Tuple[str, ...] = (),
+    read_only: bool = False,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """
+    Открывает соединение и применяет к нему PRAGMA.
+
+    Args:
+        db_path: Путь к файлу базы данных SQLite
+        pragmas: PRAGMA уровня соединения (пусто - настройки SQLite по умолчанию)
+        read_only: Открыть БД только для чтения (mode=ro): любая запись
+            через это соединение завершится ошибкой на уровне SQLite
+        check_same_thread: Запрещать использование соединения из других потоков
+            (False - для пула, который сам выдает соединение одному потоку за раз)
+
+    Returns:
+        sqlite3.Connection: Открытое соединение
+    """
+    if read_only:
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=check_same_thread,
+        )
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+    for pragma in pragmas:
+        conn.execute(pragma)
+    return conn
@@ -3,23 +3,55 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ...ports.notifier import Notifier
 
 
+def create_session() -> requests.Session:
+    """
+    Создает HTTP-сессию с пулом соединений и повторами для Telegram Bot API.
+
+    Повторяется только 429 (с учетом Retry-After): sendMessage не идемпотентен,
+    поэтому 5xx и обрыв чтения ответа уходят в обычную обработку ошибки.
+    Конфигурация совпадает с bot.create_session.
+
+    Returns:
+        requests.Session: Сессия с keep-alive и повторами на 429
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429,),
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
 class TelegramNotifier(Notifier):
     """Реализация Notifier для Telegram."""
 
-    def __init__(self, bot_token: str, dry_run: bool = False):
+    def __init__(
+        self, bot_token: str, dry_run: bool = False, session: requests.Session | None = None
+    ):
         """
         Инициализирует Telegram notifier.
 
         Args:
             bot_token: Токен бота из BotFather
             dry_run: Если True, печатает сообщения вместо отправки
+            session: HTTP-сессия (если None, создается сессия с пулом соединений)
         """
         self.bot_token = bot_token
         self.dry_run = dry_run
+        self.session = session if session is not None else create_session()
+        self.url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
 
     def send(self, chat_id: str, message_thread_id: int, text: str, topic_key: str = None) -> bool:
         """
@@ -46,8 +78,6 @@ class TelegramNotifier(Notifier):
             print("=" * 60 + "\n")
             return True
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-
         payload = {
             "chat_id": chat_id,
             "text": text,
@@ -58,7 +88,7 @@ class TelegramNotifier(Notifier):
             payload["message_thread_id"] = message_thread_id
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self.session.post(self.url, json=payload, timeout=10)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
@@ -91,8 +121,6 @@ class TelegramNotifier(Notifier):
             print("=" * 60 + "\n")
             return
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-
         payload = {
             "chat_id": chat_id,
             "text": text,
@@ -102,5 +130,5 @@ class TelegramNotifier(Notifier):
         if message_thread_id and message_thread_id != 0:
             payload["message_thread_id"] = message_thread_id
 
-        response = requests.post(url, json=payload, timeout=10)
+        response = self.session.post(self.url, json=payload, timeout=10)
         response.raise_for_status()
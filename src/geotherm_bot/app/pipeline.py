@@ -2,9 +2,11 @@
 Основной пайплайн обработки публикаций.
 """
 
+import time
+from datetime import datetime
 from typing import List
 
-from ..domain.filtering import is_fresh, is_relevant
+from ..domain.filtering import is_fresh, is_relevant, lower_terms
 from ..domain.models import Publication
 from ..domain.scoring import classify_bucket, detect_region, score_publication
 from ..ports.notifier import Notifier
@@ -50,8 +52,9 @@ class ProcessingPipeline:
         self.notifier = notifier
         self.chat_id = chat_id
         self.topic_map = topic_map
-        self.include_terms = include_terms
-        self.exclude_terms = exclude_terms
+        # Термины приводятся к нижнему регистру один раз, а не для каждой публикации
+        self.include_terms = lower_terms(tuple(include_terms))
+        self.exclude_terms = lower_terms(tuple(exclude_terms))
         self.max_age_days = max_age_days
         self.score_threshold = score_threshold
         self.editorial_mode = editorial_mode
@@ -64,9 +67,11 @@ class ProcessingPipeline:
         Returns:
             int: Количество обработанных новых публикаций
         """
-        import time
-
-        print(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}] Проверка новых публикаций...")
+        # Время цикла форматируется один раз
+        cycle_ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        # Одно "сейчас" на цикл для проверки свежести всех публикаций
+        now = datetime.now()
+        print(f"\n[{cycle_ts}] Проверка новых публикаций...")
 
         # Получаем публикации
         publications = self.publications_api.fetch_publications()
@@ -76,55 +81,44 @@ class ProcessingPipeline:
         filtered_count = 0
 
         for publication in publications:
+            # Заголовок для логов обрезается один раз на публикацию
+            title = publication.title
+            short_title = title[:60]
             try:
                 # Создаем fingerprint для дедупликации
-                fingerprint = self.repository.make_fingerprint(publication.title, publication.url)
+                fingerprint = self.repository.make_fingerprint(title, publication.url)
 
                 # Проверяем, не обрабатывали ли мы уже эту публикацию
                 if self.repository.already_seen(fingerprint):
-                    print(f"⊘ Отфильтровано (уже обработано): {publication.title[:60]}...")
+                    print(f"⊘ Отфильтровано (уже обработано): {short_title}...")
                     filtered_count += 1
                     continue
 
                 # Редакционный режим: фильтрация
                 if self.editorial_mode:
-                    # Проверка релевантности
-                    if not is_relevant(publication, self.include_terms, self.exclude_terms):
+                    # Сначала дешевая проверка свежести, затем поиск терминов;
+                    # score считается только для прошедших (или для debug-вывода)
+                    if not is_fresh(publication, self.max_age_days, now):
                         if self.debug_mode:
-                            scoring_result = score_publication(publication)
-                            print(f"\n[DEBUG] Score breakdown для: {publication.title[:60]}...")
-                            print(f"  Score: {scoring_result.score}")
-                            reasons_str = (
-                                ", ".join(scoring_result.reasons)
-                                if scoring_result.reasons
-                                else "none"
+                            self._print_rejected_score(
+                                publication, short_title, "⊘ NOT_FRESH (не свежая)"
                             )
-                            print(f"  Reasons: {reasons_str}")
-                            print("  Status: ⊘ EXCLUDED (не релевантно)")
                         filtered_count += 1
                         continue
 
-                    # Проверка свежести
-                    if not is_fresh(publication, self.max_age_days):
+                    if not is_relevant(publication, self.include_terms, self.exclude_terms):
                         if self.debug_mode:
-                            scoring_result = score_publication(publication)
-                            print(f"\n[DEBUG] Score breakdown для: {publication.title[:60]}...")
-                            print(f"  Score: {scoring_result.score}")
-                            reasons_str = (
-                                ", ".join(scoring_result.reasons)
-                                if scoring_result.reasons
-                                else "none"
+                            self._print_rejected_score(
+                                publication, short_title, "⊘ EXCLUDED (не релевантно)"
                             )
-                            print(f"  Reasons: {reasons_str}")
-                            print("  Status: ⊘ NOT_FRESH (не свежая)")
                         filtered_count += 1
                         continue
 
-                    # Проверка score
                     scoring_result = score_publication(publication)
 
+                    # Проверка score
                     if self.debug_mode:
-                        print(f"\n[DEBUG] Score breakdown для: {publication.title[:60]}...")
+                        print(f"\n[DEBUG] Score breakdown для: {short_title}...")
                         print(f"  Score: {scoring_result.score}")
                         reasons_str = (
                             ", ".join(scoring_result.reasons) if scoring_result.reasons else "none"
@@ -139,7 +133,7 @@ class ProcessingPipeline:
                         print(f"  Status: {status_msg}")
 
                     if scoring_result.score < self.score_threshold:
-                        print(f"⊘ LOW_SCORE ({scoring_result.score}): {publication.title[:60]}...")
+                        print(f"⊘ LOW_SCORE ({scoring_result.score}): {short_title}...")
                         reasons_str = (
                             ", ".join(scoring_result.reasons) if scoring_result.reasons else "none"
                         )
@@ -172,7 +166,7 @@ class ProcessingPipeline:
 
                 # Отправляем сообщение
                 if self.notifier.send(self.chat_id, message_thread_id, message_text, topic_key):
-                    print(f"✓ Отправлено: {publication.title[:50]}...")
+                    print(f"✓ Отправлено: {title[:50]}...")
                     if self.debug_mode and self.editorial_mode:
                         reasons_str = (
                             ", ".join(scoring_result.reasons) if scoring_result.reasons else "none"
@@ -180,7 +174,7 @@ class ProcessingPipeline:
                         print(f"  [DEBUG] Score: {scoring_result.score}, Reasons: {reasons_str}")
                     new_count += 1
                 else:
-                    print(f"✗ Ошибка отправки: {publication.title[:50]}...")
+                    print(f"✗ Ошибка отправки: {title[:50]}...")
 
                 # Помечаем публикацию как обработанную
                 url = publication.url or ""
@@ -193,12 +187,28 @@ class ProcessingPipeline:
                 print(f"Ошибка при обработке публикации: {e}")
                 continue
 
-        print(f"Обработано новых публикаций: {new_count}")
+        print(f"[{cycle_ts}] Обработано новых публикаций: {new_count}")
         if filtered_count > 0:
             print(f"Отфильтровано публикаций: {filtered_count}")
 
         return new_count
 
+    def _print_rejected_score(self, publication: Publication, short_title: str, status: str):
+        """
+        Выводит debug-разбор score для отфильтрованной публикации.
+
+        Args:
+            publication: Публикация
+            short_title: Заголовок, обрезанный для логов
+            status: Причина отказа
+        """
+        scoring_result = score_publication(publication)
+        print(f"\n[DEBUG] Score breakdown для: {short_title}...")
+        print(f"  Score: {scoring_result.score}")
+        reasons_str = ", ".join(scoring_result.reasons) if scoring_result.reasons else "none"
+        print(f"  Reasons: {reasons_str}")
+        print(f"  Status: {status}")
+
     def _format_message(self, publication: Publication) -> str:
         """
         Форматирует публикацию в текст сообщения.
@@ -209,25 +219,24 @@ class ProcessingPipeline:
         Returns:
             str: Отформатированный текст сообщения
         """
-        message = f"📰 {publication.title}\n\n"
+        parts = [f"📰 {publication.title}\n\n"]
 
         if publication.bucket:
-            bucket_display = publication.bucket.capitalize()
-            message += f"Тип: {bucket_display}\n"
+            parts.append(f"Тип: {publication.bucket.capitalize()}\n")
 
-        message += f"🔗 Источник: {publication.source}\n"
+        parts.append(f"🔗 Источник: {publication.source}\n")
 
         if publication.published_at:
-            message += f"📅 Дата: {publication.published_at}\n"
+            parts.append(f"📅 Дата: {publication.published_at}\n")
 
         summary = publication.abstract or publication.summary
         if summary:
             summary_clean = " ".join(summary.split())
             if len(summary_clean) > 400:
                 summary_clean = summary_clean[:400].rsplit(" ", 1)[0] + "..."
-            message += f"\n{summary_clean}\n"
+            parts.append(f"\n{summary_clean}\n")
 
         if publication.url:
-            message += f"\n🔗 {publication.url}"
+            parts.append(f"\n🔗 {publication.url}")
 
-        return message
+        return "".join(parts)
@@ -4,11 +4,57 @@
 
 import re
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from .models import Publication
 
 
+@lru_cache(maxsize=32)
+def lower_terms(terms: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Приводит набор терминов к нижнему регистру (результат кэшируется).
+
+    Поиск подстроки (`in`) выполняется в C и на текстах публикаций заметно
+    быстрее одной regex-альтернации по тем же терминам, поэтому термины
+    только готовятся один раз, а не компилируются в шаблон.
+
+    Args:
+        terms: Кортеж терминов
+
+    Returns:
+        Tuple[str, ...]: Термины в нижнем регистре
+    """
+    return tuple(term.lower() for term in terms)
+
+
+@lru_cache(maxsize=1024)
+def lower_text(title: str, summary: str) -> str:
+    """
+    Склеивает заголовок и аннотацию и приводит к нижнему регистру (с кэшем).
+
+    Один и тот же текст публикации нужен is_relevant, score_publication,
+    classify_bucket и detect_region; кэш по паре строк избавляет от повторного
+    копирования аннотации через lower() на каждом шаге.
+
+    Args:
+        title: Заголовок
+        summary: Аннотация
+
+    Returns:
+        str: "title summary" в нижнем регистре
+    """
+    return f"{title} {summary}".lower()
+
+
+# Стандартные форматы дат: YYYY-MM-DD HH:MM:SS, YYYY-MM-DD, YYYY
+DATE_RE = re.compile(
+    r"([0-9]{4})(?:-([0-9]{2})-([0-9]{2})(?: ([0-9]{2}):([0-9]{2}):([0-9]{2}))?)?\Z"
+)
+DATE_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y")
+
+
+@lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> Optional[datetime]:
     """
     Парсит дату из строки в datetime объект.
@@ -29,26 +75,28 @@ def parse_date(date_str: str) -> Optional[datetime]:
 
     date_str = date_str.strip()
 
-    # Пробуем стандартные форматы
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%Y",
-    ]
-
-    for fmt in formats:
+    # Быстрый путь: один regex вместо перебора strptime с исключениями
+    match = DATE_RE.match(date_str)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
         try:
-            return datetime.strptime(date_str, fmt)
+            return datetime(
+                int(year),
+                int(month or 1),
+                int(day or 1),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+            )
         except ValueError:
-            continue
+            return None
 
-    # Если только год, создаем дату 1 января
-    if re.match(r"^\d{4}$", date_str):
+    # Редкие варианты записи (например, без ведущих нулей) разбирает strptime
+    for fmt in DATE_FORMATS:
         try:
-            year = int(date_str)
-            return datetime(year, 1, 1)
+            return datetime.strptime(date_str, fmt)
         except ValueError:
-            pass
+            continue
 
     return None
 
@@ -67,31 +115,31 @@ def is_relevant(
     Returns:
         bool: True если публикация релевантна, False иначе
     """
-    title = publication.title.lower()
-    summary = (publication.abstract or publication.summary or "").lower()
-    text = f"{title} {summary}"
+    summary = publication.abstract or publication.summary or ""
+    text = lower_text(publication.title, summary)
 
     # Проверяем exclude термины (если есть хотя бы один - не релевантно)
-    for term in exclude_terms:
-        if term.lower() in text:
+    for term in lower_terms(tuple(exclude_terms)):
+        if term in text:
             return False
 
     # Проверяем include термины (должен быть хотя бы один)
-    for term in include_terms:
-        if term.lower() in text:
+    for term in lower_terms(tuple(include_terms)):
+        if term in text:
             return True
 
     # Если нет ни одного include термина - не релевантно
     return False
 
 
-def is_fresh(publication: Publication, max_age_days: int) -> bool:
+def is_fresh(publication: Publication, max_age_days: int, now: Optional[datetime] = None) -> bool:
     """
     Проверяет, свежая ли публикация (в пределах max_age_days).
 
     Args:
         publication: Публикация для проверки
         max_age_days: Максимальный возраст публикации в днях
+        now: Текущее время (одно на цикл обработки; по умолчанию datetime.now())
 
     Returns:
         bool: True если публикация свежая, False иначе
@@ -103,5 +151,7 @@ def is_fresh(publication: Publication, max_age_days: int) -> bool:
     if not pub_date:
         return False
 
-    age = datetime.now() - pub_date
+    if now is None:
+        now = datetime.now()
+    age = now - pub_date
     return age.days <= max_age_days
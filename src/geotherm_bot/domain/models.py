@@ -6,9 +6,15 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Publication:
-    """Модель публикации."""
+    """
+    Модель публикации.
+
+    slots=True: публикаций в цикле много, а атрибуты читаются на каждом шаге
+    фильтрации и скоринга. frozen не используется - пайплайн дописывает
+    bucket/score/region в уже созданный объект.
+    """
 
     id: str
     source: str
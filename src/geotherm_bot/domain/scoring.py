@@ -4,9 +4,27 @@
 
 from typing import List
 
+from .filtering import lower_text
 from .models import Publication, ScoreResult
 from .rules import apply_pub_type_rules, apply_text_rules, apply_title_rules
 
+# Страны Азии для определения региона
+ASIA_COUNTRIES = ("japan", "korea", "china", "india")
+
+
+def publication_text(publication: Publication) -> str:
+    """
+    Склеивает заголовок и аннотацию публикации для поиска терминов.
+
+    Args:
+        publication: Публикация
+
+    Returns:
+        str: "title summary" в нижнем регистре
+    """
+    summary = publication.abstract or publication.summary or ""
+    return lower_text(publication.title, summary)
+
 
 def score_publication(publication: Publication) -> ScoreResult:
     """
@@ -18,12 +36,11 @@ def score_publication(publication: Publication) -> ScoreResult:
     Returns:
         ScoreResult: Результат скоринга (score, reasons, is_high_priority)
     """
-    title = publication.title
-    # Используем abstract или summary
+    # Используем abstract или summary; общий текст берется из кэша lower_text
     summary = publication.abstract or publication.summary or ""
-    text = (title + " " + summary).lower()
+    title_lower = publication.title.lower()
+    text = lower_text(publication.title, summary)
 
-    title_lower = title.lower()
     pub_types = publication.pub_types
     pub_types_lower = [str(pt).lower() for pt in pub_types]
 
@@ -57,9 +74,7 @@ def classify_bucket(publication: Publication) -> str:
     Returns:
         str: "review", "trial" или "study"
     """
-    title = publication.title.lower()
-    summary = (publication.abstract or publication.summary or "").lower()
-    text = f"{title} {summary}"
+    text = publication_text(publication)
 
     review_terms = (
         "systematic review" in text
@@ -86,12 +101,9 @@ def detect_region(publication: Publication) -> str:
     Returns:
         str|None: "asia" если найдена страна из Азии, иначе None
     """
-    title = publication.title.lower()
-    summary = (publication.abstract or publication.summary or "").lower()
-    text = f"{title} {summary}"
+    text = publication_text(publication)
 
-    asia_countries = ["japan", "korea", "china", "india"]
-    for country in asia_countries:
+    for country in ASIA_COUNTRIES:
         if country in text:
             return "asia"
 
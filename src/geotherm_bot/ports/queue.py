@@ -65,6 +65,20 @@ class ContentQueue(ABC):
         """
         pass
 
+    @abstractmethod
+    def count_new_bulk(self, topic_ids: list[int]) -> dict[int, int]:
+        """
+        Подсчитывает количество новых элементов сразу для нескольких топиков.
+
+        Args:
+            topic_ids: ID топиков
+
+        Returns:
+            dict[int, int]: topic_id -> количество элементов со статусом 'new'
+                (0 для топиков без новых элементов)
+        """
+        pass
+
     @abstractmethod
     def pop_best_new(self, topic_id: int) -> QueueItem | None:
         """
@@ -91,6 +105,23 @@ class ContentQueue(ABC):
         """
         pass
 
+    @abstractmethod
+    def mark_posted_and_touch_topic(
+        self, item_id: int, topic_id: int, posted_at: datetime
+    ) -> datetime | None:
+        """
+        Помечает элемент опубликованным и обновляет last_post_at топика атомарно.
+
+        Args:
+            item_id: ID элемента
+            topic_id: ID топика элемента
+            posted_at: Время публикации
+
+        Returns:
+            datetime | None: Записанное значение last_post_at или None, если топик не найден
+        """
+        pass
+
     @abstractmethod
     def mark_rejected(self, item_id: int) -> None:
         """
@@ -69,13 +69,33 @@ class TopicRegistry(ABC):
         pass
 
     @abstractmethod
-    def touch_last_post(self, topic_id: int, dt: datetime) -> None:
+    def list_topics_with_new_ordered(self, chat_id: int, limit: int) -> list[tuple[Topic, int]]:
+        """
+        Получает включенные топики чата с новыми элементами в порядке fairness.
+
+        Порядок: сначала топики без публикаций (last_post_at IS NULL), затем
+        по last_post_at ASC, затем по created_at ASC.
+
+        Args:
+            chat_id: ID чата
+            limit: Максимальное количество топиков
+
+        Returns:
+            list[tuple[Topic, int]]: Пары (топик, количество элементов со статусом 'new')
+        """
+        pass
+
+    @abstractmethod
+    def touch_last_post(self, topic_id: int, dt: datetime) -> datetime | None:
         """
         Обновляет время последнего поста в топике.
 
         Args:
             topic_id: ID топика
             dt: Время последнего поста
+
+        Returns:
+            datetime | None: Записанное значение last_post_at или None, если топик не найден
         """
         pass
 
@@ -10,19 +10,64 @@ import sqlite3
 DB_DIR = "db"
 DB_PATH = os.path.join(DB_DIR, "seen.db")
 
+# 64-битные ключи fingerprint'ов, известных процессу (заполняется в init_db,
+# пополняется в mark_seen). None означает, что кэш не загружен и каждая
+# проверка идет в SQLite.
+_seen_fingerprints = None
+
+
+def fast_key(fingerprint):
+    """
+    Возвращает 64-битный ключ fingerprint'а для кэша в памяти.
+
+    Fingerprint - это hex SHA256, поэтому его первые 16 символов уже равномерно
+    распределенное 64-битное число; повторно хэшировать не нужно. Совпадение
+    ключей только отправляет проверку в SQLite, где хранится полный fingerprint.
+
+    Args:
+        fingerprint: Fingerprint новости (см. make_fingerprint)
+
+    Returns:
+        int: 64-битный ключ
+    """
+    return int(fingerprint[:16], 16)
+
+
+def _connect():
+    """
+    Открывает соединение с базой данных.
+
+    synchronous=NORMAL действует на уровне соединения; вместе с WAL (включается
+    в init_db) коммит не требует fsync на каждую транзакцию.
+
+    Returns:
+        sqlite3.Connection: Соединение с базой данных
+    """
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
 
 def init_db():
     """
     Инициализирует базу данных и создает таблицу, если её нет.
+
+    Также загружает существующие fingerprint'ы в память, чтобы already_seen
+    не обращался к SQLite для заведомо новых новостей.
     """
+    global _seen_fingerprints
+
     # Создаем директорию для базы данных, если её нет
     if not os.path.exists(DB_DIR):
         os.makedirs(DB_DIR)
 
     # Подключаемся к базе данных
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
 
+    # WAL сохраняется в файле БД и действует для всех последующих соединений
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Создаем таблицу для хранения просмотренных новостей
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS seen_items (
@@ -34,6 +79,10 @@ def init_db():
     """)
 
     conn.commit()
+
+    cursor.execute("SELECT fingerprint FROM seen_items")
+    _seen_fingerprints = {fast_key(row[0]) for row in cursor}
+
     conn.close()
     print(f"База данных инициализирована: {DB_PATH}")
 
@@ -65,7 +114,11 @@ def already_seen(fingerprint):
     Returns:
         bool: True если новость уже была обработана, False иначе
     """
-    conn = sqlite3.connect(DB_PATH)
+    # Быстрый путь: промах по кэшу в памяти означает, что новость новая
+    if _seen_fingerprints is not None and fast_key(fingerprint) not in _seen_fingerprints:
+        return False
+
+    conn = _connect()
     cursor = conn.cursor()
 
     cursor.execute("SELECT 1 FROM seen_items WHERE fingerprint = ?", (fingerprint,))
@@ -84,7 +137,7 @@ def mark_seen(fingerprint, url, published_at):
         url: URL новости
         published_at: Дата публикации новости
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
 
     cursor.execute(
@@ -97,3 +150,33 @@ def mark_seen(fingerprint, url, published_at):
 
     conn.commit()
     conn.close()
+
+    if _seen_fingerprints is not None:
+        _seen_fingerprints.add(fast_key(fingerprint))
+
+
+def mark_seen_many(records):
+    """
+    Помечает несколько новостей как обработанные одной транзакцией.
+
+    Args:
+        records: Список кортежей (fingerprint, url, published_at)
+    """
+    if not records:
+        return
+
+    conn = _connect()
+
+    with conn:
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO seen_items (fingerprint, url, published_at)
+            VALUES (?, ?, ?)
+        """,
+            records,
+        )
+
+    conn.close()
+
+    if _seen_fingerprints is not None:
+        _seen_fingerprints.update(fast_key(fingerprint) for fingerprint, _, _ in records)
@@ -3,13 +3,16 @@
 """
 
 import os
+import sqlite3
 import tempfile
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from src.geotherm_bot.adapters.storage.sqlite_pool import ConnectionPool
 from src.geotherm_bot.adapters.storage.sqlite_queue import SQLiteContentQueue
 from src.geotherm_bot.adapters.storage.sqlite_topics import SQLiteTopicRegistry
+from src.geotherm_bot.adapters.storage.sqlite_tuning import connect
 from src.geotherm_bot.ports.queue import QueueItem
 
 
@@ -265,6 +268,38 @@ def test_mark_posted_changes_status_and_posted_at(topic, content_queue):
     assert count == 0
 
 
+def test_mark_posted_and_touch_topic_updates_both(topic, content_queue, topic_registry):
+    """Тест: mark_posted_and_touch_topic меняет статус элемента и last_post_at топика."""
+    content_queue.enqueue(
+        QueueItem(
+            id=None,
+            topic_id=topic.id,
+            item_type="discovery_link",
+            source="discovery:cyberleninka",
+            external_id="id_posted_atomic",
+            title="Публикация",
+            snippet=None,
+            url=None,
+            score=5,
+            status="new",
+            created_at=datetime.now(timezone.utc),
+        )
+    )
+    claimed = content_queue.claim_best_new(topic.id)
+    posted_at = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+
+    last_post_at = content_queue.mark_posted_and_touch_topic(claimed.id, topic.id, posted_at)
+
+    assert last_post_at == posted_at
+    assert content_queue.count_new(topic.id) == 0
+    assert content_queue.release_posting(claimed.id) is False  # уже posted
+    retrieved = topic_registry.get_topic(chat_id=1, message_thread_id=10)
+    assert retrieved.last_post_at == posted_at
+
+    # Несуществующий топик: last_post_at не обновлен
+    assert content_queue.mark_posted_and_touch_topic(claimed.id, topic.id + 100, posted_at) is None
+
+
 def test_mark_rejected_excludes_from_new(topic, content_queue):
     """Тест: mark_rejected исключает элемент из новых."""
     item = QueueItem(
@@ -434,3 +469,205 @@ def test_seen_non_discovery_blocks_forever(topic, content_queue):
 
     # Даже если expires_at NULL, non-discovery должен блокироваться
     assert content_queue.seen_exists("non_discovery_id", "") is True
+
+
+def test_count_new_bulk_matches_count_new(topic, content_queue, topic_registry):
+    """Тест: count_new_bulk возвращает те же счетчики, что и count_new по топикам."""
+    topic2 = topic_registry.upsert_topic(chat_id=1, message_thread_id=20, name="Пустой топик")
+    now = datetime.now(timezone.utc)
+    for i in range(3):
+        content_queue.enqueue(
+            QueueItem(
+                id=None,
+                topic_id=topic.id,
+                item_type="discovery_link",
+                source="discovery:cyberleninka",
+                external_id=f"bulk_{i}",
+                title=f"Публикация {i}",
+                snippet=None,
+                url=None,
+                score=i,
+                status="new",
+                created_at=now,
+            )
+        )
+    content_queue.mark_rejected(content_queue.peek_best_new(topic.id).id)
+
+    counts = content_queue.count_new_bulk([topic.id, topic2.id])
+
+    assert counts == {topic.id: 2, topic2.id: 0}
+    assert counts[topic.id] == content_queue.count_new(topic.id)
+    assert content_queue.count_new_bulk([]) == {}
+
+
+def test_list_topics_with_new_ordered_fairness_and_limit(content_queue, topic_registry):
+    """Тест: кандидаты на публикацию отбираются и сортируются по fairness в SQL."""
+    now = datetime.now(timezone.utc)
+    posted_long_ago = topic_registry.upsert_topic(chat_id=1, message_thread_id=1, name="A")
+    never_posted = topic_registry.upsert_topic(chat_id=1, message_thread_id=2, name="B")
+    posted_recently = topic_registry.upsert_topic(chat_id=1, message_thread_id=3, name="C")
+    no_new_items = topic_registry.upsert_topic(chat_id=1, message_thread_id=4, name="D")
+    disabled = topic_registry.upsert_topic(chat_id=1, message_thread_id=5, name="E")
+    topic_registry.touch_last_post(posted_long_ago.id, now - timedelta(days=2))
+    topic_registry.touch_last_post(posted_recently.id, now - timedelta(hours=1))
+    topic_registry.set_enabled(disabled.id, False)
+
+    for topic, n_items in (
+        (posted_long_ago, 1),
+        (never_posted, 2),
+        (posted_recently, 3),
+        (disabled, 1),
+    ):
+        for i in range(n_items):
+            content_queue.enqueue(
+                QueueItem(
+                    id=None,
+                    topic_id=topic.id,
+                    item_type="discovery_link",
+                    source="discovery:cyberleninka",
+                    external_id=f"fair_{topic.id}_{i}",
+                    title=f"Публикация {i}",
+                    snippet=None,
+                    url=None,
+                    score=i,
+                    status="new",
+                    created_at=now,
+                )
+            )
+
+    ordered = topic_registry.list_topics_with_new_ordered(chat_id=1, limit=10)
+    assert [(topic.id, count) for topic, count in ordered] == [
+        (never_posted.id, 2),
+        (posted_long_ago.id, 1),
+        (posted_recently.id, 3),
+    ]
+    assert no_new_items.id not in [topic.id for topic, _ in ordered]
+
+    limited = topic_registry.list_topics_with_new_ordered(chat_id=1, limit=1)
+    assert [topic.id for topic, _ in limited] == [never_posted.id]
+
+
+def test_read_only_connection_rejects_writes(content_queue, temp_db):
+    """Тест: соединение read_only (как у peek_best_new) не может изменить БД."""
+    conn = connect(temp_db, read_only=True)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM content_queue").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM content_queue")
+    finally:
+        conn.close()
+
+
+def test_tune_enables_wal_and_connection_pragmas(topic, content_queue, topic_registry, temp_db):
+    """Тест: tune() включает WAL и применяет PRAGMA к соединениям адаптеров."""
+    assert content_queue.tune() == "wal"
+    topic_registry.tune()
+
+    conn = connect(temp_db, content_queue.connection_pragmas)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 60000
+    finally:
+        conn.close()
+
+    # Операции очереди и реестра работают на настроенных соединениях
+    assert content_queue.count_new(topic.id) == 0
+    assert topic_registry.get_topic(chat_id=1, message_thread_id=10) is not None
+
+    # В режиме WAL рядом с БД остаются файлы -wal/-shm
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(temp_db + suffix):
+            os.unlink(temp_db + suffix)
+
+
+def test_connection_pool_shared_by_adapters(temp_db):
+    """Тест: адаптеры с общим пулом переиспользуют соединения между вызовами."""
+    pool = ConnectionPool(temp_db, readers=1)
+    registry = SQLiteTopicRegistry(db_path=temp_db, pool=pool)
+    registry.init()
+    queue = SQLiteContentQueue(db_path=temp_db, pool=pool)
+    queue.init()
+
+    try:
+        topic = registry.upsert_topic(chat_id=1, message_thread_id=10, name="Топик")
+        for external_id, score in (("a", 5), ("b", 9)):
+            queue.enqueue(
+                QueueItem(
+                    id=None,
+                    topic_id=topic.id,
+                    item_type="discovery_link",
+                    source="discovery:cyberleninka",
+                    external_id=external_id,
+                    title=f"Статья {external_id}",
+                    snippet=None,
+                    url=None,
+                    score=score,
+                    reasons=[],
+                    status="new",
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+
+        assert queue.count_new_bulk([topic.id]) == {topic.id: 2}
+        assert queue.peek_best_new(topic.id).external_id == "b"
+
+        claimed = queue.claim_best_new(topic.id)
+        assert claimed.external_id == "b"
+        posted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert queue.mark_posted_and_touch_topic(claimed.id, topic.id, posted_at) == posted_at
+
+        # Чтение через соединение только для чтения видит зафиксированную запись
+        assert queue.count_new(topic.id) == 1
+        assert registry.get_topic(chat_id=1, message_thread_id=10).last_post_at == posted_at
+
+        # Одно соединение на запись и одно на чтение на все вызовы выше
+        assert pool.opened_count == 2
+
+        # Соединение возвращается в пул без row_factory и открытой транзакции
+        with pool.connection() as conn:
+            assert conn.row_factory is None
+            assert not conn.in_transaction
+    finally:
+        pool.close()
+
+    assert pool.opened_count == 0
+
+
+def test_connection_pool_rolls_back_unfinished_transaction(content_queue, temp_db):
+    """Тест: незавершенная транзакция откатывается при возврате соединения в пул."""
+    pool = ConnectionPool(temp_db, readers=0)
+    try:
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO seen (external_id, first_seen_at) VALUES ('x', 'now')")
+            assert conn.in_transaction
+
+        # readers=0: чтение идет через то же соединение на запись
+        with pool.connection(read_only=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0
+    finally:
+        pool.close()
+
+
+def test_connection_pool_reopens_after_close(content_queue, temp_db):
+    """Тест: после close() пул открывает новые соединения вместо выдачи закрытых."""
+    pool = ConnectionPool(temp_db, readers=1)
+    try:
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+        with pool.connection(read_only=True) as conn:
+            conn.execute("SELECT 1")
+
+        # Соединение, выданное в момент close(), возвращается в слот как None
+        with pool.connection() as held:
+            pool.close()
+        assert pool.opened_count == 0
+
+        with pool.connection() as conn:
+            assert conn is not held
+            assert conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0
+        with pool.connection(read_only=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0] == 0
+        assert pool.opened_count == 2
+    finally:
+        pool.close()
@@ -0,0 +1,30 @@
+"""
+Тесты для dedup_key (ключ дедупликации статей между лентами).
+"""
+
+from rss_collector import dedup_key
+
+
+def test_doi_urls_share_key_case_insensitive():
+    """Тест: ссылки doi.org и dx.doi.org на один DOI дают один ключ в любом регистре."""
+    keys = {
+        dedup_key({"url": "https://doi.org/10.1016/J.JHYDROL.2024.1", "title": "A"}),
+        dedup_key({"url": "http://dx.doi.org/10.1016/j.jhydrol.2024.1/", "title": "B"}),
+    }
+
+    assert keys == {"10.1016/j.jhydrol.2024.1"}
+
+
+def test_url_path_case_preserved():
+    """Тест: регистр схемы и хоста не важен, регистр пути и query - важен."""
+    key = dedup_key({"url": "HTTPS://Example.ORG/Article?id=AbC", "title": "A"})
+
+    assert key == "https://example.org/Article?id=AbC"
+    assert key != dedup_key({"url": "https://example.org/article?id=abc", "title": "A"})
+
+
+def test_title_fallback_without_url():
+    """Тест: без URL ключом служит заголовок, None вместо заголовка не падает."""
+    assert dedup_key({"url": "", "title": "  Hot Spring Study "}) == "hot spring study"
+    assert dedup_key({"url": "", "title": None}) == ""
+    assert dedup_key({"url": None, "title": None}) == ""
@@ -0,0 +1,65 @@
+"""
+Тесты для EuropePMCProvider.fetch_publications.
+"""
+
+from src.geotherm_bot.adapters.europepmc.provider import SEARCH_URL_PREFIX, EuropePMCProvider
+
+
+class FakeResponse:
+    """Фейковый HTTP-ответ с JSON."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Фейковая HTTP-сессия: ответ по URL, для неизвестного URL - ошибка."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, timeout):
+        self.requested.append(url)
+        if url not in self.responses:
+            raise ConnectionError("network down")
+        return FakeResponse(self.responses[url])
+
+
+def make_result(pmid, title):
+    """Создает минимальный результат Europe PMC."""
+    return {"pmid": pmid, "title": title, "firstPublicationDate": "2025-01-01"}
+
+
+def test_fetch_publications_keeps_feed_order():
+    """Тест: публикации возвращаются в порядке feed_urls, ошибка одного запроса не мешает другим."""
+    url_a = f"{SEARCH_URL_PREFIX}?query=a"
+    url_b = f"{SEARCH_URL_PREFIX}?query=b"
+    url_failed = f"{SEARCH_URL_PREFIX}?query=failed"
+    session = FakeSession(
+        {
+            url_a: {"resultList": {"result": [make_result("1", "A1"), make_result("2", "A2")]}},
+            url_b: {"resultList": {"result": [make_result("3", "B1")]}},
+        }
+    )
+    provider = EuropePMCProvider(feed_urls=[url_a, url_failed, url_b], session=session)
+
+    publications = provider.fetch_publications()
+
+    assert [p.title for p in publications] == ["A1", "A2", "B1"]
+    assert sorted(session.requested) == sorted([url_a, url_failed, url_b])
+
+
+def test_fetch_publications_skips_foreign_urls():
+    """Тест: URL не от Europe PMC REST API не запрашиваются."""
+    session = FakeSession({})
+    provider = EuropePMCProvider(feed_urls=["https://example.com/rss"], session=session)
+
+    assert provider.fetch_publications() == []
+    assert session.requested == []
@@ -0,0 +1,57 @@
+"""
+Тесты для is_relevant и классификации по терминам.
+"""
+
+from src.geotherm_bot.domain.filtering import is_relevant, lower_terms, lower_text
+from src.geotherm_bot.domain.models import Publication
+from src.geotherm_bot.domain.scoring import classify_bucket, detect_region
+
+INCLUDE_TERMS = ["mineral water", "balneotherapy"]
+EXCLUDE_TERMS = ["water treatment", "mice"]
+
+
+def create_publication(title: str, abstract: str = "") -> Publication:
+    """Создает минимальную публикацию для тестов."""
+    return Publication(id="test-id", source="test", title=title, abstract=abstract)
+
+
+def test_is_relevant_matches_case_insensitive():
+    """Тест: include термин находится независимо от регистра."""
+    publication = create_publication("BALNEOTHERAPY for knee osteoarthritis")
+
+    assert is_relevant(publication, INCLUDE_TERMS, EXCLUDE_TERMS) is True
+
+
+def test_is_relevant_exclude_overlapping_include():
+    """Тест: exclude термин, пересекающийся с include, все равно исключает публикацию."""
+    publication = create_publication("Mineral water treatment plants")
+
+    assert is_relevant(publication, INCLUDE_TERMS, EXCLUDE_TERMS) is False
+
+
+def test_is_relevant_without_include_terms():
+    """Тест: без include терминов публикация не релевантна."""
+    publication = create_publication("Mineral water", "Randomized trial")
+
+    assert is_relevant(publication, [], EXCLUDE_TERMS) is False
+
+
+def test_lower_terms_is_cached():
+    """Тест: набор терминов приводится к нижнему регистру один раз."""
+    assert lower_terms(("A", "b")) == ("a", "b")
+    assert lower_terms(("A", "b")) is lower_terms(("A", "b"))
+
+
+def test_lower_text_is_cached():
+    """Тест: текст публикации в нижнем регистре строится один раз на пару строк."""
+    assert lower_text("Spa THERAPY", "In JAPAN") == "spa therapy in japan"
+    assert lower_text("Spa THERAPY", "In JAPAN") is lower_text("Spa THERAPY", "In JAPAN")
+
+
+def test_classify_bucket_and_region():
+    """Тест: классификация и регион не зависят от регистра текста."""
+    publication = create_publication("Spa therapy in JAPAN", "A Randomised pilot")
+
+    assert classify_bucket(publication) == "trial"
+    assert detect_region(publication) == "asia"
+    assert classify_bucket(create_publication("Systematic Review")) == "review"
@@ -0,0 +1,28 @@
+"""
+Тесты для parse_date.
+"""
+
+from datetime import datetime
+
+from src.geotherm_bot.domain.filtering import parse_date
+
+
+def test_parse_date_standard_formats():
+    """Тест: стандартные форматы разбираются без strptime."""
+    assert parse_date("2024-03-05 10:11:12") == datetime(2024, 3, 5, 10, 11, 12)
+    assert parse_date("2024-03-05") == datetime(2024, 3, 5)
+    assert parse_date(" 2024 ") == datetime(2024, 1, 1)
+
+
+def test_parse_date_fallback_without_leading_zeros():
+    """Тест: дата без ведущих нулей разбирается через strptime."""
+    assert parse_date("2024-3-5") == datetime(2024, 3, 5)
+
+
+def test_parse_date_invalid():
+    """Тест: невалидные даты возвращают None."""
+    assert parse_date("") is None
+    assert parse_date("2024-13-01") is None
+    assert parse_date("2024-02-30") is None
+    assert parse_date("2024-03-05T10:11:12") is None
+    assert parse_date("not a date") is None
@@ -0,0 +1,49 @@
+"""
+Тесты для process_cycle (без сети и БД: источники и отправка подменяются).
+"""
+
+import dataclasses
+from datetime import datetime
+
+import bot
+
+
+def make_item(title, url):
+    """Создает свежую релевантную статью."""
+    return {
+        "title": title,
+        "url": url,
+        "summary": "Balneotherapy with thermal mineral water in a randomized trial.",
+        "published_at": datetime.now().strftime("%Y-%m-%d"),
+        "source": "test",
+    }
+
+
+def test_bad_item_does_not_abort_cycle(monkeypatch):
+    """Тест: ошибка оценки одного item логируется, остальные items обрабатываются."""
+    bad = make_item(None, "https://example.org/bad")
+    good = make_item("Balneotherapy for knee osteoarthritis", "https://example.org/good")
+    marks = []
+    sent = []
+
+    def fake_send_window(window, cfg):
+        sent.extend(window)
+        return [True] * len(window)
+
+    monkeypatch.setattr(bot, "fetch_items", lambda: [bad, good])
+    monkeypatch.setattr(bot, "already_seen", lambda fingerprint: False)
+    monkeypatch.setattr(bot, "mark_seen_many", marks.extend)
+    monkeypatch.setattr(bot, "send_window", fake_send_window)
+    cfg = dataclasses.replace(bot.CFG, dry_run=True, editorial_mode=True, score_threshold=0)
+
+    assert bot.process_cycle(debug_mode=False, cfg=cfg) == 1
+
+    assert [message["item"]["url"] for message in sent] == [good["url"]]
+    assert [url for _, url, _ in marks] == [good["url"]]
+
+
+def test_evaluate_item_returns_exception():
+    """Тест: evaluate_item возвращает исключение вместо того, чтобы бросить его."""
+    result = bot.evaluate_item({"title": None}, now=datetime.now(), score_rejected=False)
+
+    assert isinstance(result, AttributeError)
@@ -0,0 +1,101 @@
+"""
+Тесты для RateLimiter (фейковые часы и sleep, без реального ожидания).
+"""
+
+import pytest
+
+from rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Фейковое монотонное время: sleep сдвигает часы и запоминает паузы."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+        self.sleeps = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    """Создает фейковые часы."""
+    return FakeClock()
+
+
+def make_limiter(fake_clock, **kwargs) -> RateLimiter:
+    """Создает limiter на фейковых часах."""
+    return RateLimiter(clock=fake_clock.clock, sleep=fake_clock.sleep, **kwargs)
+
+
+def test_global_limit_delays_31st_acquire(fake_clock):
+    """Тест: 31-я отправка за секунду ждет до bucket[-30] + 1.0."""
+    limiter = make_limiter(fake_clock)
+
+    # 30 отправок в разные чаты с шагом 10 мс укладываются в лимит
+    for chat_id in range(30):
+        limiter.acquire(chat_id=chat_id)
+        fake_clock.now += 0.01
+    assert fake_clock.sleeps == []
+
+    expected_send_at = limiter.global_bucket[-30] + 1.0
+    limiter.acquire(chat_id=30)
+
+    assert fake_clock.sleeps == [pytest.approx(expected_send_at - 100.30)]
+    assert fake_clock.now == pytest.approx(expected_send_at)
+
+
+def test_per_chat_interval_enforced(fake_clock):
+    """Тест: повторная отправка в тот же чат ждет per_chat_interval."""
+    limiter = make_limiter(fake_clock, per_chat_interval=1.0)
+
+    limiter.acquire(chat_id=1, message_thread_id=10)
+    fake_clock.now += 0.25
+    limiter.acquire(chat_id=1, message_thread_id=10)
+
+    assert fake_clock.sleeps == [pytest.approx(0.75)]
+    assert limiter.per_chat[1] == pytest.approx(101.0)
+
+
+def test_threads_of_one_chat_share_interval(fake_clock):
+    """Тест: отправки в разные темы одного чата разнесены на per_chat_interval."""
+    limiter = make_limiter(fake_clock, per_chat_interval=1.0)
+
+    limiter.acquire(chat_id=1, message_thread_id=10)
+    limiter.acquire(chat_id=1, message_thread_id=20)
+    limiter.acquire(chat_id=1)
+
+    assert fake_clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+    assert fake_clock.now == pytest.approx(102.0)
+
+
+def test_different_chats_do_not_wait(fake_clock):
+    """Тест: отправки в разные чаты не ждут друг друга."""
+    limiter = make_limiter(fake_clock, per_chat_interval=1.0)
+
+    limiter.acquire(chat_id=1, message_thread_id=10)
+    limiter.acquire(chat_id=2, message_thread_id=10)
+    limiter.acquire(chat_id=3)
+
+    assert fake_clock.sleeps == []
+
+
+def test_stale_entries_are_purged(fake_clock):
+    """Тест: отметки старше секунды удаляются и не задерживают новые отправки."""
+    limiter = make_limiter(fake_clock, global_per_second=2, per_chat_interval=1.0)
+
+    limiter.acquire(chat_id=1, message_thread_id=10)
+    limiter.acquire(chat_id=2, message_thread_id=10)
+    assert len(limiter.global_bucket) == 2
+
+    fake_clock.now += 1.5
+    limiter.acquire(chat_id=1, message_thread_id=10)
+
+    # Обе старые отметки выброшены, осталась только новая отправка без ожидания
+    assert limiter.global_bucket == [pytest.approx(101.5)]
+    assert fake_clock.sleeps == []
@@ -2,7 +2,7 @@
 Минимальные unit-тесты для парсинга переменных окружения в run_scheduler.
 """
 
-from scripts.run_scheduler import parse_run_once
+from scripts.run_scheduler import Config, parse_run_once
 
 
 def test_parse_run_once_none():
@@ -38,3 +38,21 @@ def test_parse_run_once_zero():
 def test_parse_run_once_off():
     """Проверяет, что "off" возвращает False."""
     assert parse_run_once("off") is False
+
+
+def test_config_from_env(monkeypatch):
+    """Проверяет сборку Config из env и значения по умолчанию."""
+    monkeypatch.setenv("RUN_ONCE", " Yes ")
+    monkeypatch.setenv("CHAT_ID", "42")
+    monkeypatch.setenv("PUBLISH_MAX_ITEMS", "3")
+    monkeypatch.delenv("PUBLISH_DRY_RUN", raising=False)
+    monkeypatch.delenv("ENABLE_PUBLISH", raising=False)
+
+    cfg = Config.from_env()
+
+    assert cfg.run_once is True
+    assert cfg.run_once_raw == " Yes "
+    assert cfg.chat_id == 42
+    assert cfg.publish_max_items == 3
+    assert cfg.publish_dry_run is True
+    assert cfg.enable_publish is False
@@ -0,0 +1,48 @@
+"""
+Тесты для build_send_windows (разбиение сообщений цикла на окна отправки).
+"""
+
+from bot import build_send_windows
+
+
+def make_outgoing(*thread_ids):
+    """Создает сообщения для указанных тем; text нумерует сообщения по порядку."""
+    return [
+        {"message_thread_id": thread_id, "text": f"m{index}", "topic_key": "general"}
+        for index, thread_id in enumerate(thread_ids)
+    ]
+
+
+def texts(windows):
+    """Возвращает тексты сообщений по окнам."""
+    return [[message["text"] for message in window] for window in windows]
+
+
+def test_one_message_per_thread_per_window():
+    """Тест: в окне не больше одного сообщения на тему, порядок в теме сохраняется."""
+    outgoing = make_outgoing(10, 10, 20, 10, 30, 20)
+
+    windows = build_send_windows(outgoing)
+
+    assert texts(windows) == [["m0", "m2", "m4"], ["m1", "m5"], ["m3"]]
+    for window in windows:
+        thread_ids = [message["message_thread_id"] for message in window]
+        assert len(thread_ids) == len(set(thread_ids))
+
+
+def test_windows_capped_at_window_size():
+    """Тест: слой из многих тем делится на окна не больше window_size."""
+    outgoing = make_outgoing(*range(65))
+
+    windows = build_send_windows(outgoing)
+
+    assert [len(window) for window in windows] == [30, 30, 5]
+    assert [message for window in windows for message in window] == outgoing
+
+    small = build_send_windows(make_outgoing(1, 2, 3, 1), window_size=2)
+    assert texts(small) == [["m0", "m1"], ["m2"], ["m3"]]
+
+
+def test_empty_outgoing():
+    """Тест: без сообщений окон нет."""
+    assert build_send_windows([]) == []
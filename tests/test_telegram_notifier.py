@@ -0,0 +1,61 @@
+"""
+Тесты для TelegramNotifier.
+"""
+
+from src.geotherm_bot.adapters.telegram.notifier import TelegramNotifier, create_session
+
+
+class FakeResponse:
+    """Фейковый HTTP-ответ."""
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Фейковая HTTP-сессия, запоминающая вызовы post."""
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, json, timeout):
+        self.calls.append({"url": url, "json": json, "timeout": timeout})
+        return FakeResponse()
+
+
+def test_send_message_reuses_session():
+    """Тест: все отправки идут через одну сессию на предвычисленный URL."""
+    session = FakeSession()
+    notifier = TelegramNotifier(bot_token="TOKEN", session=session)
+
+    notifier.send_message(chat_id=1, text="first", message_thread_id=10)
+    assert notifier.send("1", 0, "second") is True
+
+    assert len(session.calls) == 2
+    assert all(
+        call["url"] == "https://api.telegram.org/botTOKEN/sendMessage" for call in session.calls
+    )
+    assert session.calls[0]["json"]["message_thread_id"] == 10
+    assert "message_thread_id" not in session.calls[1]["json"]
+
+
+def test_dry_run_does_not_post():
+    """Тест: в dry_run сессия не используется."""
+    session = FakeSession()
+    notifier = TelegramNotifier(bot_token="TOKEN", dry_run=True, session=session)
+
+    notifier.send_message(chat_id=1, text="text")
+
+    assert session.calls == []
+
+
+def test_session_retries_only_429():
+    """Тест: сессия повторяет POST только на 429, 5xx и обрыв чтения не повторяет."""
+    retry = create_session().get_adapter("https://api.telegram.org").max_retries
+
+    assert retry.status_forcelist == (429,)
+    assert retry.read == 0
+    assert retry.respect_retry_after_header
+    assert not retry.raise_on_status
+    assert not retry.is_retry("POST", 502)
+    assert retry.is_retry("POST", 429)
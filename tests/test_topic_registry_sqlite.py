@@ -113,7 +113,7 @@ def test_touch_last_post_sets_timestamp(registry):
 
     # Устанавливаем фиксированное время (UTC aware)
     fixed_dt = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
-    registry.touch_last_post(topic.id, fixed_dt)
+    assert registry.touch_last_post(topic.id, fixed_dt) == fixed_dt
 
     # Проверяем через get_topic
     retrieved = registry.get_topic(chat_id=1, message_thread_id=10)
@@ -128,6 +128,9 @@ def test_touch_last_post_sets_timestamp(registry):
     assert retrieved.last_post_at.minute == fixed_dt.minute
     assert retrieved.last_post_at.second == fixed_dt.second
 
+    # Для несуществующего топика ничего не обновляется
+    assert registry.touch_last_post(topic.id + 100, fixed_dt) is None
+
 
 def test_set_enabled_filters_list(registry):
     """Тест: set_enabled фильтрует список топиков."""